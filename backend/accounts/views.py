@@ -2,7 +2,7 @@ from rest_framework import viewsets, permissions, filters
 from .models import User
 from .serializers import UserSerializer
 from .permissions import IsAdminUserType
-from reports.models import ActivityLog
+from reports.activity import log_activity
 
 class UserViewSet(viewsets.ModelViewSet):
     queryset = User.objects.all()
@@ -33,15 +33,11 @@ class UserViewSet(viewsets.ModelViewSet):
         new_role = response.data.get("user_type")
 
         if old_role != new_role and request.user.user_type == "admin":
-            action_text = (
-                f"{request.user.username} (admin) updated "
-                f"{user_to_update.username}'s role to {new_role}"
-            )
-            ActivityLog.objects.create(
-                user=request.user,
+            log_activity(
+                request.user,
+                "role_changed",
+                target_user_id=user_to_update.id,
                 role=new_role,
-                report=None,
-                action=action_text
             )
 
         return response
@@ -0,0 +1,105 @@
+"""
+In-process request metrics in the Prometheus text format.
+
+RequestMetricsMiddleware (api.middleware) feeds the registry; it is exposed
+at /api/internal/metrics/. Each worker process keeps its own numbers, so
+every series carries a `pid` label; sum over it when aggregating.
+"""
+import os
+import re
+import threading
+from collections import defaultdict
+
+DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+QUERY_COUNT_BUCKETS = (1, 2, 3, 5, 10, 20, 50, 100)
+
+# name -> (type, help, buckets)
+METRICS = {
+    "lfms_http_requests_total": ("counter", "Requests handled, by view, method and status.", None),
+    "lfms_http_request_duration_seconds": ("histogram", "Wall time per request.", DURATION_BUCKETS),
+    "lfms_http_response_bytes_total": ("counter", "Response body bytes (streaming responses excluded).", None),
+    "lfms_http_slow_requests_total": ("counter", "Requests slower than SLOW_REQUEST_MS.", None),
+    "lfms_profiled_requests_total": ("counter", "Requests sampled for DB and render profiling.", None),
+    "lfms_db_queries_per_request": ("histogram", "SQL queries per profiled request.", QUERY_COUNT_BUCKETS),
+    "lfms_db_query_seconds": ("histogram", "Time spent in SQL per profiled request.", DURATION_BUCKETS),
+    "lfms_render_seconds": ("histogram", "Response rendering (serialization) time per profiled request.", DURATION_BUCKETS),
+}
+
+_WHITESPACE = re.compile(r"\s+")
+_IN_LIST = re.compile(r"\bIN \((?:%s|\?|[^()]*?)(?:, ?(?:%s|\?|[^()]*?))*\)", re.IGNORECASE)
+_LITERAL = re.compile(r"'(?:[^']|'')*'|\b\d+(?:\.\d+)?\b")
+
+
+def sql_fingerprint(sql):
+    """Normalize `sql` so queries that differ only in literals or IN-list length compare equal."""
+    sql = _WHITESPACE.sub(" ", sql).strip()
+    sql = _LITERAL.sub("?", sql)
+    return _IN_LIST.sub("IN (...)", sql)
+
+
+class Registry:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters = defaultdict(float)
+        self._histograms = {}
+        self._pid = str(os.getpid())
+
+    def inc(self, name, labels, value=1):
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            self._counters[key] += value
+
+    def observe(self, name, labels, value):
+        buckets = METRICS[name][2]
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            counts = self._histograms.get(key)
+            if counts is None:
+                # one count per bucket, then +Inf, then the running sum
+                counts = self._histograms[key] = [0] * (len(buckets) + 1) + [0.0]
+            for i, bound in enumerate(buckets):
+                if value <= bound:
+                    counts[i] += 1
+            counts[len(buckets)] += 1
+            counts[-1] += value
+
+    def reset(self):
+        with self._lock:
+            self._counters.clear()
+            self._histograms.clear()
+
+    def render(self):
+        with self._lock:
+            counters = dict(self._counters)
+            histograms = {key: list(counts) for key, counts in self._histograms.items()}
+
+        lines = []
+        for name, (kind, help_text, buckets) in METRICS.items():
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+            if kind == "counter":
+                for (metric, labels), value in sorted(counters.items()):
+                    if metric == name:
+                        lines.append(f"{name}{self._labels(labels)} {value:g}")
+                continue
+
+            for (metric, labels), counts in sorted(histograms.items()):
+                if metric != name:
+                    continue
+                for bound, count in zip(buckets, counts):
+                    lines.append(f"{name}_bucket{self._labels(labels, le=f'{bound:g}')} {count}")
+                lines.append(f"{name}_bucket{self._labels(labels, le='+Inf')} {counts[len(buckets)]}")
+                lines.append(f"{name}_sum{self._labels(labels)} {counts[-1]:.6f}")
+                lines.append(f"{name}_count{self._labels(labels)} {counts[len(buckets)]}")
+        return "\n".join(lines) + "\n"
+
+    def _labels(self, labels, **extra):
+        pairs = [("pid", self._pid), *labels, *extra.items()]
+        escaped = (
+            f'{key}="{str(value).replace(chr(92), chr(92) * 2).replace(chr(34), chr(92) + chr(34))}"'
+            for key, value in pairs
+        )
+        return "{" + ",".join(escaped) + "}"
+
+
+registry = Registry()
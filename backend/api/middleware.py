@@ -0,0 +1,176 @@
+"""
+Per-request latency, SQL and render profiling.
+
+RequestMetricsMiddleware times every request and counts it by view, method
+and status. A REQUEST_METRICS_SAMPLE_RATE share of requests is also profiled:
+their SQL (through a connection execute wrapper) and response rendering are
+timed as well. Requests slower than SLOW_REQUEST_MS are logged, with the most
+expensive SQL fingerprints when the request was profiled.
+
+The profile lives in a ContextVar, so queries run by sync views under ASGI
+(which asgiref moves to a worker thread with a copy of the context) are still
+attributed to the request that issued them.
+"""
+import logging
+import random
+import time
+from contextvars import ContextVar
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+
+from .metrics import registry, sql_fingerprint
+
+logger = logging.getLogger(__name__)
+
+_current_profile = ContextVar("request_profile", default=None)
+
+
+class RequestProfile:
+    def __init__(self):
+        self.queries = 0
+        self.db_time = 0.0
+        self.render_time = None
+        self._render_started = None
+        # raw SQL (params are separate) -> [count, seconds]
+        self._statements = {}
+
+    def add_query(self, sql, elapsed):
+        self.queries += 1
+        self.db_time += elapsed
+        stats = self._statements.get(sql)
+        if stats is None:
+            self._statements[sql] = [1, elapsed]
+        else:
+            stats[0] += 1
+            stats[1] += elapsed
+
+    def render_started(self):
+        self._render_started = time.perf_counter()
+
+    def render_finished(self, response):
+        if self._render_started is not None:
+            self.render_time = time.perf_counter() - self._render_started
+
+    def top_statements(self, limit=5):
+        """The `limit` most expensive statement fingerprints as (fingerprint, count, seconds)."""
+        grouped = {}
+        for sql, (count, elapsed) in self._statements.items():
+            stats = grouped.setdefault(sql_fingerprint(sql), [0, 0.0])
+            stats[0] += count
+            stats[1] += elapsed
+        ranked = sorted(grouped.items(), key=lambda item: item[1][1], reverse=True)
+        return [(fingerprint, count, elapsed) for fingerprint, (count, elapsed) in ranked[:limit]]
+
+
+def record_queries(execute, sql, params, many, context):
+    """Connection execute wrapper; only does work while a sampled request is active."""
+    profile = _current_profile.get()
+    if profile is None:
+        return execute(sql, params, many, context)
+    start = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        profile.add_query(sql, time.perf_counter() - start)
+
+
+def install_query_recorder(sender, connection, **kwargs):
+    """connection_created receiver (wired up in ApiConfig.ready)."""
+    if record_queries not in connection.execute_wrappers:
+        connection.execute_wrappers.append(record_queries)
+
+
+class RequestMetricsMiddleware:
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.is_async = iscoroutinefunction(get_response)
+        if self.is_async:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.is_async:
+            return self.__acall__(request)
+        if not settings.REQUEST_METRICS_ENABLED:
+            return self.get_response(request)
+
+        profile, token, start = self.start(request)
+        try:
+            response = self.get_response(request)
+        finally:
+            if token is not None:
+                _current_profile.reset(token)
+        self.finish(request, response, profile, start)
+        return response
+
+    async def __acall__(self, request):
+        if not settings.REQUEST_METRICS_ENABLED:
+            return await self.get_response(request)
+
+        profile, token, start = self.start(request)
+        try:
+            response = await self.get_response(request)
+        finally:
+            if token is not None:
+                _current_profile.reset(token)
+        self.finish(request, response, profile, start)
+        return response
+
+    def process_template_response(self, request, response):
+        # DRF responses render after the view returns; time that as serialization
+        profile = getattr(request, "_metrics_profile", None)
+        if profile is not None:
+            profile.render_started()
+            response.add_post_render_callback(profile.render_finished)
+        return response
+
+    def start(self, request):
+        profile = token = None
+        if random.random() < settings.REQUEST_METRICS_SAMPLE_RATE:
+            profile = RequestProfile()
+            token = _current_profile.set(profile)
+        request._metrics_profile = profile
+        return profile, token, time.perf_counter()
+
+    def finish(self, request, response, profile, start):
+        duration = time.perf_counter() - start
+        match = request.resolver_match
+        view = match.view_name if match is not None else "unmatched"
+        labels = {"view": view, "method": request.method}
+
+        registry.inc("lfms_http_requests_total", {**labels, "status": str(response.status_code)})
+        registry.observe("lfms_http_request_duration_seconds", labels, duration)
+        if not response.streaming:
+            registry.inc("lfms_http_response_bytes_total", labels, len(response.content))
+
+        if profile is not None:
+            registry.inc("lfms_profiled_requests_total", labels)
+            registry.observe("lfms_db_queries_per_request", labels, profile.queries)
+            registry.observe("lfms_db_query_seconds", labels, profile.db_time)
+            if profile.render_time is not None:
+                registry.observe("lfms_render_seconds", labels, profile.render_time)
+
+        if duration * 1000 >= settings.SLOW_REQUEST_MS:
+            registry.inc("lfms_http_slow_requests_total", labels)
+            self.log_slow(request, response, view, duration, profile)
+
+    def log_slow(self, request, response, view, duration, profile):
+        if profile is None:
+            logger.warning(
+                "Slow request %s %s (%s) -> %s in %.0f ms (not sampled, no SQL profile)",
+                request.method, request.path, view, response.status_code, duration * 1000,
+            )
+            return
+
+        statements = "".join(
+            f"\n  {elapsed * 1000:8.1f} ms  x{count:<4} {fingerprint}"
+            for fingerprint, count, elapsed in profile.top_statements()
+        )
+        logger.warning(
+            "Slow request %s %s (%s) -> %s in %.0f ms; %d queries, %.0f ms in SQL:%s",
+            request.method, request.path, view, response.status_code, duration * 1000,
+            profile.queries, profile.db_time * 1000, statements,
+        )
@@ -1,3 +1,87 @@
-from django.test import TestCase
+from django.core.cache import cache
+from django.test import AsyncClient, TestCase, override_settings
+from rest_framework.test import APIClient
 
-# Create your tests here.
+from accounts.models import User
+from reports.models import Report
+
+from .metrics import registry, sql_fingerprint
+
+
+class SqlFingerprintTests(TestCase):
+    def test_literals_and_in_lists_collapse(self):
+        a = sql_fingerprint('SELECT * FROM "t" WHERE "id" IN (%s, %s, %s)\n  AND "name" = \'x\' LIMIT 21')
+        b = sql_fingerprint('SELECT * FROM "t" WHERE "id" IN (%s) AND "name" = \'other\' LIMIT 5')
+        self.assertEqual(a, b)
+        self.assertEqual(a, 'SELECT * FROM "t" WHERE "id" IN (...) AND "name" = ? LIMIT ?')
+
+
+@override_settings(REQUEST_METRICS_SAMPLE_RATE=1.0, SLOW_REQUEST_MS=60_000, METRICS_TOKEN="scrape-me")
+class RequestMetricsTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username="owner", password="pass")
+        cls.staff = User.objects.create_user(username="staff", password="pass", is_staff=True)
+        Report.objects.create(reported_by=cls.user, type="lost", status="approved")
+
+    def setUp(self):
+        cache.clear()
+        registry.reset()
+        self.client = APIClient()
+
+    def scrape(self):
+        res = self.client.get("/api/internal/metrics/", HTTP_AUTHORIZATION="Bearer scrape-me")
+        self.assertEqual(res.status_code, 200)
+        self.assertTrue(res["Content-Type"].startswith("text/plain"))
+        return res.content.decode()
+
+    def test_records_latency_queries_render_and_size_per_view(self):
+        res = self.client.get("/api/reports/reports/")
+        self.assertEqual(res.status_code, 200)
+
+        body = self.scrape()
+        labels = r'pid="\d+",method="GET",view="report-list"'
+        self.assertRegex(body, rf'lfms_http_requests_total\{{pid="\d+",method="GET",status="200",view="report-list"\}} 1')
+        self.assertRegex(body, rf"lfms_http_request_duration_seconds_count\{{{labels}\}} 1")
+        self.assertRegex(body, rf"lfms_http_response_bytes_total\{{{labels}\}} {len(res.content)}")
+        for name in ("lfms_db_queries_per_request", "lfms_db_query_seconds", "lfms_render_seconds"):
+            self.assertRegex(body, rf"{name}_count\{{{labels}\}} 1")
+        # the wrapper actually timed the list's SQL
+        self.assertNotRegex(body, rf"lfms_db_query_seconds_sum\{{{labels}\}} 0\.000000")
+
+    def test_unsampled_requests_are_counted_without_profiles(self):
+        with self.settings(REQUEST_METRICS_SAMPLE_RATE=0):
+            self.client.get("/api/reports/reports/")
+        body = registry.render()
+        self.assertRegex(body, r'lfms_http_requests_total\{pid="\d+",method="GET",status="200",view="report-list"\} 1')
+        self.assertNotIn("lfms_db_query_seconds_count{", body)
+
+    def test_slow_requests_are_logged_with_sql_fingerprints(self):
+        with self.settings(SLOW_REQUEST_MS=0), self.assertLogs("api.middleware", "WARNING") as logs:
+            self.client.get("/api/reports/reports/")
+        message = logs.output[0]
+        self.assertIn("Slow request GET /api/reports/reports/ (report-list) -> 200", message)
+        self.assertIn('FROM "reports_report"', message)
+
+    def test_disabled_middleware_records_nothing(self):
+        with self.settings(REQUEST_METRICS_ENABLED=False):
+            self.client.get("/api/reports/reports/")
+        self.assertNotIn("report-list", registry.render())
+
+    def test_metrics_endpoint_requires_staff_or_token(self):
+        self.assertIn(self.client.get("/api/internal/metrics/").status_code, (401, 403))
+        res = self.client.get("/api/internal/metrics/", HTTP_AUTHORIZATION="Bearer wrong")
+        self.assertIn(res.status_code, (401, 403))
+
+        self.client.force_authenticate(self.user)
+        self.assertEqual(self.client.get("/api/internal/metrics/").status_code, 403)
+        self.client.force_authenticate(self.staff)
+        self.assertEqual(self.client.get("/api/internal/metrics/").status_code, 200)
+
+    async def test_async_requests_attribute_queries_to_the_request(self):
+        res = await AsyncClient().get("/api/reports/reports/")
+        self.assertEqual(res.status_code, 200)
+        self.assertRegex(
+            registry.render(),
+            r'lfms_db_queries_per_request_count\{pid="\d+",method="GET",view="report-list"\} 1',
+        )
@@ -1,5 +1,7 @@
 from django.urls import path, include
 
+from .views import metrics_view
+
 urlpatterns = [
     # Authentication (dj-rest-auth + registration)
     path('auth/', include('dj_rest_auth.urls')),
@@ -8,6 +10,9 @@ urlpatterns = [
     # App routes
     path('accounts/', include('accounts.urls')),
     path('reports/', include('reports.urls')),
+
+    # Prometheus scrape target (staff or METRICS_TOKEN)
+    path('internal/metrics/', metrics_view, name='internal-metrics'),
 ]
 
 
@@ -1,3 +1,27 @@
-from django.shortcuts import render
+import secrets
 
-# Create your views here.
+from django.conf import settings
+from django.http import HttpResponse
+from rest_framework import permissions
+from rest_framework.decorators import api_view, permission_classes
+
+from .metrics import registry
+
+
+class IsStaffOrMetricsToken(permissions.BasePermission):
+    """
+    Staff users, or scrapers sending `Authorization: Bearer <METRICS_TOKEN>`.
+    """
+
+    def has_permission(self, request, view):
+        if request.user and request.user.is_staff:
+            return True
+        token = settings.METRICS_TOKEN
+        header = request.headers.get("Authorization", "")
+        return bool(token) and secrets.compare_digest(header, f"Bearer {token}")
+
+
+@api_view(["GET"])
+@permission_classes([IsStaffOrMetricsToken])
+def metrics_view(request):
+    return HttpResponse(registry.render(), content_type="text/plain; version=0.0.4; charset=utf-8")
@@ -54,6 +54,7 @@ INSTALLED_APPS = [
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
+    'django.contrib.postgres',
 
     'rest_framework',
     'rest_framework.authtoken',
@@ -73,6 +74,7 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'api.middleware.RequestMetricsMiddleware',
     'corsheaders.middleware.CorsMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
@@ -117,6 +119,11 @@ REST_FRAMEWORK = {
         # "rest_framework.filters.SearchFilter",
         "rest_framework.filters.OrderingFilter",
     ],
+    # Same bytes as DRF's JSONRenderer, encoded by orjson (api.renderers)
+    "DEFAULT_RENDERER_CLASSES": [
+        "api.renderers.ORJSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ],
     "DEFAULT_PAGINATION_CLASS": "rest_framework.pagination.PageNumberPagination",
     "PAGE_SIZE": 4,
 }
@@ -139,10 +146,26 @@ CORS_ALLOW_CREDENTIALS = True
 
 WSGI_APPLICATION = 'backend.wsgi.application'
 
+# Served under ASGI so notifications/stream/ can hold connections open
+ASGI_APPLICATION = 'backend.asgi.application'
+
+# Pub/sub behind the notification stream; swap for a cross-process broker
+# when running more than one worker.
+NOTIFICATION_BROKER = os.getenv("NOTIFICATION_BROKER", "reports.events.InProcessBroker")
+
 
 # Database
 # https://docs.djangoproject.com/en/5.2/ref/settings/#databases
 
+# Connections to Neon are expensive (remote, TLS), so they are reused
+# through psycopg3's connection pool. The Procfile serves ASGI, where Django
+# runs each request's sync code in a fresh thread-sensitive context: per-thread
+# persistent connections (CONN_MAX_AGE) are never reused there and linger
+# until garbage collected. Without the pool (DB_POOL=false) connections are
+# therefore closed after each request; raise DB_CONN_MAX_AGE only when
+# serving through a threaded WSGI server. Django does not allow both.
+DB_POOL = os.getenv("DB_POOL", "true").lower() == "true"
+
 DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.postgresql',
@@ -151,12 +174,79 @@ DATABASES = {
         'PASSWORD': os.getenv("NEON_DB_PASSWORD"),
         'HOST': os.getenv("NEON_DB_HOST"),
         'PORT': '5432',
+        'CONN_MAX_AGE': 0 if DB_POOL else int(os.getenv("DB_CONN_MAX_AGE", "0")),
+        'CONN_HEALTH_CHECKS': True,
         'OPTIONS': {
             'sslmode': 'require',
         }
     }
 }
 
+if DB_POOL:
+    DATABASES['default']['OPTIONS']['pool'] = {
+        'min_size': int(os.getenv("DB_POOL_MIN_SIZE", "2")),
+        'max_size': int(os.getenv("DB_POOL_MAX_SIZE", "10")),
+        'timeout': float(os.getenv("DB_POOL_TIMEOUT", "10")),
+        'max_idle': float(os.getenv("DB_POOL_MAX_IDLE", "300")),
+    }
+
+# Open the pool's min_size connections when a worker boots (gunicorn.conf.py)
+DB_POOL_WARM = os.getenv("DB_POOL_WARM", "true").lower() == "true"
+
+
+# Local memory by default; point CACHE_BACKEND/CACHE_LOCATION at a shared
+# cache (Redis, Memcached) when running several workers so invalidations
+# reach all of them.
+CACHES = {
+    'default': {
+        'BACKEND': os.getenv("CACHE_BACKEND", "django.core.cache.backends.locmem.LocMemCache"),
+        'LOCATION': os.getenv("CACHE_LOCATION", "lfms"),
+    }
+}
+
+# Seconds a cached report list/detail response lives (reports.cache)
+REPORT_CACHE_TIMEOUT = int(os.getenv("REPORT_CACHE_TIMEOUT", "300"))
+
+# ActivityLog rows are buffered and bulk-inserted by reports.activity once
+# this many are queued or every FLUSH_INTERVAL seconds (0 writes on commit).
+ACTIVITY_LOG_BATCH_SIZE = int(os.getenv("ACTIVITY_LOG_BATCH_SIZE", "100"))
+ACTIVITY_LOG_FLUSH_INTERVAL = float(os.getenv("ACTIVITY_LOG_FLUSH_INTERVAL", "2"))
+
+# Match rescoring after a bulk moderation batch (reports.matching) runs on
+# this many background threads instead of the request; 0 rescores inline
+# once the transaction commits, which tests rely on.
+MATCH_WORKERS = int(os.getenv("MATCH_WORKERS", "1"))
+
+# activity_logs and reports_notification are partitioned by month on
+# created_at. `manage.py archive_partitions` (run it daily) pre-creates the
+# next PARTITION_MONTHS_AHEAD months and moves partitions older than the
+# table's retention to gzipped CSV files in PARTITION_ARCHIVE_DIR.
+PARTITION_RETENTION_MONTHS = {
+    "activity_logs": int(os.getenv("ACTIVITY_LOG_RETENTION_MONTHS", "12")),
+    "reports_notification": int(os.getenv("NOTIFICATION_RETENTION_MONTHS", "6")),
+}
+PARTITION_MONTHS_AHEAD = int(os.getenv("PARTITION_MONTHS_AHEAD", "3"))
+PARTITION_ARCHIVE_DIR = os.getenv("PARTITION_ARCHIVE_DIR", str(BASE_DIR / "archive"))
+
+# Time bucket of the /api/reports/stats/ series when the request doesn't pass
+# ?bucket= (day, week, month or year). Counts come from rollup tables the
+# database keeps current (reports.stats), so any bucket is cheap.
+REPORT_STATS_BUCKET = os.getenv("REPORT_STATS_BUCKET", "week")
+
+# List serializers with list_serializer_class = FastListSerializer render
+# through a compiled per-serializer plan (reports.fastpath) instead of DRF's
+# per-field dispatch; the output is identical. Switch off to compare.
+FAST_SERIALIZATION = os.getenv("FAST_SERIALIZATION", "true").lower() == "true"
+
+# api.middleware times every request per view; REQUEST_METRICS_SAMPLE_RATE of
+# them also get SQL and render timings. Requests slower than SLOW_REQUEST_MS
+# are logged with their top SQL fingerprints. Metrics are served at
+# /api/internal/metrics/ to staff or to `Authorization: Bearer <METRICS_TOKEN>`.
+REQUEST_METRICS_ENABLED = os.getenv("REQUEST_METRICS_ENABLED", "true").lower() == "true"
+REQUEST_METRICS_SAMPLE_RATE = float(os.getenv("REQUEST_METRICS_SAMPLE_RATE", "0.1"))
+SLOW_REQUEST_MS = int(os.getenv("SLOW_REQUEST_MS", "500"))
+METRICS_TOKEN = os.getenv("METRICS_TOKEN", "")
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
@@ -238,3 +328,17 @@ CLOUDINARY_STORAGE = {
 
 DEFAULT_FILE_STORAGE = "cloudinary_storage.storage.MediaCloudinaryStorage"
 
+MEDIA_URL = 'media/'
+MEDIA_ROOT = BASE_DIR / 'media'
+
+# Report photos are uploaded by a background worker pool, not in the request.
+# reports.uploads.LocalPhotoBackend stores them under MEDIA_ROOT instead.
+PHOTO_UPLOAD_BACKEND = os.getenv("PHOTO_UPLOAD_BACKEND", "reports.uploads.CloudinaryPhotoBackend")
+PHOTO_UPLOAD_WORKERS = int(os.getenv("PHOTO_UPLOAD_WORKERS", "4"))
+
+# Uploaded photos are stripped of metadata, capped and re-encoded (WEBP or
+# AVIF), with a thumbnail for report cards.
+PHOTO_FORMAT = os.getenv("PHOTO_FORMAT", "WEBP")
+PHOTO_MAX_DIMENSION = int(os.getenv("PHOTO_MAX_DIMENSION", "1600"))
+PHOTO_THUMBNAIL_DIMENSION = int(os.getenv("PHOTO_THUMBNAIL_DIMENSION", "400"))
+
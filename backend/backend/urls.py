@@ -14,6 +14,8 @@ Including another URLconf
     1. Import the include() function: from django.urls import include, path
     2. Add a URL to urlpatterns:  path('blog/', include('blog.urls'))
 """
+from django.conf import settings
+from django.conf.urls.static import static
 from django.contrib import admin
 from django.urls import path, include
 import api.urls
@@ -21,4 +23,4 @@ import api.urls
 urlpatterns = [
     path('admin/', admin.site.urls),
     path('api/', include(api.urls))
-]
+] + static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
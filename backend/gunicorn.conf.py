@@ -0,0 +1,25 @@
+# Picked up automatically by the Procfile's gunicorn command.
+
+
+def post_worker_init(worker):
+    """Fill each worker's DB pool before it takes traffic, when pooling is enabled."""
+    from django.conf import settings
+    from django.db import connections
+
+    if not settings.DB_POOL_WARM:
+        return
+
+    for conn in connections.all():
+        pool = getattr(conn, "pool", None)
+        if pool:
+            pool.open(wait=True, timeout=settings.DATABASES[conn.alias]["OPTIONS"]["pool"]["timeout"])
+            worker.log.info("Warmed %s connection pool (%d connections)", conn.alias, pool.get_stats()["pool_size"])
+
+
+def worker_exit(server, worker):
+    """Write any buffered activity log rows before the worker goes away."""
+    from reports.activity import writer
+
+    flushed = writer.flush()
+    if flushed:
+        worker.log.info("Flushed %d buffered activity log entries", flushed)
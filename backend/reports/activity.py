@@ -0,0 +1,123 @@
+"""
+Buffered ActivityLog writes.
+
+Views call log_activity(); once the request's transaction commits the event is
+appended to an in-process buffer, and a background thread writes the buffer
+with one bulk_create when it reaches settings.ACTIVITY_LOG_BATCH_SIZE rows or
+every settings.ACTIVITY_LOG_FLUSH_INTERVAL seconds. Whatever is left is
+flushed at interpreter exit (and by gunicorn's worker_exit hook). An interval
+of 0 writes each event on commit instead, which tests rely on.
+
+Rows only hold structured fields (actor, target user, report, item name);
+ActivityLog.render_action() builds the message when the feed is read.
+"""
+import atexit
+import logging
+import threading
+
+from django.conf import settings
+from django.db import IntegrityError, close_old_connections, transaction
+from django.utils import timezone
+
+from .models import ActivityLog, Report
+
+logger = logging.getLogger(__name__)
+
+
+class ActivityLogWriter:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._buffer = []
+        self._wakeup = threading.Event()
+        self._thread = None
+
+    @property
+    def pending(self):
+        with self._lock:
+            return len(self._buffer)
+
+    def add(self, entry):
+        if settings.ACTIVITY_LOG_FLUSH_INTERVAL <= 0:
+            self._write([entry])
+            return
+
+        with self._lock:
+            self._buffer.append(entry)
+            full = len(self._buffer) >= settings.ACTIVITY_LOG_BATCH_SIZE
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="activity-log-writer", daemon=True)
+                self._thread.start()
+        if full:
+            self._wakeup.set()
+
+    def flush(self):
+        """Write everything buffered so far. Returns the number of rows written."""
+        with self._lock:
+            entries, self._buffer = self._buffer, []
+        return self._write(entries) if entries else 0
+
+    def _write(self, entries):
+        # Audit rows must never take the caller (or the writer thread) down
+        try:
+            ActivityLog.objects.bulk_create(entries, batch_size=settings.ACTIVITY_LOG_BATCH_SIZE)
+            return len(entries)
+        except IntegrityError:
+            pass
+        except Exception:
+            logger.exception("Dropped %d activity log entries", len(entries))
+            return 0
+
+        # One bad row fails the whole batch, typically a report deleted between
+        # log_activity() and the flush. Keep those rows without the report
+        # (as its deletion would have left them) and write the rest one by one.
+        report_ids = {entry.report_id for entry in entries if entry.report_id is not None}
+        existing = set(Report.objects.filter(pk__in=report_ids).values_list("pk", flat=True))
+        written = 0
+        for entry in entries:
+            if entry.report_id not in existing:
+                entry.report = None
+            try:
+                with transaction.atomic():
+                    ActivityLog.objects.bulk_create([entry])
+                written += 1
+            except Exception:
+                logger.exception("Dropped activity log entry (%s by user %s)", entry.event_type, entry.user_id)
+        return written
+
+    def _run(self):
+        while True:
+            self._wakeup.wait(settings.ACTIVITY_LOG_FLUSH_INTERVAL)
+            self._wakeup.clear()
+            try:
+                self.flush()
+            finally:
+                close_old_connections()
+
+
+writer = ActivityLogWriter()
+atexit.register(writer.flush)
+
+
+def report_item_name(report):
+    """Name of the report's item, or "" if it has none."""
+    item = report.get_item()
+    return item.item_name if item else ""
+
+
+def log_activity(user, event_type, report=None, target_user_id=None, item_name="", role=None, report_owner_id=None):
+    """
+    Queue an ActivityLog row for the writer once the current transaction
+    commits. report_owner_id defaults to the report's owner; pass it for
+    events about a report that no longer exists.
+    """
+    entry = ActivityLog(
+        user=user,
+        role=role if role is not None else getattr(user, "user_type", None),
+        report=report,
+        report_owner_id=report.reported_by_id if report else report_owner_id,
+        event_type=event_type,
+        target_user_id=target_user_id,
+        item_name=item_name or "",
+        created_at=timezone.now(),
+    )
+    transaction.on_commit(lambda: writer.add(entry))
@@ -1,16 +1,11 @@
 from django.apps import AppConfig
-from django.db import connection
-import os
+
 
 class ReportsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'reports'
 
     def ready(self):
-        sql_path = os.path.join(os.path.dirname(__file__), "sql/trigger.sql")
-
-        if os.path.exists(sql_path):
-            with connection.cursor() as cursor:
-                with open(sql_path, "r") as f:
-                    sql = f.read()
-                    cursor.execute(sql)
+        # No database access here: ready() runs in every worker, command and
+        # test process. Procedures and triggers ship as migrations (0017).
+        from . import signals  # noqa: F401
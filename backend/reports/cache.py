@@ -0,0 +1,65 @@
+"""
+Versioned response cache for the public report feed and report details.
+
+ReportSerializer output does not depend on the viewer, so list/detail
+responses are cached per full URL under a global version that is bumped
+whenever a Report or its Item changes (see reports.signals and the
+explicit invalidate_report_cache() calls for queryset updates). Each entry
+carries an ETag so clients revalidating with If-None-Match get a 304.
+"""
+import hashlib
+import json
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import transaction
+from rest_framework import status
+from rest_framework.response import Response
+
+VERSION_KEY = "reports:cache-version"
+
+
+def _version():
+    version = cache.get(VERSION_KEY)
+    if version is None:
+        cache.add(VERSION_KEY, 1, timeout=None)
+        version = cache.get(VERSION_KEY, 1)
+    return version
+
+
+def invalidate_report_cache():
+    """Retire every cached report response once the current transaction commits."""
+    def bump():
+        try:
+            cache.incr(VERSION_KEY)
+        except ValueError:
+            cache.add(VERSION_KEY, 1, timeout=None)
+
+    transaction.on_commit(bump)
+
+
+def cached_response(request, build_response):
+    """
+    Serve `request` from the cache, building (and caching) it with
+    `build_response()` on a miss. Only 200 responses are cached.
+    """
+    url_hash = hashlib.md5(request.build_absolute_uri().encode()).hexdigest()
+    key = f"reports:response:{_version()}:{url_hash}"
+
+    entry = cache.get(key)
+    if entry is None:
+        response = build_response()
+        if response.status_code != status.HTTP_200_OK:
+            return response
+
+        body = json.dumps(response.data, cls=DjangoJSONEncoder, sort_keys=True)
+        entry = {"data": response.data, "etag": f'"{hashlib.md5(body.encode()).hexdigest()}"'}
+        cache.set(key, entry, settings.REPORT_CACHE_TIMEOUT)
+
+    # no-cache: browsers keep the body but revalidate with If-None-Match
+    headers = {"ETag": entry["etag"], "Cache-Control": "no-cache"}
+    if entry["etag"] in request.headers.get("If-None-Match", ""):
+        return Response(status=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    return Response(entry["data"], headers=headers)
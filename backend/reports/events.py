@@ -0,0 +1,119 @@
+"""
+Pub/sub used to push notification events to connected clients.
+
+The default InProcessBroker only reaches subscribers living in the same
+process (one ASGI worker). Point settings.NOTIFICATION_BROKER at another class
+exposing subscribe/unsubscribe/publish to fan out across workers.
+"""
+import asyncio
+import logging
+import threading
+from collections import defaultdict
+
+from django.conf import settings
+from django.db import transaction
+from django.utils.module_loading import import_string
+
+logger = logging.getLogger(__name__)
+
+
+class InProcessBroker:
+    """Fans events out to asyncio queues of subscribers in this process."""
+
+    queue_size = 100
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._subscribers = defaultdict(set)
+
+    def subscribe(self, user_id):
+        """Register the running event loop for `user_id`'s events and return its queue."""
+        queue = asyncio.Queue(maxsize=self.queue_size)
+        subscriber = (asyncio.get_running_loop(), queue)
+        with self._lock:
+            self._subscribers[str(user_id)].add(subscriber)
+        return queue
+
+    def unsubscribe(self, user_id, queue):
+        with self._lock:
+            subscribers = self._subscribers.get(str(user_id), set())
+            subscribers.difference_update({s for s in subscribers if s[1] is queue})
+            if not subscribers:
+                self._subscribers.pop(str(user_id), None)
+
+    def publish(self, user_id, event):
+        """Deliver `event` to every subscriber of `user_id`. Safe to call from any thread."""
+        with self._lock:
+            subscribers = list(self._subscribers.get(str(user_id), ()))
+
+        for loop, queue in subscribers:
+            try:
+                loop.call_soon_threadsafe(_offer, queue, event)
+            except RuntimeError:
+                # Loop already closed; the stream's cleanup will unsubscribe it
+                pass
+
+
+def _offer(queue, event):
+    try:
+        queue.put_nowait(event)
+    except asyncio.QueueFull:
+        logger.warning("Dropping notification event for a slow stream subscriber")
+
+
+_broker = None
+_broker_lock = threading.Lock()
+
+
+def get_broker():
+    global _broker
+    if _broker is None:
+        with _broker_lock:
+            if _broker is None:
+                path = getattr(settings, "NOTIFICATION_BROKER", "reports.events.InProcessBroker")
+                _broker = import_string(path)()
+    return _broker
+
+
+def unread_count_for(user_id):
+    from .models import NotificationCounter
+
+    unread = NotificationCounter.objects.filter(user_id=user_id).values_list("unread", flat=True).first()
+    return unread or 0
+
+
+def notification_event(notification):
+    return {
+        "type": "notification",
+        "data": {
+            "id": notification.id,
+            "message": notification.message,
+            "detailed_message": notification.detailed_message,
+            "related_report": notification.related_report_id,
+            "triggered_by": str(notification.triggered_by_id) if notification.triggered_by_id else None,
+            "is_read": notification.is_read,
+            "created_at": notification.created_at.isoformat(),
+        },
+    }
+
+
+def publish_unread_count(user_id):
+    get_broker().publish(user_id, {
+        "type": "unread_count",
+        "data": {"unread_count": unread_count_for(user_id)},
+    })
+
+
+def publish_notifications(notifications):
+    """Push new notifications and the owners' unread counts once the transaction commits."""
+    notifications = list(notifications)
+
+    def send():
+        broker = get_broker()
+        for notification in notifications:
+            broker.publish(notification.user_id, notification_event(notification))
+        for user_id in {n.user_id for n in notifications}:
+            publish_unread_count(user_id)
+
+    if notifications:
+        transaction.on_commit(send)
@@ -0,0 +1,151 @@
+"""
+Fast read-only serialization for hot list endpoints.
+
+DRF spends most of a list response dispatching per field: building
+_readable_fields, Field.get_attribute() with its error handling, and
+to_representation() for values that are already JSON-ready. compile_plan()
+walks a configured serializer once per response and turns it into a flat
+list of (key, getter, converter) steps: plain attribute getters, and
+converters only where DRF would actually change the value. Nested
+serializers are compiled recursively, while method fields and unfamiliar
+field types keep calling their own code. Anything unexpected while reading a
+value (a missing relation, a default) defers to DRF's Field.get_attribute(),
+so the output is the same dict DRF would build.
+
+Serializers opt in with `list_serializer_class = FastListSerializer`; with
+settings.FAST_SERIALIZATION off it behaves like a plain ListSerializer.
+Serializers that override to_representation() can still be compiled by
+moving the extra step into finish_representation(instance, data).
+"""
+from datetime import datetime
+from types import MethodType
+
+from django.conf import settings
+from django.db import models
+from rest_framework import fields as drf_fields
+from rest_framework import ISO_8601, serializers
+from rest_framework.fields import SkipField
+from rest_framework.relations import PKOnlyObject
+from rest_framework.settings import api_settings
+
+# Exact field types whose to_representation() is a builtin conversion (or the
+# identity) for the values the ORM hands back. Subclasses may differ.
+PASSTHROUGH_FIELDS = {
+    drf_fields.ReadOnlyField: None,
+    drf_fields.CharField: str,
+    drf_fields.EmailField: str,
+    drf_fields.URLField: str,
+    drf_fields.SlugField: str,
+    drf_fields.IntegerField: int,
+}
+
+
+def _identity(value):
+    return value
+
+
+def _attribute_getter(field):
+    """Reads field.source_attrs like rest_framework.fields.get_attribute() does for plain objects."""
+    attrs = field.source_attrs
+    if not attrs:
+        return _identity  # source="*"
+
+    def get(instance):
+        for attr in attrs:
+            instance = getattr(instance, attr)
+            if type(instance) is MethodType:
+                instance = instance()
+        return instance
+
+    return get
+
+
+def _datetime_converter(field):
+    """
+    DateTimeField.to_representation() with the timezone looked up once per
+    plan rather than per value; anything but an aware datetime rendered as
+    ISO 8601 goes through DRF.
+    """
+    output_format = getattr(field, "format", api_settings.DATETIME_FORMAT)
+    field_timezone = field.timezone if hasattr(field, "timezone") else field.default_timezone()
+    if output_format is None or output_format.lower() != ISO_8601 or field_timezone is None:
+        return field.to_representation
+
+    def convert(value):
+        if type(value) is not datetime or value.tzinfo is None:
+            return field.to_representation(value)
+        try:
+            value = value.astimezone(field_timezone).isoformat()
+        except OverflowError:
+            return field.to_representation(value)
+        if value.endswith("+00:00"):
+            value = value[:-6] + "Z"
+        return value
+
+    return convert
+
+
+def _drf_attribute(field, instance):
+    attribute = field.get_attribute(instance)
+    if isinstance(attribute, PKOnlyObject) and attribute.pk is None:
+        return None
+    return attribute
+
+
+def _overrides_to_representation(serializer):
+    return type(serializer).to_representation is not serializers.Serializer.to_representation
+
+
+def compile_plan(serializer):
+    """
+    A function instance -> dict equivalent to serializer.to_representation(),
+    or None when the serializer can't be compiled.
+    """
+    finish = getattr(serializer, "finish_representation", None)
+    if _overrides_to_representation(serializer) and finish is None:
+        return None
+
+    steps = []
+    for field in serializer._readable_fields:
+        if isinstance(field, serializers.SerializerMethodField):
+            get, convert = _identity, getattr(serializer, field.method_name)
+        elif type(field).get_attribute is not drf_fields.Field.get_attribute:
+            # Relations (PKOnlyObject), hidden fields and other custom lookups
+            get, convert = (lambda instance, field=field: _drf_attribute(field, instance)), field.to_representation
+        elif isinstance(field, serializers.Serializer):
+            get, convert = _attribute_getter(field), compile_plan(field) or field.to_representation
+        elif type(field) in PASSTHROUGH_FIELDS:
+            get, convert = _attribute_getter(field), PASSTHROUGH_FIELDS[type(field)] or _identity
+        elif type(field) is drf_fields.DateTimeField:
+            get, convert = _attribute_getter(field), _datetime_converter(field)
+        else:
+            get, convert = _attribute_getter(field), field.to_representation
+        steps.append((field.field_name, get, convert, field))
+
+    def represent(instance):
+        ret = {}
+        for key, get, convert, field in steps:
+            try:
+                value = get(instance)
+            except SkipField:
+                continue
+            except Exception:
+                # Missing relations, defaults, allow_null: DRF's rules decide
+                try:
+                    value = _drf_attribute(field, instance)
+                except SkipField:
+                    continue
+            ret[key] = None if value is None else convert(value)
+        return finish(instance, ret) if finish is not None else ret
+
+    return represent
+
+
+class FastListSerializer(serializers.ListSerializer):
+    def to_representation(self, data):
+        represent = compile_plan(self.child) if settings.FAST_SERIALIZATION else None
+        if represent is None:
+            return super().to_representation(data)
+
+        iterable = data.all() if isinstance(data, models.manager.BaseManager) else data
+        return [represent(item) for item in iterable]
@@ -0,0 +1,45 @@
+"""
+Sparse fieldsets for list endpoints.
+
+`?fields=id,type,status` keeps only those top-level keys of each result and
+`?expand=reported_by` asks for the fuller representation of a key where the
+serializer offers one (its `expandable` names). Viewsets using
+SparseFieldsetMixin pass both to the serializer context so serializers can
+drop or swap fields, and to get_queryset() so the query loads only the
+columns the response needs.
+"""
+from rest_framework.exceptions import ValidationError
+
+
+def _names(value):
+    return {name.strip() for name in value.split(",") if name.strip()} if value else set()
+
+
+class SparseFieldsetMixin:
+    """For ViewSets; applies to the `list` action only (details keep the full serializer)."""
+
+    def get_fieldset(self):
+        """(fields, expand) for the current request; fields is empty when not restricted."""
+        if hasattr(self, "_fieldset"):
+            return self._fieldset
+
+        fields, expand = set(), set()
+        if getattr(self, "action", None) == "list":
+            serializer_class = self.get_serializer_class()
+            fields = _names(self.request.query_params.get("fields"))
+            expand = _names(self.request.query_params.get("expand"))
+
+            unknown = fields - set(serializer_class.Meta.fields)
+            if unknown:
+                raise ValidationError({"error": f"Unknown fields: {', '.join(sorted(unknown))}."})
+            unknown = expand - set(serializer_class.expandable)
+            if unknown:
+                raise ValidationError({"error": f"Cannot expand: {', '.join(sorted(unknown))}."})
+
+        self._fieldset = fields, expand
+        return self._fieldset
+
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        context["fields"], context["expand"] = self.get_fieldset()
+        return context
@@ -0,0 +1,19 @@
+import django_filters
+
+from .models import ActivityLog
+
+
+class CharInFilter(django_filters.BaseInFilter, django_filters.CharFilter):
+    pass
+
+
+class ActivityLogFilter(django_filters.FilterSet):
+    """`?event_type=report_approved,report_rejected&created_after=...&created_before=...`"""
+
+    event_type = CharInFilter(field_name="event_type")
+    created_after = django_filters.IsoDateTimeFilter(field_name="created_at", lookup_expr="gte")
+    created_before = django_filters.IsoDateTimeFilter(field_name="created_at", lookup_expr="lt")
+
+    class Meta:
+        model = ActivityLog
+        fields = ["event_type", "created_after", "created_before"]
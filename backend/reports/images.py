@@ -0,0 +1,46 @@
+"""Processing applied to report photos before upload."""
+import io
+
+from django.conf import settings
+from PIL import Image, ImageOps, UnidentifiedImageError
+
+
+def process_photo(data):
+    """
+    Re-encode an uploaded photo for the web.
+
+    Applies the EXIF orientation, drops all metadata (EXIF/GPS), caps the
+    longest side at PHOTO_MAX_DIMENSION and re-encodes to PHOTO_FORMAT, plus a
+    PHOTO_THUMBNAIL_DIMENSION thumbnail for report cards. Returns
+    (full_bytes, thumbnail_bytes, extension), or None if `data` is not an
+    image Pillow can read, in which case it is uploaded untouched.
+    """
+    try:
+        image = Image.open(io.BytesIO(data))
+        image.load()
+    except (UnidentifiedImageError, OSError):
+        return None
+
+    # Bake the orientation into the pixels; nothing from the original
+    # metadata is passed to the encoder below.
+    image = ImageOps.exif_transpose(image)
+    if image.mode not in ("RGB", "RGBA"):
+        has_alpha = "A" in image.getbands() or "transparency" in image.info
+        image = image.convert("RGBA" if has_alpha else "RGB")
+
+    fmt = settings.PHOTO_FORMAT
+    full = _encode(_fit(image, settings.PHOTO_MAX_DIMENSION), fmt, quality=80)
+    thumbnail = _encode(_fit(image, settings.PHOTO_THUMBNAIL_DIMENSION), fmt, quality=70)
+    return full, thumbnail, fmt.lower()
+
+
+def _fit(image, max_side):
+    resized = image.copy()
+    resized.thumbnail((max_side, max_side), Image.Resampling.LANCZOS)
+    return resized
+
+
+def _encode(image, fmt, quality):
+    buffer = io.BytesIO()
+    image.save(buffer, format=fmt, quality=quality)
+    return buffer.getvalue()
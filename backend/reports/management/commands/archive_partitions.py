@@ -0,0 +1,107 @@
+import gzip
+import os
+import re
+from datetime import date
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.utils import timezone
+
+from reports.retention import add_months, retention_cutoff
+
+# Dropping a partition skips the unread-count triggers, so settle the counters first
+BEFORE_DROP_SQL = {
+    "reports_notification": """
+        UPDATE reports_notificationcounter c
+        SET unread = GREATEST(c.unread - d.n, 0)
+        FROM (SELECT user_id, COUNT(*) AS n FROM {partition} WHERE NOT is_read GROUP BY user_id) d
+        WHERE c.user_id = d.user_id
+    """,
+}
+
+
+class Command(BaseCommand):
+    help = (
+        "Create upcoming monthly partitions of activity_logs and reports_notification, "
+        "then archive partitions past their retention to gzipped CSV and drop them."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--table",
+            action="append",
+            choices=sorted(settings.PARTITION_RETENTION_MONTHS),
+            help="Only process this table (repeatable)",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="List the partitions that would be archived without touching them",
+        )
+
+    def handle(self, *args, **options):
+        tables = options["table"] or sorted(settings.PARTITION_RETENTION_MONTHS)
+        this_month = timezone.now().date().replace(day=1)
+
+        for table in tables:
+            if not options["dry_run"]:
+                self.create_upcoming(table, this_month)
+
+            cutoff = retention_cutoff(table, this_month)
+            for partition, month in self.partitions(table):
+                if add_months(month, 1) > cutoff:
+                    continue
+                if options["dry_run"]:
+                    self.stdout.write(f"Would archive {partition}")
+                    continue
+                path = self.archive(table, partition)
+                self.stdout.write(self.style.SUCCESS(f"Archived {partition} to {path}"))
+
+    def create_upcoming(self, table, this_month):
+        with connection.cursor() as cursor:
+            for ahead in range(settings.PARTITION_MONTHS_AHEAD + 1):
+                cursor.execute("SELECT ensure_month_partition(%s, %s)", [table, add_months(this_month, ahead)])
+
+    def partitions(self, table):
+        """Monthly partitions of `table` as (name, first day of month), oldest first."""
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT c.relname FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid "
+                "WHERE i.inhparent = %s::regclass",
+                [table],
+            )
+            names = [row[0] for row in cursor.fetchall()]
+        if not names:
+            raise CommandError(f"{table} is not partitioned; run migrations first.")
+
+        pattern = re.compile(rf"^{re.escape(table)}_p(\d{{4}})_(\d{{2}})$")
+        found = []
+        for name in names:
+            match = pattern.match(name)
+            if match:
+                found.append((name, date(int(match[1]), int(match[2]), 1)))
+        return sorted(found, key=lambda pair: pair[1])
+
+    def archive(self, table, partition):
+        os.makedirs(settings.PARTITION_ARCHIVE_DIR, exist_ok=True)
+        path = os.path.join(settings.PARTITION_ARCHIVE_DIR, f"{partition}.csv.gz")
+        partial = f"{path}.partial"
+
+        with transaction.atomic(), connection.cursor() as cursor:
+            # DDL refuses to run while deferred FK checks are queued
+            cursor.execute("SET CONSTRAINTS ALL IMMEDIATE")
+            # Detach first so nothing new lands in the partition while it's copied
+            cursor.execute(f'ALTER TABLE "{table}" DETACH PARTITION "{partition}"')
+
+            with gzip.open(partial, "wb") as archive:
+                with cursor.cursor.copy(f'COPY "{partition}" TO STDOUT WITH (FORMAT csv, HEADER)') as copy:
+                    for block in copy:
+                        archive.write(block)
+            os.replace(partial, path)
+
+            if table in BEFORE_DROP_SQL:
+                cursor.execute(BEFORE_DROP_SQL[table].format(partition=f'"{partition}"'))
+            cursor.execute(f'DROP TABLE "{partition}"')
+
+        return path
@@ -0,0 +1,230 @@
+import json
+import random
+import statistics
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext, override_settings
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from accounts.models import User
+from reports.models import ActivityLog, Claim, Notification, Report
+
+from .seed_benchmark import BENCH_PREFIX, CATEGORIES, NOUNS
+
+SEARCH_TERMS = sorted({noun for nouns in NOUNS.values() for noun in nouns} | {"blak umbrela", "leather walet"})
+
+# Regressions smaller than this are noise at millisecond latencies
+MIN_REGRESSION_MS = 2.0
+
+
+class Scenarios:
+    """Request builders: each returns (user, method, path, data, writes)."""
+
+    def __init__(self):
+        users = list(User.objects.filter(username__startswith=BENCH_PREFIX).order_by("username"))
+        self.admin = next((u for u in users if u.user_type == "admin"), None)
+        self.students = [u for u in users if u.user_type != "admin"]
+        if self.admin is None or not self.students:
+            raise CommandError("No seeded dataset found; run `manage.py seed_benchmark` first.")
+
+        users_by_id = {u.pk: u for u in users}
+        open_reports = Report.objects.filter(reported_by__in=self.students, status="approved")
+        self.found_reports = list(open_reports.filter(type="found").values_list("id", flat=True))
+        self.owned_reports = [
+            (report_id, users_by_id[owner_id])
+            for report_id, owner_id in open_reports.values_list("id", "reported_by_id")
+        ]
+
+    def reports_list(self, rng):
+        return None, "get", "/api/reports/reports/?status=approved", None, False
+
+    def reports_search(self, rng):
+        return None, "get", f"/api/reports/reports/?search={rng.choice(SEARCH_TERMS)}", None, False
+
+    def reports_category(self, rng):
+        report_type = rng.choice(["lost", "found"])
+        return None, "get", f"/api/reports/reports/?type={report_type}&category={rng.choice(CATEGORIES)}", None, False
+
+    def notifications(self, rng):
+        return rng.choice(self.students), "get", "/api/reports/notifications/", None, False
+
+    def unread_count(self, rng):
+        return rng.choice(self.students), "get", "/api/reports/notifications/unread-count/", None, False
+
+    def activity_logs(self, rng):
+        return self.admin, "get", "/api/reports/activity-logs/", None, False
+
+    def activity_logs_student(self, rng):
+        return rng.choice(self.students), "get", "/api/reports/activity-logs/", None, False
+
+    def claim(self, rng):
+        path = f"/api/reports/reports/{rng.choice(self.found_reports)}/claim_item/"
+        return rng.choice(self.students), "post", path, {"message": "That's mine"}, True
+
+    def resolve(self, rng):
+        report_id, owner = rng.choice(self.owned_reports)
+        claimant = rng.choice(self.students)
+        return owner, "post", f"/api/reports/reports/{report_id}/resolve/", {"claimant_id": str(claimant.pk)}, True
+
+
+SCENARIOS = [
+    "reports_list", "reports_search", "reports_category", "notifications",
+    "unread_count", "activity_logs", "activity_logs_student", "claim", "resolve",
+]
+
+
+class Command(BaseCommand):
+    help = (
+        "Drive the main API endpoints in-process at a fixed concurrency against the "
+        "seed_benchmark dataset and report p50/p95/p99 latency, throughput and "
+        "queries per request. Writes are rolled back so runs stay comparable. "
+        "--output saves a JSON baseline; --baseline compares against one and fails on regressions."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--concurrency", type=int, default=8, help="Concurrent clients")
+        parser.add_argument("--requests", type=int, default=200, help="Requests per endpoint")
+        parser.add_argument("--warmup", type=int, default=20, help="Untimed requests per endpoint before measuring")
+        parser.add_argument("--endpoint", action="append", choices=SCENARIOS, help="Only run this endpoint (repeatable)")
+        parser.add_argument("--seed", type=int, default=1)
+        parser.add_argument(
+            "--cold-cache", action="store_true", help="Disable the response cache so every request hits the database"
+        )
+        parser.add_argument("--output", help="Write results as JSON to this file")
+        parser.add_argument("--baseline", help="Compare against a JSON file written by --output")
+        parser.add_argument(
+            "--tolerance", type=float, default=0.25, help="Allowed p95 slowdown over the baseline (0.25 = 25%%)"
+        )
+
+    def handle(self, *args, **options):
+        scenarios = Scenarios()
+        names = options["endpoint"] or SCENARIOS
+
+        if options["cold_cache"]:
+            cache_settings = override_settings(CACHES={"default": {"BACKEND": "django.core.cache.backends.dummy.DummyCache"}})
+        else:
+            cache_settings = override_settings()
+
+        results = {}
+        with cache_settings:
+            for name in names:
+                results[name] = self.run(scenarios, name, options)
+                self.print_row(name, results[name])
+
+        report = {
+            "generated_at": timezone.now().isoformat(),
+            "concurrency": options["concurrency"],
+            "requests": options["requests"],
+            "cold_cache": options["cold_cache"],
+            "dataset": {
+                "users": len(scenarios.students) + 1,
+                "reports": Report.objects.count(),
+                "claims": Claim.objects.count(),
+                "notifications": Notification.objects.count(),
+                "activity_logs": ActivityLog.objects.count(),
+            },
+            "endpoints": results,
+        }
+
+        if options["output"]:
+            with open(options["output"], "w") as f:
+                json.dump(report, f, indent=2)
+            self.stdout.write(self.style.SUCCESS(f"Wrote {options['output']}"))
+
+        if options["baseline"]:
+            self.compare(results, options["baseline"], options["tolerance"])
+
+    def run(self, scenarios, name, options):
+        build = getattr(scenarios, name)
+        concurrency = options["concurrency"]
+        total = options["requests"]
+        local = threading.local()
+
+        def one_request(index):
+            rng = random.Random(options["seed"] * 1_000_003 + index)
+            user, method, path, data, writes = build(rng)
+
+            clients = getattr(local, "clients", None)
+            if clients is None:
+                clients = local.clients = {}
+            client = clients.get(user)
+            if client is None:
+                client = clients[user] = APIClient(SERVER_NAME="localhost")
+                if user is not None:
+                    client.force_authenticate(user)
+
+            with CaptureQueriesContext(connection) as queries:
+                start = time.perf_counter()
+                if writes:
+                    # Roll back so the dataset (and later runs) stay unchanged
+                    with transaction.atomic():
+                        response = getattr(client, method)(path, data, format="json")
+                        transaction.set_rollback(True)
+                else:
+                    response = getattr(client, method)(path, data)
+                elapsed = (time.perf_counter() - start) * 1000
+
+            return elapsed, len(queries.captured_queries), response.status_code < 400
+
+        def worker(indexes):
+            try:
+                return [one_request(i) for i in indexes]
+            finally:
+                connection.close()
+
+        # Fill caches, connections and the query planner's stats before timing
+        for index in range(options["warmup"]):
+            one_request(total + index)
+
+        batches = [range(i, total, concurrency) for i in range(concurrency)]
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            samples = [sample for batch in executor.map(worker, batches) for sample in batch]
+        wall = time.perf_counter() - started
+
+        timings = [s[0] for s in samples]
+        cuts = statistics.quantiles(timings, n=100) if len(timings) > 1 else timings * 99
+        return {
+            "p50_ms": round(cuts[49], 2),
+            "p95_ms": round(cuts[94], 2),
+            "p99_ms": round(cuts[98], 2),
+            "mean_ms": round(statistics.fmean(timings), 2),
+            "throughput_rps": round(len(samples) / wall, 1),
+            "queries_per_request": round(statistics.fmean(s[1] for s in samples), 2),
+            "errors": sum(not s[2] for s in samples),
+        }
+
+    def print_row(self, name, result):
+        self.stdout.write(
+            f"{name:<22} p50 {result['p50_ms']:>8.2f}  p95 {result['p95_ms']:>8.2f}  "
+            f"p99 {result['p99_ms']:>8.2f} ms  {result['throughput_rps']:>7.1f} req/s  "
+            f"{result['queries_per_request']:>5.1f} q/req  {result['errors']} errors"
+        )
+
+    def compare(self, results, path, tolerance):
+        with open(path) as f:
+            baseline = json.load(f)["endpoints"]
+
+        regressions = []
+        for name, result in results.items():
+            before = baseline.get(name)
+            if before is None:
+                continue
+            allowed = max(before["p95_ms"] * (1 + tolerance), before["p95_ms"] + MIN_REGRESSION_MS)
+            if result["p95_ms"] > allowed:
+                regressions.append(f"{name}: p95 {before['p95_ms']} -> {result['p95_ms']} ms")
+            if result["queries_per_request"] > before["queries_per_request"]:
+                regressions.append(
+                    f"{name}: queries/request {before['queries_per_request']} -> {result['queries_per_request']}"
+                )
+            if result["errors"] > before["errors"]:
+                regressions.append(f"{name}: errors {before['errors']} -> {result['errors']}")
+
+        if regressions:
+            raise CommandError("Regressions against the baseline:\n  " + "\n  ".join(regressions))
+        self.stdout.write(self.style.SUCCESS(f"No regressions against {path}."))
@@ -0,0 +1,54 @@
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections, connection
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure per-request connection + query latency under concurrent load "
+        "with the current DATABASES settings. Run once per mode (e.g. the default "
+        "pool, DB_POOL=false, DB_POOL=false DB_CONN_MAX_AGE=60) to compare. Each "
+        "worker thread is long-lived like a threaded WSGI server's; under ASGI only "
+        "the pool reuses connections, so persistent-mode numbers don't carry over."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--threads", type=int, default=8, help="Concurrent workers")
+        parser.add_argument("--requests", type=int, default=50, help="Requests per worker")
+
+    def handle(self, *args, **options):
+        threads, per_thread = options["threads"], options["requests"]
+
+        def simulate_requests(_):
+            timings = []
+            for _ in range(per_thread):
+                start = time.perf_counter()
+                # Same connection lifecycle Django applies around each request
+                close_old_connections()
+                with connection.cursor() as cursor:
+                    cursor.execute("SELECT 1")
+                close_old_connections()
+                timings.append((time.perf_counter() - start) * 1000)
+            connection.close()
+            return timings
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=threads) as executor:
+            timings = [t for batch in executor.map(simulate_requests, range(threads)) for t in batch]
+        elapsed = time.perf_counter() - started
+
+        db = settings.DATABASES["default"]
+        if "pool" in db["OPTIONS"]:
+            mode = "pool ({min_size}-{max_size})".format(**db["OPTIONS"]["pool"])
+        else:
+            mode = f"CONN_MAX_AGE={db['CONN_MAX_AGE']}"
+
+        cuts = statistics.quantiles(timings, n=100)
+        self.stdout.write(f"mode:       {mode}")
+        self.stdout.write(f"requests:   {len(timings)} over {threads} threads")
+        self.stdout.write(f"p50/p95/p99 ms: {cuts[49]:.2f} / {cuts[94]:.2f} / {cuts[98]:.2f}")
+        self.stdout.write(f"throughput: {len(timings) / elapsed:.1f} req/s")
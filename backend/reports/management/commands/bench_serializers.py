@@ -0,0 +1,79 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db.models import Count
+from django.test.utils import override_settings
+from rest_framework.renderers import JSONRenderer
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from accounts.models import User
+from api.renderers import ORJSONRenderer
+from reports.views import ActivityLogViewSet, NotificationViewSet, ReportViewSet
+
+from .seed_benchmark import BENCH_PREFIX
+
+# name -> (viewset, path, who asks)
+ENDPOINTS = {
+    "reports": (ReportViewSet, "/api/reports/reports/?status=approved", "student"),
+    "notifications": (NotificationViewSet, "/api/reports/notifications/", "student"),
+    "activity_logs": (ActivityLogViewSet, "/api/reports/activity-logs/", "admin"),
+}
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare rows/second of DRF's serializers + JSONRenderer against the fast "
+        "path (reports.fastpath + ORJSONRenderer) on the list endpoints, using the "
+        "seed_benchmark dataset. Fails if the two produce different bytes."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=500, help="Rows serialized per pass")
+        parser.add_argument("--repeat", type=int, default=20, help="Timed passes per engine")
+        parser.add_argument("--endpoint", action="append", choices=sorted(ENDPOINTS), help="Only this endpoint (repeatable)")
+
+    def handle(self, *args, **options):
+        users = User.objects.filter(username__startswith=BENCH_PREFIX)
+        admin = users.filter(user_type="admin").first()
+        # The student with the most notifications gives the fullest pages
+        student = (
+            users.exclude(user_type="admin").annotate(n=Count("notification")).order_by("-n", "username").first()
+        )
+        if admin is None or student is None:
+            raise CommandError("No seeded dataset found; run `manage.py seed_benchmark` first.")
+
+        for name in options["endpoint"] or ENDPOINTS:
+            viewset, path, role = ENDPOINTS[name]
+            view = self.list_view(viewset, path, admin if role == "admin" else student)
+            rows = list(view.filter_queryset(view.get_queryset())[: options["rows"]])
+            if not rows:
+                self.stdout.write(f"{name:<14} no rows")
+                continue
+
+            drf_rate, drf_body = self.measure(view, rows, JSONRenderer(), fast=False, repeat=options["repeat"])
+            fast_rate, fast_body = self.measure(view, rows, ORJSONRenderer(), fast=True, repeat=options["repeat"])
+            if drf_body != fast_body:
+                raise CommandError(f"{name}: fast path output differs from DRF's")
+
+            self.stdout.write(
+                f"{name:<14} {len(rows):>5} rows  drf {drf_rate:>9.0f} rows/s  "
+                f"fast {fast_rate:>9.0f} rows/s  x{fast_rate / drf_rate:.1f}"
+            )
+
+    def list_view(self, viewset, path, user):
+        request = Request(APIRequestFactory().get(path))
+        request.user = user
+        view = viewset(action="list", request=request, format_kwarg=None, args=(), kwargs={})
+        view.headers = {}
+        return view
+
+    def measure(self, view, rows, renderer, fast, repeat):
+        """(rows per second, rendered bytes) for serializing and rendering `rows`."""
+        with override_settings(FAST_SERIALIZATION=fast):
+            body = renderer.render(view.get_serializer(rows, many=True).data)
+            start = time.perf_counter()
+            for _ in range(repeat):
+                renderer.render(view.get_serializer(rows, many=True).data)
+            elapsed = time.perf_counter() - start
+        return len(rows) * repeat / elapsed, body
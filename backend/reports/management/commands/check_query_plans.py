@@ -0,0 +1,134 @@
+import json
+import random
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.test.utils import override_settings
+from rest_framework.test import APIClient
+
+from api.metrics import sql_fingerprint
+
+from .bench_api import SCENARIOS, Scenarios
+
+
+# Plan as if every table were large: with these off, the planner reaches each
+# relation through an index whenever one can serve the query
+PLANNER_OFF = ("enable_seqscan", "enable_hashjoin", "enable_mergejoin")
+
+# Nodes that read all of their input before returning a row: a LIMIT above
+# them no longer stops the scans below early.
+BLOCKING_NODES = {"Sort", "Hash", "Aggregate", "Materialize", "SetOp", "WindowAgg"}
+
+
+def _full_scans(plan, limited=False):
+    node_type = plan["Node Type"]
+    if node_type == "Limit":
+        limited = True
+    elif node_type in BLOCKING_NODES:
+        limited = False
+
+    if node_type == "Seq Scan":
+        yield plan["Relation Name"]
+    elif node_type in ("Index Scan", "Index Only Scan") and "Index Cond" not in plan and not limited:
+        # Walking a whole index (e.g. the primary key) stands in for a Seq
+        # Scan once those are disabled, unless a LIMIT cuts it short
+        yield plan["Relation Name"]
+
+    for child in plan.get("Plans", ()):
+        # Inner sides and subplans run again per outer row: no early stop
+        inherited = limited and child.get("Parent Relationship") not in ("Inner", "SubPlan", "InitPlan")
+        yield from _full_scans(child, inherited)
+
+
+def _planned_full_scans(sql, params, settings_off):
+    with transaction.atomic(), connection.cursor() as cursor:
+        for setting in settings_off:
+            cursor.execute(f"SET LOCAL {setting} = off")
+        cursor.execute("EXPLAIN (FORMAT JSON) " + sql, params)
+        (plan,) = cursor.fetchone()
+        # Inside an outer transaction SET LOCAL outlives a released savepoint
+        transaction.set_rollback(True)
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return list(_full_scans(plan[0]["Plan"]))
+
+
+def sequential_scans(sql, params=()):
+    """
+    Relations `sql` would read in full even with sequential scans disabled,
+    i.e. the ones no index can serve for this query: Seq Scans, and index
+    scans without an index condition that aren't stopped early by a LIMIT.
+    """
+    scans = _planned_full_scans(sql, params, PLANNER_OFF)
+    if scans:
+        # Walking a whole index can simply be cheaper than a bitmap scan for
+        # an unselective filter. Without plain index scans, any relation that
+        # is still read in full has no index that can serve the query.
+        confirmed = _planned_full_scans(sql, params, PLANNER_OFF + ("enable_indexscan", "enable_indexonlyscan"))
+        scans = [relation for relation in scans if relation in confirmed]
+    return scans
+
+
+class Command(BaseCommand):
+    help = (
+        "EXPLAIN every SELECT the read-only bench_api endpoints issue against the "
+        "seed_benchmark dataset and fail if any plan needs a sequential scan. "
+        "Sequential scans are disabled while planning: on a small dataset they are "
+        "often the cheapest plan anyway, so a Seq Scan that remains means no index "
+        "can serve the query."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--samples", type=int, default=3, help="Requests per endpoint (scenarios vary their parameters)")
+        parser.add_argument("--endpoint", action="append", choices=SCENARIOS, help="Only check this endpoint (repeatable)")
+        parser.add_argument("--seed", type=int, default=1)
+
+    def handle(self, *args, **options):
+        scenarios = Scenarios()
+        failures = []
+
+        # Cached responses would skip the queries we want to see
+        with override_settings(CACHES={"default": {"BACKEND": "django.core.cache.backends.dummy.DummyCache"}}):
+            for name in options["endpoint"] or SCENARIOS:
+                build = getattr(scenarios, name)
+                scans, writes = {}, False
+                for index in range(options["samples"]):
+                    user, method, path, data, writes = build(random.Random(options["seed"] * 1_000_003 + index))
+                    if writes:
+                        break
+                    for sql, params in self.capture(user, path):
+                        for relation in sequential_scans(sql, params):
+                            scans.setdefault(relation, sql_fingerprint(sql))
+
+                if writes:
+                    self.stdout.write(f"{name:<22} skipped (writes)")
+                    continue
+                if not scans:
+                    self.stdout.write(f"{name:<22} ok")
+                    continue
+                self.stdout.write(self.style.ERROR(f"{name:<22} full scan of {', '.join(sorted(scans))}"))
+                for relation, fingerprint in sorted(scans.items()):
+                    self.stdout.write(f"    {relation}: {fingerprint[:300]}")
+                failures.append(name)
+
+        if failures:
+            raise CommandError(f"Full table scans in: {', '.join(failures)}")
+        self.stdout.write(self.style.SUCCESS("No full table scans."))
+
+    def capture(self, user, path):
+        """(sql, params) of every SELECT issued while serving GET `path` as `user`."""
+        captured = []
+
+        def record(execute, sql, params, many, context):
+            if sql.lstrip()[:6].upper() == "SELECT":
+                captured.append((sql, params))
+            return execute(sql, params, many, context)
+
+        client = APIClient(SERVER_NAME="localhost")
+        if user is not None:
+            client.force_authenticate(user)
+        with connection.execute_wrapper(record):
+            response = client.get(path)
+        if response.status_code >= 400:
+            raise CommandError(f"GET {path} returned {response.status_code}")
+        return captured
@@ -0,0 +1,18 @@
+from django.core.management.base import BaseCommand
+
+from reports.matching import reindex_all
+
+
+class Command(BaseCommand):
+    help = "Rebuild the lost/found match candidate index for all open reports."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--notify",
+            action="store_true",
+            help="Also notify owners of strong matches not notified before",
+        )
+
+    def handle(self, *args, **options):
+        count = reindex_all(notify=options["notify"])
+        self.stdout.write(self.style.SUCCESS(f"Re-indexed matches for {count} lost reports."))
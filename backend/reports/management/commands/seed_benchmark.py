@@ -0,0 +1,168 @@
+import random
+from datetime import timedelta
+
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.utils import timezone
+
+from accounts.models import User
+from reports.models import ActivityLog, Claim, Item, Notification, Report
+
+BENCH_PREFIX = "bench_"
+BENCH_PASSWORD = "bench-pass"
+
+CATEGORIES = ["Electronics", "Bags", "Wallets", "Keys", "Clothing", "Umbrellas", "Books", "IDs", "Others"]
+ADJECTIVES = ["black", "blue", "red", "small", "leather", "silver", "old", "new", "striped", "green"]
+NOUNS = {
+    "Electronics": ["phone", "charger", "earbuds", "calculator", "laptop", "power bank"],
+    "Bags": ["backpack", "tote bag", "sling bag", "lunch bag"],
+    "Wallets": ["wallet", "coin purse", "card holder"],
+    "Keys": ["house keys", "car key", "locker key"],
+    "Clothing": ["jacket", "hoodie", "cap", "scarf"],
+    "Umbrellas": ["umbrella", "folding umbrella"],
+    "Books": ["notebook", "textbook", "planner"],
+    "IDs": ["student ID", "library card"],
+    "Others": ["water bottle", "tumbler", "glasses", "watch"],
+}
+PLACES = ["Library", "Gym", "Cafeteria", "Main hall", "Parking lot", "Chapel", "Lab 3", "Canteen", "Registrar"]
+EVENT_TYPES = ["report_approved", "report_rejected", "claim_requested", "item_found"]
+
+
+class Command(BaseCommand):
+    help = (
+        "Seed a reproducible synthetic dataset (users, reports, items, claims, "
+        "notifications, activity logs) for bench_api. Seeded users are named "
+        f"'{BENCH_PREFIX}*' and share the password '{BENCH_PASSWORD}'."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--users", type=int, default=200)
+        parser.add_argument("--reports", type=int, default=5000)
+        parser.add_argument("--claims", type=int, default=2000)
+        parser.add_argument("--notifications", type=int, default=20000)
+        parser.add_argument("--logs", type=int, default=20000)
+        parser.add_argument("--months", type=int, default=6, help="Spread reports and logs over this many months")
+        parser.add_argument("--seed", type=int, default=42)
+        parser.add_argument("--clear", action="store_true", help="Only delete a previously seeded dataset")
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            if not options["clear"]:
+                # DDL first: it can't run once the deletes below queue FK checks
+                self.ensure_partitions(timezone.now(), options["months"])
+            deleted = self.clear()
+            if options["clear"]:
+                self.stdout.write(self.style.SUCCESS(f"Removed {deleted} seeded users and their data."))
+                return
+            counts = self.seed(random.Random(options["seed"]), options)
+
+        self.stdout.write(self.style.SUCCESS(
+            "Seeded " + ", ".join(f"{count} {name}" for name, count in counts.items()) + "."
+        ))
+
+    def clear(self):
+        users = User.objects.filter(username__startswith=BENCH_PREFIX)
+        count = users.count()
+        # Reports cascade to items, claims, comments and logs
+        Report.objects.filter(reported_by__in=users).delete()
+        users.delete()
+        return count
+
+    def seed(self, rng, options):
+        now = timezone.now()
+        span = timedelta(days=30 * options["months"])
+
+        def moment():
+            return now - span * rng.random()
+
+        password = make_password(BENCH_PASSWORD)
+        users = User.objects.bulk_create([
+            User(
+                username=f"{BENCH_PREFIX}{i}",
+                password=password,
+                first_name=f"Bench{i}",
+                last_name="User",
+                email=f"{BENCH_PREFIX}{i}@example.com",
+                user_type="admin" if i == 0 else "student",
+                is_staff=i == 0,
+            )
+            for i in range(options["users"])
+        ])
+        students = users[1:] or users
+
+        reports = Report.objects.bulk_create([
+            Report(
+                reported_by=rng.choice(students),
+                type=rng.choice(["lost", "found"]),
+                status=rng.choices(["approved", "pending", "rejected", "resolved"], [70, 15, 5, 10])[0],
+            )
+            for _ in range(options["reports"])
+        ], batch_size=1000)
+        # date_time is auto_now_add, so backdate it in a second pass
+        for report in reports:
+            report.date_time = moment()
+        Report.objects.bulk_update(reports, ["date_time"], batch_size=1000)
+
+        items = []
+        for report in reports:
+            category = rng.choice(CATEGORIES)
+            name = f"{rng.choice(ADJECTIVES).capitalize()} {rng.choice(NOUNS[category])}"
+            items.append(Item(
+                report=report,
+                item_name=name,
+                description=f"{name} last seen near the {rng.choice(PLACES).lower()}",
+                category=category,
+                location=rng.choice(PLACES),
+                date=report.date_time.date(),
+            ))
+        Item.objects.bulk_create(items, batch_size=1000)
+
+        found_reports = [r for r in reports if r.type == "found"] or reports
+        Claim.objects.bulk_create([
+            Claim(report=rng.choice(found_reports), claimed_by=rng.choice(students), message="I think this is mine")
+            for _ in range(options["claims"])
+        ], batch_size=1000)
+
+        Notification.objects.bulk_create([
+            Notification(
+                user=rng.choice(students),
+                triggered_by=rng.choice(students),
+                message="Someone wants to claim the found item.",
+                related_report=rng.choice(reports),
+                is_read=rng.random() < 0.6,
+            )
+            for _ in range(options["notifications"])
+        ], batch_size=1000)
+
+        logs = []
+        for _ in range(options["logs"]):
+            report = rng.choice(reports)
+            logs.append(ActivityLog(
+                user=users[0] if rng.random() < 0.5 else rng.choice(students),
+                role="student",
+                report=report,
+                report_owner_id=report.reported_by_id,
+                target_user_id=report.reported_by_id,
+                event_type=rng.choice(EVENT_TYPES),
+                item_name="Seeded item",
+                created_at=moment(),
+            ))
+        ActivityLog.objects.bulk_create(logs, batch_size=1000)
+
+        return {
+            "users": len(users),
+            "reports": len(reports),
+            "claims": options["claims"],
+            "notifications": options["notifications"],
+            "activity logs": len(logs),
+        }
+
+    def ensure_partitions(self, now, months):
+        """Create month partitions back to the oldest seeded timestamp instead of filling the default one."""
+        month = now.date().replace(day=1)
+        with connection.cursor() as cursor:
+            for _ in range(months + 2):
+                for table in ("activity_logs", "reports_notification"):
+                    cursor.execute("SELECT ensure_month_partition(%s, %s)", [table, month])
+                month = (month - timedelta(days=1)).replace(day=1)
@@ -0,0 +1,238 @@
+"""
+Automatic lost <-> found matching.
+
+Candidates for a report are only drawn from opposite-type open reports whose
+item shares terms with it (GIN-indexed search_vector) or has a similar name
+(pg_trgm index), so no pairwise scan happens. Each candidate is scored on
+category, name/description text, location and date proximity; scores are kept
+in MatchCandidate, and strong matches notify the lost item's owner once both
+reports are approved. Batches (bulk moderation) are rescored off the request
+by settings.MATCH_WORKERS background threads.
+"""
+import atexit
+import logging
+import re
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
+from django.conf import settings
+from django.contrib.postgres.search import SearchQuery, SearchRank, TrigramSimilarity
+from django.db import close_old_connections, transaction
+from django.db.models import F, FloatField, Q, Value
+
+from .events import publish_notifications
+from .models import Item, MatchCandidate, Notification, Report
+
+OPEN_STATUSES = ("pending", "approved")
+
+CANDIDATE_LIMIT = 50
+MAX_QUERY_TERMS = 32
+MIN_SCORE = 0.35
+NOTIFY_SCORE = 0.6
+DATE_WINDOW_DAYS = 30
+
+WEIGHTS = {"category": 0.25, "text": 0.4, "location": 0.15, "date": 0.2}
+
+logger = logging.getLogger(__name__)
+
+
+def _query_terms(item):
+    """
+    Every item_name word, then the description's most frequent other words
+    (longest first among equals), up to MAX_QUERY_TERMS.
+    """
+    words = list(dict.fromkeys(re.findall(r"\w+", item.item_name.lower())))[:MAX_QUERY_TERMS]
+    counts = Counter(
+        word for word in re.findall(r"\w+", item.description.lower()) if len(word) > 2 and word not in words
+    )
+    return words + sorted(counts, key=lambda word: (-counts[word], -len(word)))[: MAX_QUERY_TERMS - len(words)]
+
+
+def _terms_query(item):
+    """OR of the item's _query_terms(), for the GIN-indexed tsvector."""
+    words = _query_terms(item)
+    if not words:
+        return None
+    return SearchQuery(" | ".join(words), search_type="raw", config="english")
+
+
+def _date_score(lost_date, found_date):
+    if not lost_date or not found_date:
+        return 0.5
+    days = (found_date - lost_date).days
+    if days < -1:
+        # Found well before it was lost: not the same item
+        return 0.0
+    return 1 - min(abs(days), DATE_WINDOW_DAYS) / DATE_WINDOW_DAYS
+
+
+def score_candidates(report, item):
+    """Return [(counterpart_report_id, score)] for `report`, best first."""
+    other_type = "found" if report.type == "lost" else "lost"
+
+    query = _terms_query(item)
+    text_match = Q(item_name__trigram_similar=item.item_name)
+    if query is not None:
+        text_match |= Q(search_vector=query)
+
+    candidates = Item.objects.filter(text_match, report__type=other_type, report__status__in=OPEN_STATUSES).exclude(
+        report__reported_by_id=report.reported_by_id
+    )
+
+    own_date = item.date
+    if own_date:
+        window = timedelta(days=DATE_WINDOW_DAYS)
+        candidates = candidates.filter(Q(date__isnull=True) | Q(date__range=(own_date - window, own_date + window)))
+
+    candidates = candidates.annotate(
+        name_similarity=TrigramSimilarity("item_name", item.item_name),
+        location_similarity=TrigramSimilarity("location", item.location or ""),
+    )
+    if query is not None:
+        candidates = candidates.annotate(text_rank=SearchRank(F("search_vector"), query, normalization=32))
+    else:
+        candidates = candidates.annotate(text_rank=Value(0.0, output_field=FloatField()))
+
+    rows = candidates.order_by((F("name_similarity") + F("text_rank")).desc()).values(
+        "report_id", "category", "date", "name_similarity", "text_rank", "location_similarity"
+    )[:CANDIDATE_LIMIT]
+
+    scored = []
+    for row in rows:
+        if report.type == "lost":
+            date_score = _date_score(own_date, row["date"])
+        else:
+            date_score = _date_score(row["date"], own_date)
+
+        score = (
+            WEIGHTS["category"] * (row["category"].strip().lower() == item.category.strip().lower())
+            + WEIGHTS["text"] * (0.6 * row["name_similarity"] + 0.4 * row["text_rank"])
+            + WEIGHTS["location"] * row["location_similarity"]
+            + WEIGHTS["date"] * date_score
+        )
+        scored.append((row["report_id"], round(score, 4)))
+
+    return sorted(scored, key=lambda pair: pair[1], reverse=True)
+
+
+def match_report(report, notify=True):
+    """(Re)index `report`'s match candidates, then notify on new strong matches."""
+    item = report.get_item()
+    own_side = "lost_report" if report.type == "lost" else "found_report"
+    other_side = "found_report" if report.type == "lost" else "lost_report"
+
+    with transaction.atomic():
+        if report.status not in OPEN_STATUSES or item is None:
+            MatchCandidate.objects.filter(**{own_side: report}).delete()
+            return []
+
+        scored = [(other_id, score) for other_id, score in score_candidates(report, item) if score >= MIN_SCORE]
+
+        MatchCandidate.objects.filter(**{own_side: report}).exclude(
+            **{f"{other_side}_id__in": [other_id for other_id, _ in scored]}
+        ).delete()
+        MatchCandidate.objects.bulk_create(
+            [
+                MatchCandidate(**{f"{own_side}_id": report.id, f"{other_side}_id": other_id, "score": score})
+                for other_id, score in scored
+            ],
+            update_conflicts=True,
+            unique_fields=["lost_report", "found_report"],
+            update_fields=["score", "updated_at"],
+        )
+
+        if notify:
+            notify_strong_matches(MatchCandidate.objects.filter(**{own_side: report}))
+
+    return scored
+
+
+def rematch_reports(report_ids):
+    """match_report() each of `report_ids` that still exists."""
+    for report in Report.objects.filter(id__in=report_ids).select_related("item").order_by("id"):
+        try:
+            match_report(report)
+        except Exception:
+            logger.exception("Rematching report #%s failed", report.id)
+
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor():
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(max_workers=settings.MATCH_WORKERS, thread_name_prefix="rematch")
+                atexit.register(_executor.shutdown, wait=True)
+    return _executor
+
+
+def _run_in_worker(report_ids):
+    try:
+        rematch_reports(report_ids)
+    finally:
+        # Worker threads are long-lived; apply the same connection aging as requests
+        close_old_connections()
+
+
+def enqueue_rematch(report_ids):
+    """Rescore `report_ids` in the background once the current transaction commits."""
+    report_ids = list(report_ids)
+
+    def submit():
+        if settings.MATCH_WORKERS > 0:
+            _get_executor().submit(_run_in_worker, report_ids)
+        else:
+            rematch_reports(report_ids)
+
+    if report_ids:
+        transaction.on_commit(submit)
+
+
+def notify_strong_matches(candidates):
+    """Notify lost-item owners of strong, approved, not-yet-notified matches."""
+    strong = list(
+        candidates.filter(
+            score__gte=NOTIFY_SCORE,
+            notified=False,
+            lost_report__status="approved",
+            found_report__status="approved",
+        ).select_related("lost_report__item", "found_report__item")
+    )
+    if not strong:
+        return []
+
+    notifications = Notification.objects.bulk_create([
+        Notification(
+            user_id=match.lost_report.reported_by_id,
+            message=f"A found item may match your lost item \"{match.lost_report.item.item_name}\".",
+            detailed_message=(
+                f"\"{match.found_report.item.item_name}\" was found at "
+                f"{match.found_report.item.location} (match score {match.score:.0%})."
+            ),
+            related_report=match.found_report,
+        )
+        for match in strong
+    ])
+    MatchCandidate.objects.filter(id__in=[match.id for match in strong]).update(notified=True)
+    publish_notifications(notifications)
+    return notifications
+
+
+def reindex_all(notify=False, chunk_size=500):
+    """Rebuild the whole candidate index. Every pair has a lost side, so lost reports suffice."""
+    MatchCandidate.objects.exclude(
+        lost_report__status__in=OPEN_STATUSES, found_report__status__in=OPEN_STATUSES
+    ).delete()
+
+    reports = Report.objects.filter(type="lost", status__in=OPEN_STATUSES).select_related("item")
+    count = 0
+    for report in reports.iterator(chunk_size=chunk_size):
+        match_report(report, notify=notify)
+        count += 1
+    return count
@@ -0,0 +1,45 @@
+# Generated by Django 5.2.7 on 2026-10-17 17:58
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.contrib.postgres.operations import TrigramExtension
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reports', '0005_remove_activitylog_item_name_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.AddField(
+            model_name='founditem',
+            name='search_vector',
+            field=models.GeneratedField(db_persist=True, expression=django.contrib.postgres.search.CombinedSearchVector(django.contrib.postgres.search.SearchVector('item_name', config='english', weight='A'), '||', django.contrib.postgres.search.SearchVector('description', config='english', weight='B'), django.contrib.postgres.search.SearchConfig('english')), output_field=django.contrib.postgres.search.SearchVectorField()),
+        ),
+        migrations.AddField(
+            model_name='lostitem',
+            name='search_vector',
+            field=models.GeneratedField(db_persist=True, expression=django.contrib.postgres.search.CombinedSearchVector(django.contrib.postgres.search.SearchVector('item_name', config='english', weight='A'), '||', django.contrib.postgres.search.SearchVector('description', config='english', weight='B'), django.contrib.postgres.search.SearchConfig('english')), output_field=django.contrib.postgres.search.SearchVectorField()),
+        ),
+        migrations.AddIndex(
+            model_name='founditem',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='founditem_search_gin'),
+        ),
+        migrations.AddIndex(
+            model_name='founditem',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['item_name'], name='founditem_name_trgm', opclasses=['gin_trgm_ops']),
+        ),
+        migrations.AddIndex(
+            model_name='lostitem',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='lostitem_search_gin'),
+        ),
+        migrations.AddIndex(
+            model_name='lostitem',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['item_name'], name='lostitem_name_trgm', opclasses=['gin_trgm_ops']),
+        ),
+    ]
@@ -0,0 +1,92 @@
+# Generated by Django 5.2.7 on 2026-10-17 18:00
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+SYNC_UNREAD_COUNT_SQL = """
+CREATE OR REPLACE FUNCTION sync_notification_unread_count()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        INSERT INTO reports_notificationcounter (user_id, unread)
+        SELECT user_id, COUNT(*) FROM new_rows WHERE NOT is_read GROUP BY user_id
+        ON CONFLICT (user_id) DO UPDATE
+        SET unread = reports_notificationcounter.unread + EXCLUDED.unread;
+
+    ELSIF TG_OP = 'DELETE' THEN
+        UPDATE reports_notificationcounter c
+        SET unread = GREATEST(c.unread - d.n, 0)
+        FROM (
+            SELECT user_id, COUNT(*) AS n FROM old_rows WHERE NOT is_read GROUP BY user_id
+        ) d
+        WHERE c.user_id = d.user_id;
+
+    ELSE
+        -- is_read flips (and user reassignment) as +1/-1 deltas per user
+        INSERT INTO reports_notificationcounter (user_id, unread)
+        SELECT user_id, SUM(delta) FROM (
+            SELECT user_id, 1 AS delta FROM new_rows WHERE NOT is_read
+            UNION ALL
+            SELECT user_id, -1 AS delta FROM old_rows WHERE NOT is_read
+        ) changes
+        GROUP BY user_id
+        HAVING SUM(delta) <> 0
+        ON CONFLICT (user_id) DO UPDATE
+        SET unread = GREATEST(reports_notificationcounter.unread + EXCLUDED.unread, 0);
+    END IF;
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER trg_notification_unread_insert
+AFTER INSERT ON reports_notification
+REFERENCING NEW TABLE AS new_rows
+FOR EACH STATEMENT EXECUTE FUNCTION sync_notification_unread_count();
+
+CREATE TRIGGER trg_notification_unread_update
+AFTER UPDATE ON reports_notification
+REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+FOR EACH STATEMENT EXECUTE FUNCTION sync_notification_unread_count();
+
+CREATE TRIGGER trg_notification_unread_delete
+AFTER DELETE ON reports_notification
+REFERENCING OLD TABLE AS old_rows
+FOR EACH STATEMENT EXECUTE FUNCTION sync_notification_unread_count();
+
+INSERT INTO reports_notificationcounter (user_id, unread)
+SELECT user_id, COUNT(*) FROM reports_notification WHERE NOT is_read GROUP BY user_id;
+"""
+
+DROP_SYNC_UNREAD_COUNT_SQL = """
+DROP TRIGGER IF EXISTS trg_notification_unread_insert ON reports_notification;
+DROP TRIGGER IF EXISTS trg_notification_unread_update ON reports_notification;
+DROP TRIGGER IF EXISTS trg_notification_unread_delete ON reports_notification;
+DROP FUNCTION IF EXISTS sync_notification_unread_count();
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0002_alter_user_user_type'),
+        ('reports', '0006_item_search_vector'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='NotificationCounter',
+            fields=[
+                ('user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='notification_counter', serialize=False, to=settings.AUTH_USER_MODEL)),
+                ('unread', models.IntegerField(default=0)),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name='notification',
+            index=models.Index(condition=models.Q(('is_read', False)), fields=['user'], name='notification_unread_idx'),
+        ),
+        migrations.RunSQL(SYNC_UNREAD_COUNT_SQL, DROP_SYNC_UNREAD_COUNT_SQL),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 5.2.7 on 2026-10-17 18:04
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reports', '0007_notification_unread_counter'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='activitylog',
+            index=models.Index(fields=['-created_at', '-id'], name='activitylog_feed_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='notification',
+            index=models.Index(fields=['user', '-created_at', '-id'], name='notification_feed_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='report',
+            index=models.Index(fields=['-date_time', '-id'], name='report_feed_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='reportresolutionlog',
+            index=models.Index(fields=['-date_resolved', '-id'], name='resolutionlog_feed_idx'),
+        ),
+    ]
@@ -0,0 +1,30 @@
+# Generated by Django 5.2.7 on 2026-10-17 18:05
+
+from django.db import migrations, models
+
+
+def mark_existing_photos_uploaded(apps, schema_editor):
+    for model_name in ("LostItem", "FoundItem"):
+        model = apps.get_model("reports", model_name)
+        model.objects.exclude(photo_url__isnull=True).exclude(photo_url="").update(photo_status="uploaded")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reports', '0008_feed_keyset_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='founditem',
+            name='photo_status',
+            field=models.CharField(choices=[('none', 'No photo'), ('pending', 'Pending upload'), ('uploaded', 'Uploaded'), ('failed', 'Upload failed')], default='none', max_length=10),
+        ),
+        migrations.AddField(
+            model_name='lostitem',
+            name='photo_status',
+            field=models.CharField(choices=[('none', 'No photo'), ('pending', 'Pending upload'), ('uploaded', 'Uploaded'), ('failed', 'Upload failed')], default='none', max_length=10),
+        ),
+        migrations.RunPython(mark_existing_photos_uploaded, migrations.RunPython.noop),
+    ]
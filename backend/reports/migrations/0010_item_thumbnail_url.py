@@ -0,0 +1,23 @@
+# Generated by Django 5.2.7 on 2026-10-17 18:07
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reports', '0009_item_photo_status'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='founditem',
+            name='thumbnail_url',
+            field=models.URLField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='lostitem',
+            name='thumbnail_url',
+            field=models.URLField(blank=True, null=True),
+        ),
+    ]
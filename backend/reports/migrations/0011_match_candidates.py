@@ -0,0 +1,29 @@
+# Generated by Django 5.2.7 on 2026-10-17 18:08
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reports', '0010_item_thumbnail_url'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MatchCandidate',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('score', models.FloatField()),
+                ('notified', models.BooleanField(default=False)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('found_report', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='lost_matches', to='reports.report')),
+                ('lost_report', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='found_matches', to='reports.report')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['lost_report', '-score'], name='match_lost_score_idx'), models.Index(fields=['found_report', '-score'], name='match_found_score_idx')],
+                'constraints': [models.UniqueConstraint(fields=('lost_report', 'found_report'), name='unique_match_pair')],
+            },
+        ),
+    ]
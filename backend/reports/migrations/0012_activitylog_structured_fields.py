@@ -0,0 +1,42 @@
+# Generated by Django 5.2.7 on 2026-10-17 18:12
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reports', '0011_match_candidates'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='activitylog',
+            name='event_type',
+            field=models.CharField(blank=True, choices=[('report_approved', 'Report approved'), ('report_rejected', 'Report rejected'), ('claim_requested', 'Claim requested'), ('item_found', 'Item found'), ('role_changed', 'Role changed')], db_default='', default='', max_length=30),
+        ),
+        migrations.AddField(
+            model_name='activitylog',
+            name='item_name',
+            field=models.CharField(blank=True, db_default='', default='', max_length=255),
+        ),
+        migrations.AddField(
+            model_name='activitylog',
+            name='target_user',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AlterField(
+            model_name='activitylog',
+            name='action',
+            field=models.CharField(blank=True, default='', max_length=255),
+        ),
+        migrations.AlterField(
+            model_name='activitylog',
+            name='created_at',
+            field=models.DateTimeField(default=django.utils.timezone.now),
+        ),
+    ]
@@ -0,0 +1,70 @@
+# Generated by Django 5.2.7 on 2026-10-17 18:14
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+# Give rows written as preformatted text the structured fields the feed
+# filters on. Their `action` text is kept and still shown as-is. The new FK
+# is deferrable, so check it now: the CREATE INDEXes below refuse to run
+# with pending trigger events.
+BACKFILL_ACTIVITY_LOGS_SQL = """
+SET CONSTRAINTS ALL IMMEDIATE;
+
+UPDATE activity_logs a
+SET report_owner_id = r.reported_by_id
+FROM reports_report r
+WHERE a.report_id = r.id AND a.report_owner_id IS NULL;
+
+UPDATE activity_logs a
+SET item_name = i.item_name
+FROM reports_lostitem i
+WHERE a.report_id = i.report_id AND a.item_name = '';
+
+UPDATE activity_logs a
+SET item_name = i.item_name
+FROM reports_founditem i
+WHERE a.report_id = i.report_id AND a.item_name = '';
+
+UPDATE activity_logs
+SET event_type = CASE
+    WHEN action LIKE '% (admin) approved %' THEN 'report_approved'
+    WHEN action LIKE '% (admin) rejected %' THEN 'report_rejected'
+    WHEN action LIKE '% wants to claim %' THEN 'claim_requested'
+    WHEN action LIKE '% has found %' THEN 'item_found'
+    WHEN action LIKE '% (admin) updated %''s role to %' THEN 'role_changed'
+    ELSE ''
+END
+WHERE event_type = '';
+
+SET CONSTRAINTS ALL DEFERRED;
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reports', '0012_activitylog_structured_fields'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='activitylog',
+            name='report_owner',
+            field=models.ForeignKey(blank=True, db_index=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.RunSQL(BACKFILL_ACTIVITY_LOGS_SQL, migrations.RunSQL.noop),
+        migrations.AddIndex(
+            model_name='activitylog',
+            index=models.Index(fields=['event_type', '-created_at', '-id'], name='activitylog_type_feed_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='activitylog',
+            index=models.Index(fields=['user', '-created_at', '-id'], name='activitylog_user_feed_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='activitylog',
+            index=models.Index(fields=['report_owner', '-created_at', '-id'], name='activitylog_owner_feed_idx'),
+        ),
+    ]
@@ -0,0 +1,117 @@
+from django.db import migrations
+
+
+PARTITION_FUNCTIONS_SQL = """
+-- Attach the month partition of `parent` starting at `month_start`, moving any
+-- rows that already landed in the default partition for that month.
+CREATE OR REPLACE FUNCTION ensure_month_partition(parent text, month_start date)
+RETURNS text AS $$
+DECLARE
+    part text := format('%s_p%s', parent, to_char(month_start, 'YYYY_MM'));
+    lower_bound timestamptz := date_trunc('month', month_start)::timestamp AT TIME ZONE 'UTC';
+    upper_bound timestamptz := (date_trunc('month', month_start) + interval '1 month')::timestamp AT TIME ZONE 'UTC';
+BEGIN
+    IF to_regclass(part) IS NOT NULL THEN
+        RETURN part;
+    END IF;
+
+    EXECUTE format('CREATE TABLE %I (LIKE %I INCLUDING DEFAULTS)', part, parent);
+    EXECUTE format(
+        'WITH moved AS (DELETE FROM %I WHERE created_at >= $1 AND created_at < $2 RETURNING *) '
+        'INSERT INTO %I SELECT * FROM moved',
+        parent || '_default', part
+    ) USING lower_bound, upper_bound;
+    EXECUTE format(
+        'ALTER TABLE %I ATTACH PARTITION %I FOR VALUES FROM (%L) TO (%L)',
+        parent, part, lower_bound, upper_bound
+    );
+    RETURN part;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Rebuild `parent` as a table range-partitioned by month on created_at,
+-- keeping its rows, id sequence, indexes, foreign keys and triggers.
+CREATE OR REPLACE FUNCTION partition_by_month(parent text, months_ahead int)
+RETURNS void AS $$
+DECLARE
+    legacy text := parent || '_legacy';
+    index_defs text[];
+    constraint_defs text[];
+    trigger_defs text[];
+    def text;
+    first_month date;
+    month date;
+    next_id bigint;
+BEGIN
+    IF (SELECT relkind FROM pg_class WHERE oid = parent::regclass) = 'p' THEN
+        RETURN;
+    END IF;
+
+    SELECT coalesce(array_agg(pg_get_indexdef(indexrelid)), '{}') INTO index_defs
+    FROM pg_index WHERE indrelid = parent::regclass AND NOT indisprimary;
+
+    SELECT coalesce(array_agg(format('ALTER TABLE %I ADD CONSTRAINT %I %s', parent, conname, pg_get_constraintdef(oid))), '{}')
+    INTO constraint_defs
+    FROM pg_constraint WHERE conrelid = parent::regclass AND contype = 'f';
+
+    SELECT coalesce(array_agg(pg_get_triggerdef(oid)), '{}') INTO trigger_defs
+    FROM pg_trigger WHERE tgrelid = parent::regclass AND NOT tgisinternal;
+
+    EXECUTE format('ALTER TABLE %I RENAME TO %I', parent, legacy);
+    -- Column defaults too: SQL-side inserts (e.g. the resolution trigger) rely on them
+    EXECUTE format('CREATE TABLE %I (LIKE %I INCLUDING DEFAULTS) PARTITION BY RANGE (created_at)', parent, legacy);
+    EXECUTE format('CREATE TABLE %I PARTITION OF %I DEFAULT', parent || '_default', parent);
+
+    EXECUTE format('SELECT date_trunc(''month'', min(created_at) AT TIME ZONE ''UTC'')::date FROM %I', legacy)
+    INTO first_month;
+    month := coalesce(first_month, date_trunc('month', now() AT TIME ZONE 'UTC')::date);
+    WHILE month <= (date_trunc('month', now() AT TIME ZONE 'UTC') + make_interval(months => months_ahead))::date LOOP
+        PERFORM ensure_month_partition(parent, month);
+        month := (month + interval '1 month')::date;
+    END LOOP;
+
+    -- No triggers exist on the new table yet, so counters are left untouched
+    EXECUTE format('INSERT INTO %I SELECT * FROM %I', parent, legacy);
+    EXECUTE format('SELECT coalesce(max(id), 0) + 1 FROM %I', legacy) INTO next_id;
+    EXECUTE format('DROP TABLE %I', legacy);
+
+    -- Partitioned tables can't hold identity columns before PG 17; use an owned sequence
+    EXECUTE format('CREATE SEQUENCE %I OWNED BY %I.id', parent || '_id_seq', parent);
+    EXECUTE format('ALTER TABLE %I ALTER COLUMN id SET DEFAULT nextval(%L)', parent, parent || '_id_seq');
+    PERFORM setval(parent || '_id_seq', next_id, false);
+
+    -- The partition key has to be part of the primary key
+    EXECUTE format('ALTER TABLE %I ADD CONSTRAINT %I PRIMARY KEY (id, created_at)', parent, parent || '_pkey');
+
+    FOREACH def IN ARRAY index_defs || constraint_defs || trigger_defs LOOP
+        EXECUTE def;
+    END LOOP;
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+PARTITION_TABLES_SQL = """
+SET CONSTRAINTS ALL IMMEDIATE;
+SELECT partition_by_month('activity_logs', 3);
+SELECT partition_by_month('reports_notification', 3);
+SET CONSTRAINTS ALL DEFERRED;
+"""
+
+DROP_PARTITION_FUNCTIONS_SQL = """
+DROP FUNCTION IF EXISTS partition_by_month(text, int);
+DROP FUNCTION IF EXISTS ensure_month_partition(text, date);
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reports', '0013_activitylog_feed_filters'),
+    ]
+
+    operations = [
+        migrations.RunSQL(PARTITION_FUNCTIONS_SQL, DROP_PARTITION_FUNCTIONS_SQL),
+        # The partitioned tables keep working with the earlier schema, so
+        # unapplying only drops the helper functions.
+        migrations.RunSQL(PARTITION_TABLES_SQL, migrations.RunSQL.noop),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.7 on 2026-10-17 18:19
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reports', '0014_partition_logs_and_notifications'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='activitylog',
+            name='event_type',
+            field=models.CharField(blank=True, choices=[('report_approved', 'Report approved'), ('report_rejected', 'Report rejected'), ('report_deleted', 'Report deleted'), ('claim_requested', 'Claim requested'), ('item_found', 'Item found'), ('role_changed', 'Role changed')], db_default='', default='', max_length=30),
+        ),
+    ]
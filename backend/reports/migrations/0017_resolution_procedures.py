@@ -0,0 +1,164 @@
+# Generated by Django 5.2.7 on 2026-10-17 18:29
+
+from django.db import migrations, models
+
+
+# Previously applied by hand from "postgres queries.txt" (and re-run by
+# ReportsConfig.ready() on every boot when reports/sql/trigger.sql existed).
+# CREATE OR REPLACE keeps this safe on databases that already have them.
+RESOLVE_REPORT_SQL = """
+CREATE OR REPLACE PROCEDURE resolve_report_and_log(
+    p_report_id INTEGER,
+    p_owner_id UUID,
+    p_claimant_id UUID
+)
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    v_report_title TEXT;
+    v_owner_name TEXT;
+    v_claimant_name TEXT;
+BEGIN
+    -- Lock the report row
+    PERFORM 1 FROM reports_report WHERE id = p_report_id FOR UPDATE;
+
+    SELECT
+        CASE
+            WHEN r.type = 'lost' THEN li.item_name
+            WHEN r.type = 'found' THEN fi.item_name
+            ELSE 'Unknown Item'
+        END
+    INTO v_report_title
+    FROM reports_report r
+    LEFT JOIN reports_lostitem li ON li.report_id = r.id
+    LEFT JOIN reports_founditem fi ON fi.report_id = r.id
+    WHERE r.id = p_report_id;
+
+    IF v_report_title IS NULL THEN
+        RAISE EXCEPTION 'Report % not found or has no item name', p_report_id
+            USING ERRCODE = 'no_data_found';
+    END IF;
+
+    UPDATE reports_report
+    SET status = 'resolved'
+    WHERE id = p_report_id;
+
+    IF NOT FOUND THEN
+        RAISE EXCEPTION 'Report with id % not found', p_report_id
+            USING ERRCODE = 'no_data_found';
+    END IF;
+
+    SELECT CONCAT(first_name, ' ', last_name)
+    INTO v_owner_name
+    FROM accounts_user
+    WHERE id = p_owner_id;
+
+    SELECT CONCAT(first_name, ' ', last_name)
+    INTO v_claimant_name
+    FROM accounts_user
+    WHERE id = p_claimant_id;
+
+    IF NOT FOUND THEN
+        RAISE EXCEPTION 'Claimant % not found', p_claimant_id
+            USING ERRCODE = 'foreign_key_violation';
+    END IF;
+
+    INSERT INTO reports_reportresolutionlog (
+        report_id, resolved_by_id, claimed_by_id,
+        receiver_name, giver_name, report_title, date_resolved
+    )
+    VALUES (
+        p_report_id, p_owner_id, p_claimant_id,
+        v_owner_name, v_claimant_name, v_report_title, NOW()
+    );
+
+    -- No COMMIT here: the caller's transaction (Django atomic block) owns it
+END;
+$$;
+
+CREATE OR REPLACE FUNCTION get_unread_notification_count(p_user_id UUID)
+RETURNS INTEGER AS $$
+DECLARE
+    unread_count INTEGER;
+BEGIN
+    SELECT unread INTO unread_count
+    FROM reports_notificationcounter
+    WHERE user_id = p_user_id;
+
+    RETURN COALESCE(unread_count, 0);
+END;
+$$ LANGUAGE plpgsql;
+
+-- Superseded long ago; still present on databases set up from the old script
+DROP TRIGGER IF EXISTS trg_log_claim_activity ON reports_notification;
+DROP FUNCTION IF EXISTS log_claim_activity();
+
+-- Logs resolutions as structured rows; ActivityLog.render_action() builds the text
+CREATE OR REPLACE FUNCTION log_report_resolution()
+RETURNS TRIGGER AS $$
+BEGIN
+    INSERT INTO activity_logs (
+        user_id, role, report_id, report_owner_id, target_user_id,
+        event_type, item_name, action, created_at
+    )
+    SELECT
+        NEW.resolved_by_id,
+        u.user_type,
+        NEW.report_id,
+        r.reported_by_id,
+        NEW.claimed_by_id,
+        'report_resolved',
+        COALESCE(NEW.report_title, ''),
+        '',
+        NOW()
+    FROM accounts_user u
+    LEFT JOIN reports_report r ON r.id = NEW.report_id
+    WHERE u.id = NEW.resolved_by_id;
+
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_log_report_resolution ON reports_reportresolutionlog;
+CREATE TRIGGER trg_log_report_resolution
+AFTER INSERT ON reports_reportresolutionlog
+FOR EACH ROW
+EXECUTE FUNCTION log_report_resolution();
+"""
+
+DROP_RESOLVE_REPORT_SQL = """
+DROP TRIGGER IF EXISTS trg_log_report_resolution ON reports_reportresolutionlog;
+DROP FUNCTION IF EXISTS log_report_resolution();
+DROP FUNCTION IF EXISTS get_unread_notification_count(UUID);
+DROP PROCEDURE IF EXISTS resolve_report_and_log(INTEGER, UUID, UUID);
+"""
+
+# Rows the old trigger wrote carry only the "<giver> gave <item> to <receiver>" text
+BACKFILL_RESOLVED_EVENTS_SQL = """
+UPDATE activity_logs l
+SET event_type = 'report_resolved',
+    target_user_id = rl.claimed_by_id,
+    item_name = COALESCE(rl.report_title, '')
+FROM reports_reportresolutionlog rl
+WHERE l.event_type = ''
+  AND l.action LIKE '% gave % to %'
+  AND l.report_id = rl.report_id
+  AND l.user_id = rl.resolved_by_id;
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reports', '0015_activitylog_report_deleted_event'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='activitylog',
+            name='event_type',
+            field=models.CharField(blank=True, choices=[('report_approved', 'Report approved'), ('report_rejected', 'Report rejected'), ('report_deleted', 'Report deleted'), ('claim_requested', 'Claim requested'), ('item_found', 'Item found'), ('role_changed', 'Role changed'), ('report_resolved', 'Report resolved')], db_default='', default='', max_length=30),
+        ),
+        migrations.RunSQL(RESOLVE_REPORT_SQL, DROP_RESOLVE_REPORT_SQL),
+        migrations.RunSQL(BACKFILL_RESOLVED_EVENTS_SQL, migrations.RunSQL.noop),
+    ]
@@ -0,0 +1,46 @@
+# Generated by Django 5.2.7 on 2026-10-17 18:43
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reports', '0017_resolution_procedures'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='claim',
+            name='claimed_by',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='claims', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AlterField(
+            model_name='claim',
+            name='report',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, to='reports.report'),
+        ),
+        migrations.AddIndex(
+            model_name='claim',
+            index=models.Index(fields=['report', '-date_claimed'], name='claim_report_latest_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='claim',
+            index=models.Index(fields=['claimed_by', '-date_claimed'], name='claim_claimant_feed_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='founditem',
+            index=models.Index(fields=['category', 'report'], name='founditem_category_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='lostitem',
+            index=models.Index(fields=['category', 'report'], name='lostitem_category_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='report',
+            index=models.Index(fields=['type', 'status', '-date_time', '-id'], name='report_type_status_feed_idx'),
+        ),
+    ]
@@ -0,0 +1,168 @@
+# Generated by Django 5.2.7 on 2026-10-17 18:45
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+import django.db.models.deletion
+from django.conf import settings
+from importlib import import_module
+
+from django.db import migrations, models
+
+resolution_procedures = import_module("reports.migrations.0017_resolution_procedures")
+
+# Only the item matching the report's type was ever shown, so that's the one kept
+COPY_ITEMS_SQL = """
+INSERT INTO reports_item (
+    report_id, item_name, description, category, location, date,
+    supervised_by_id, photo_url, thumbnail_url, photo_status
+)
+SELECT li.report_id, li.item_name, li.description, li.category, li.location_last_seen, li.date_lost,
+       NULL, li.photo_url, li.thumbnail_url, li.photo_status
+FROM reports_lostitem li
+JOIN reports_report r ON r.id = li.report_id AND r.type = 'lost'
+UNION ALL
+SELECT fi.report_id, fi.item_name, fi.description, fi.category, fi.location_found, fi.date_found,
+       fi.supervised_by_id, fi.photo_url, fi.thumbnail_url, fi.photo_status
+FROM reports_founditem fi
+JOIN reports_report r ON r.id = fi.report_id AND r.type = 'found'
+ORDER BY 1;
+
+-- Run the FK checks now; index creation below can't follow pending trigger events
+SET CONSTRAINTS ALL IMMEDIATE;
+"""
+
+SPLIT_ITEMS_SQL = """
+INSERT INTO reports_lostitem (
+    report_id, item_name, description, category, location_last_seen, date_lost,
+    photo_url, thumbnail_url, photo_status
+)
+SELECT i.report_id, i.item_name, i.description, i.category, i.location, i.date,
+       i.photo_url, i.thumbnail_url, i.photo_status
+FROM reports_item i
+JOIN reports_report r ON r.id = i.report_id AND r.type = 'lost';
+
+INSERT INTO reports_founditem (
+    report_id, item_name, description, category, location_found, date_found,
+    supervised_by_id, photo_url, thumbnail_url, photo_status
+)
+SELECT i.report_id, i.item_name, i.description, i.category, i.location, i.date,
+       i.supervised_by_id, i.photo_url, i.thumbnail_url, i.photo_status
+FROM reports_item i
+JOIN reports_report r ON r.id = i.report_id AND r.type = 'found';
+
+SET CONSTRAINTS ALL IMMEDIATE;
+"""
+
+# Same procedure as 0017, reading the title from the single item table
+RESOLVE_REPORT_SQL = """
+CREATE OR REPLACE PROCEDURE resolve_report_and_log(
+    p_report_id INTEGER,
+    p_owner_id UUID,
+    p_claimant_id UUID
+)
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    v_report_title TEXT;
+    v_owner_name TEXT;
+    v_claimant_name TEXT;
+BEGIN
+    -- Lock the report row
+    PERFORM 1 FROM reports_report WHERE id = p_report_id FOR UPDATE;
+
+    SELECT i.item_name
+    INTO v_report_title
+    FROM reports_report r
+    LEFT JOIN reports_item i ON i.report_id = r.id
+    WHERE r.id = p_report_id;
+
+    IF v_report_title IS NULL THEN
+        RAISE EXCEPTION 'Report % not found or has no item name', p_report_id
+            USING ERRCODE = 'no_data_found';
+    END IF;
+
+    UPDATE reports_report
+    SET status = 'resolved'
+    WHERE id = p_report_id;
+
+    IF NOT FOUND THEN
+        RAISE EXCEPTION 'Report with id % not found', p_report_id
+            USING ERRCODE = 'no_data_found';
+    END IF;
+
+    SELECT CONCAT(first_name, ' ', last_name)
+    INTO v_owner_name
+    FROM accounts_user
+    WHERE id = p_owner_id;
+
+    SELECT CONCAT(first_name, ' ', last_name)
+    INTO v_claimant_name
+    FROM accounts_user
+    WHERE id = p_claimant_id;
+
+    IF NOT FOUND THEN
+        RAISE EXCEPTION 'Claimant % not found', p_claimant_id
+            USING ERRCODE = 'foreign_key_violation';
+    END IF;
+
+    INSERT INTO reports_reportresolutionlog (
+        report_id, resolved_by_id, claimed_by_id,
+        receiver_name, giver_name, report_title, date_resolved
+    )
+    VALUES (
+        p_report_id, p_owner_id, p_claimant_id,
+        v_owner_name, v_claimant_name, v_report_title, NOW()
+    );
+
+    -- No COMMIT here: the caller's transaction (Django atomic block) owns it
+END;
+$$;
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reports', '0018_query_pattern_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Item',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('item_name', models.CharField(max_length=100)),
+                ('description', models.TextField()),
+                ('category', models.CharField(max_length=100)),
+                ('location', models.CharField(max_length=255)),
+                ('date', models.DateField(blank=True, null=True)),
+                ('photo_url', models.URLField(blank=True, null=True)),
+                ('thumbnail_url', models.URLField(blank=True, null=True)),
+                ('photo_status', models.CharField(choices=[('none', 'No photo'), ('pending', 'Pending upload'), ('uploaded', 'Uploaded'), ('failed', 'Upload failed')], default='none', max_length=10)),
+                ('search_vector', models.GeneratedField(db_persist=True, expression=django.contrib.postgres.search.CombinedSearchVector(django.contrib.postgres.search.SearchVector('item_name', config='english', weight='A'), '||', django.contrib.postgres.search.SearchVector('description', config='english', weight='B'), django.contrib.postgres.search.SearchConfig('english')), output_field=django.contrib.postgres.search.SearchVectorField())),
+                ('report', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='item', to='reports.report')),
+                ('supervised_by', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to=settings.AUTH_USER_MODEL)),
+            ],
+        ),
+        migrations.RunSQL(COPY_ITEMS_SQL, SPLIT_ITEMS_SQL),
+        migrations.RunSQL(RESOLVE_REPORT_SQL, resolution_procedures.RESOLVE_REPORT_SQL),
+        migrations.AddIndex(
+            model_name='item',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='item_search_gin'),
+        ),
+        migrations.AddIndex(
+            model_name='item',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['item_name'], name='item_name_trgm', opclasses=['gin_trgm_ops']),
+        ),
+        migrations.AddIndex(
+            model_name='item',
+            index=models.Index(fields=['category', 'report'], name='item_category_idx'),
+        ),
+        migrations.DeleteModel(
+            name='FoundItem',
+        ),
+        migrations.DeleteModel(
+            name='LostItem',
+        ),
+    ]
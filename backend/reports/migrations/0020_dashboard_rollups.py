@@ -0,0 +1,231 @@
+# Generated by Django 5.2.7 on 2026-10-17 18:53
+
+from django.db import migrations, models
+
+
+# Every report counts once in reports_reportrollup, under its creation day,
+# type, item category and status. Status/type changes on reports_report and
+# category changes on reports_item move that count as -1/+1 deltas; a report
+# without an item (yet, or any more) counts under category ''. Whichever of a
+# report and its item is deleted first, the count ends up removed exactly once.
+SYNC_ROLLUPS_SQL = """
+CREATE OR REPLACE FUNCTION sync_report_rollup()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        INSERT INTO reports_reportrollup (day, type, category, status, reports)
+        SELECT (n.date_time AT TIME ZONE 'UTC')::date, n.type, COALESCE(i.category, ''), n.status, COUNT(*)
+        FROM new_rows n
+        LEFT JOIN reports_item i ON i.report_id = n.id
+        GROUP BY 1, 2, 3, 4
+        ON CONFLICT (day, type, category, status) DO UPDATE
+        SET reports = reports_reportrollup.reports + EXCLUDED.reports;
+
+    ELSIF TG_OP = 'DELETE' THEN
+        UPDATE reports_reportrollup r
+        SET reports = r.reports - d.n
+        FROM (
+            SELECT (o.date_time AT TIME ZONE 'UTC')::date AS day, o.type, COALESCE(i.category, '') AS category,
+                   o.status, COUNT(*) AS n
+            FROM old_rows o
+            LEFT JOIN reports_item i ON i.report_id = o.id
+            GROUP BY 1, 2, 3, 4
+        ) d
+        WHERE r.day = d.day AND r.type = d.type AND r.category = d.category AND r.status = d.status;
+
+    ELSE
+        INSERT INTO reports_reportrollup (day, type, category, status, reports)
+        SELECT (c.date_time AT TIME ZONE 'UTC')::date, c.type, COALESCE(i.category, ''), c.status, SUM(c.delta)
+        FROM (
+            SELECT id, date_time, type, status, 1 AS delta FROM new_rows
+            UNION ALL
+            SELECT id, date_time, type, status, -1 AS delta FROM old_rows
+        ) c
+        LEFT JOIN reports_item i ON i.report_id = c.id
+        GROUP BY 1, 2, 3, 4
+        HAVING SUM(c.delta) <> 0
+        ON CONFLICT (day, type, category, status) DO UPDATE
+        SET reports = reports_reportrollup.reports + EXCLUDED.reports;
+    END IF;
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION sync_item_rollup()
+RETURNS TRIGGER AS $$
+BEGIN
+    -- An item moves its report's count from '' to its category; deleting it
+    -- moves it back. Reports already deleted have nothing left to move.
+    IF TG_OP = 'INSERT' THEN
+        INSERT INTO reports_reportrollup (day, type, category, status, reports)
+        SELECT (r.date_time AT TIME ZONE 'UTC')::date, r.type, c.category, r.status, SUM(c.delta)
+        FROM (
+            SELECT report_id, category, 1 AS delta FROM new_rows
+            UNION ALL
+            SELECT report_id, '', -1 FROM new_rows
+        ) c
+        JOIN reports_report r ON r.id = c.report_id
+        GROUP BY 1, 2, 3, 4
+        HAVING SUM(c.delta) <> 0
+        ON CONFLICT (day, type, category, status) DO UPDATE
+        SET reports = reports_reportrollup.reports + EXCLUDED.reports;
+
+    ELSIF TG_OP = 'DELETE' THEN
+        INSERT INTO reports_reportrollup (day, type, category, status, reports)
+        SELECT (r.date_time AT TIME ZONE 'UTC')::date, r.type, c.category, r.status, SUM(c.delta)
+        FROM (
+            SELECT report_id, category, -1 AS delta FROM old_rows
+            UNION ALL
+            SELECT report_id, '', 1 FROM old_rows
+        ) c
+        JOIN reports_report r ON r.id = c.report_id
+        GROUP BY 1, 2, 3, 4
+        HAVING SUM(c.delta) <> 0
+        ON CONFLICT (day, type, category, status) DO UPDATE
+        SET reports = reports_reportrollup.reports + EXCLUDED.reports;
+
+    ELSE
+        -- Category edits (and report reassignment); other edits cancel out
+        INSERT INTO reports_reportrollup (day, type, category, status, reports)
+        SELECT (r.date_time AT TIME ZONE 'UTC')::date, r.type, c.category, r.status, SUM(c.delta)
+        FROM (
+            SELECT report_id, category, 1 AS delta FROM new_rows
+            UNION ALL
+            SELECT report_id, '', -1 FROM new_rows
+            UNION ALL
+            SELECT report_id, category, -1 FROM old_rows
+            UNION ALL
+            SELECT report_id, '', 1 FROM old_rows
+        ) c
+        JOIN reports_report r ON r.id = c.report_id
+        GROUP BY 1, 2, 3, 4
+        HAVING SUM(c.delta) <> 0
+        ON CONFLICT (day, type, category, status) DO UPDATE
+        SET reports = reports_reportrollup.reports + EXCLUDED.reports;
+    END IF;
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION sync_resolution_rollup()
+RETURNS TRIGGER AS $$
+BEGIN
+    INSERT INTO reports_resolutionrollup (day, type, category, resolutions, resolve_seconds)
+    SELECT (n.date_resolved AT TIME ZONE 'UTC')::date, r.type, COALESCE(i.category, ''), COUNT(*),
+           SUM(EXTRACT(EPOCH FROM n.date_resolved - r.date_time))
+    FROM new_rows n
+    JOIN reports_report r ON r.id = n.report_id
+    LEFT JOIN reports_item i ON i.report_id = n.report_id
+    GROUP BY 1, 2, 3
+    ON CONFLICT (day, type, category) DO UPDATE
+    SET resolutions = reports_resolutionrollup.resolutions + EXCLUDED.resolutions,
+        resolve_seconds = reports_resolutionrollup.resolve_seconds + EXCLUDED.resolve_seconds;
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER trg_report_rollup_insert
+AFTER INSERT ON reports_report
+REFERENCING NEW TABLE AS new_rows
+FOR EACH STATEMENT EXECUTE FUNCTION sync_report_rollup();
+
+CREATE TRIGGER trg_report_rollup_update
+AFTER UPDATE ON reports_report
+REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+FOR EACH STATEMENT EXECUTE FUNCTION sync_report_rollup();
+
+CREATE TRIGGER trg_report_rollup_delete
+AFTER DELETE ON reports_report
+REFERENCING OLD TABLE AS old_rows
+FOR EACH STATEMENT EXECUTE FUNCTION sync_report_rollup();
+
+CREATE TRIGGER trg_item_rollup_insert
+AFTER INSERT ON reports_item
+REFERENCING NEW TABLE AS new_rows
+FOR EACH STATEMENT EXECUTE FUNCTION sync_item_rollup();
+
+CREATE TRIGGER trg_item_rollup_update
+AFTER UPDATE ON reports_item
+REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+FOR EACH STATEMENT EXECUTE FUNCTION sync_item_rollup();
+
+CREATE TRIGGER trg_item_rollup_delete
+AFTER DELETE ON reports_item
+REFERENCING OLD TABLE AS old_rows
+FOR EACH STATEMENT EXECUTE FUNCTION sync_item_rollup();
+
+CREATE TRIGGER trg_resolution_rollup_insert
+AFTER INSERT ON reports_reportresolutionlog
+REFERENCING NEW TABLE AS new_rows
+FOR EACH STATEMENT EXECUTE FUNCTION sync_resolution_rollup();
+
+-- The triggers' locks hold off concurrent writes until this commits
+INSERT INTO reports_reportrollup (day, type, category, status, reports)
+SELECT (r.date_time AT TIME ZONE 'UTC')::date, r.type, COALESCE(i.category, ''), r.status, COUNT(*)
+FROM reports_report r
+LEFT JOIN reports_item i ON i.report_id = r.id
+GROUP BY 1, 2, 3, 4;
+
+INSERT INTO reports_resolutionrollup (day, type, category, resolutions, resolve_seconds)
+SELECT (l.date_resolved AT TIME ZONE 'UTC')::date, r.type, COALESCE(i.category, ''), COUNT(*),
+       SUM(EXTRACT(EPOCH FROM l.date_resolved - r.date_time))
+FROM reports_reportresolutionlog l
+JOIN reports_report r ON r.id = l.report_id
+LEFT JOIN reports_item i ON i.report_id = l.report_id
+GROUP BY 1, 2, 3;
+"""
+
+DROP_SYNC_ROLLUPS_SQL = """
+DROP TRIGGER IF EXISTS trg_report_rollup_insert ON reports_report;
+DROP TRIGGER IF EXISTS trg_report_rollup_update ON reports_report;
+DROP TRIGGER IF EXISTS trg_report_rollup_delete ON reports_report;
+DROP TRIGGER IF EXISTS trg_item_rollup_insert ON reports_item;
+DROP TRIGGER IF EXISTS trg_item_rollup_update ON reports_item;
+DROP TRIGGER IF EXISTS trg_item_rollup_delete ON reports_item;
+DROP TRIGGER IF EXISTS trg_resolution_rollup_insert ON reports_reportresolutionlog;
+DROP FUNCTION IF EXISTS sync_report_rollup();
+DROP FUNCTION IF EXISTS sync_item_rollup();
+DROP FUNCTION IF EXISTS sync_resolution_rollup();
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reports', '0019_unify_items'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ReportRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField()),
+                ('type', models.CharField(choices=[('lost', 'Lost'), ('found', 'Found')], max_length=10)),
+                ('category', models.CharField(max_length=100)),
+                ('status', models.CharField(choices=[('pending', 'Pending'), ('approved', 'Approved'), ('rejected', 'Rejected'), ('resolved', 'Resolved')], max_length=10)),
+                ('reports', models.IntegerField(default=0)),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('day', 'type', 'category', 'status'), name='report_rollup_key')],
+            },
+        ),
+        migrations.CreateModel(
+            name='ResolutionRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField()),
+                ('type', models.CharField(choices=[('lost', 'Lost'), ('found', 'Found')], max_length=10)),
+                ('category', models.CharField(max_length=100)),
+                ('resolutions', models.IntegerField(default=0)),
+                ('resolve_seconds', models.FloatField(default=0)),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('day', 'type', 'category'), name='resolution_rollup_key')],
+            },
+        ),
+        migrations.RunSQL(SYNC_ROLLUPS_SQL, DROP_SYNC_ROLLUPS_SQL),
+    ]
@@ -1,7 +1,56 @@
+import re
+
 from django.db import models
+from django.db.models import CharField, F, OuterRef, Q, Subquery
+from django.db.models.functions import Cast, JSONObject
 from django.conf import settings 
+from django.utils import timezone
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVector, SearchVectorField, TrigramSimilarity
 from accounts.models import User
 
+
+PHOTO_STATUS_CHOICES = [
+    ("none", "No photo"),
+    ("pending", "Pending upload"),
+    ("uploaded", "Uploaded"),
+    ("failed", "Upload failed"),
+]
+
+
+def item_search_vector():
+    """Weighted tsvector for an item: name ranks above description."""
+    return (
+        SearchVector("item_name", weight="A", config="english")
+        + SearchVector("description", weight="B", config="english")
+    )
+
+
+class ReportQuerySet(models.QuerySet):
+    def search(self, term):
+        """
+        Full-text search over the report's item, ranked by relevance: the
+        GIN-indexed tsvector, matching every word of `term` as a prefix so
+        partial words ("lap", "wall") still find "laptop" and "wallet", or
+        pg_trgm `%` similarity on item_name to tolerate typos. Both are
+        predicates on the one joined item row.
+        """
+        words = re.findall(r"\w+", term)
+        if not words:
+            return self.none()
+        # \w+ leaves nothing tsquery syntax would interpret; quoting keeps it a lexeme
+        query = SearchQuery(
+            " & ".join(f"'{word}':*" for word in words), config="english", search_type="raw"
+        )
+
+        return self.filter(
+            Q(item__search_vector=query) | Q(item__item_name__trigram_similar=term)
+        ).annotate(
+            search_rank=SearchRank(F("item__search_vector"), query),
+            search_similarity=TrigramSimilarity("item__item_name", term),
+        ).order_by("-search_rank", "-search_similarity", "-date_time")
+
+
 class Report(models.Model):
     REPORT_TYPE_CHOICES = [
         ("lost", "Lost"),
@@ -19,29 +68,58 @@ class Report(models.Model):
     date_time = models.DateTimeField(auto_now_add=True)
     status = models.CharField(max_length=10, choices=STATUS_CHOICES, default="pending")
 
+    objects = ReportQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            # Keyset pagination order for the report feed
+            models.Index(fields=["-date_time", "-id"], name="report_feed_idx"),
+            # The same order for feeds filtered by ?type=&status=
+            models.Index(fields=["type", "status", "-date_time", "-id"], name="report_type_status_feed_idx"),
+        ]
+
     def __str__(self):
         return f"{self.type.capitalize()} Report #{self.id}"
 
-
-class LostItem(models.Model):
-    report = models.OneToOneField(Report, on_delete=models.CASCADE, related_name="lost_item")
-    item_name = models.CharField(max_length=100)
-    description = models.TextField()
-    category = models.CharField(max_length=100)
-    location_last_seen = models.CharField(max_length=255)
-    photo_url = models.URLField(blank=True, null=True)
-    date_lost = models.DateField(blank=True, null=True)
+    def get_item(self):
+        """The report's item, or None if it has none."""
+        try:
+            return self.item
+        except Item.DoesNotExist:
+            return None
 
 
-class FoundItem(models.Model):
-    report = models.OneToOneField(Report, on_delete=models.CASCADE, related_name="found_item")
+class Item(models.Model):
+    """
+    The lost or found item of a report (Report.type says which). The API
+    still shows it as `lost_item`/`found_item` with the type's own names for
+    `location` (location_last_seen/location_found) and `date` (date_lost/date_found).
+    """
+    report = models.OneToOneField(Report, on_delete=models.CASCADE, related_name="item")
     item_name = models.CharField(max_length=100)
     description = models.TextField()
     category = models.CharField(max_length=100)
-    location_found = models.CharField(max_length=255)
-    photo_url = models.URLField(blank=True, null=True)
+    # Where it was last seen (lost) or found (found)
+    location = models.CharField(max_length=255)
+    # Date lost or date found
+    date = models.DateField(blank=True, null=True)
+    # Found items only
     supervised_by = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.SET_NULL, null=True, blank=True)
-    date_found = models.DateField(blank=True, null=True)
+    photo_url = models.URLField(blank=True, null=True)
+    thumbnail_url = models.URLField(blank=True, null=True)
+    photo_status = models.CharField(max_length=10, choices=PHOTO_STATUS_CHOICES, default="none")
+    search_vector = models.GeneratedField(
+        expression=item_search_vector(),
+        output_field=SearchVectorField(),
+        db_persist=True,
+    )
+
+    class Meta:
+        indexes = [
+            GinIndex(fields=["search_vector"], name="item_search_gin"),
+            GinIndex(fields=["item_name"], name="item_name_trgm", opclasses=["gin_trgm_ops"]),
+            models.Index(fields=["category", "report"], name="item_category_idx"),
+        ]
 
 
 class Comment(models.Model):
@@ -52,8 +130,9 @@ class Comment(models.Model):
 
 
 class Claim(models.Model):
-    report = models.ForeignKey(Report, on_delete=models.CASCADE)
-    claimed_by = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="claims")
+    # Both FKs are covered by the leading column of the Meta indexes below
+    report = models.ForeignKey(Report, on_delete=models.CASCADE, db_index=False)
+    claimed_by = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="claims", db_index=False)
     received_from = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.SET_NULL, null=True, blank=True, related_name="received_claims")
     supervised_by = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.SET_NULL, null=True, blank=True, related_name="supervised_claims")
     verified_by = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.SET_NULL, null=True, blank=True, related_name="verified_claims")
@@ -62,6 +141,35 @@ class Claim(models.Model):
     date_claimed = models.DateTimeField(auto_now_add=True)
     date_received = models.DateTimeField(blank=True, null=True)
 
+    class Meta:
+        indexes = [
+            # Latest claimant of a report (NotificationQuerySet.with_latest_claimant)
+            models.Index(fields=["report", "-date_claimed"], name="claim_report_latest_idx"),
+            # A user's own claims, newest first
+            models.Index(fields=["claimed_by", "-date_claimed"], name="claim_claimant_feed_idx"),
+        ]
+
+
+class NotificationQuerySet(models.QuerySet):
+    def with_latest_claimant(self):
+        """
+        Annotate `latest_claimant` ({id, first_name, last_name} or None) with the
+        most recent claimer of the related report, in the same query.
+        """
+        latest_claim = Claim.objects.filter(report=OuterRef("related_report")).order_by("-date_claimed")
+        return self.annotate(
+            latest_claimant=Subquery(
+                latest_claim.values(
+                    json=JSONObject(
+                        id=Cast("claimed_by_id", CharField()),
+                        first_name="claimed_by__first_name",
+                        last_name="claimed_by__last_name",
+                    )
+                )[:1],
+                output_field=models.JSONField(),
+            )
+        )
+
 
 class Notification(models.Model):
     user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE)
@@ -72,6 +180,46 @@ class Notification(models.Model):
     is_read = models.BooleanField(default=False)
     created_at = models.DateTimeField(auto_now_add=True)
 
+    objects = NotificationQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["user"], condition=Q(is_read=False), name="notification_unread_idx"),
+            models.Index(fields=["user", "-created_at", "-id"], name="notification_feed_idx"),
+        ]
+
+
+class NotificationCounter(models.Model):
+    """
+    Denormalized unread notification count per user.
+
+    Kept in step by the statement-level triggers on reports_notification
+    (see migration 0007), so bulk inserts/updates/deletes stay consistent too.
+    """
+    user = models.OneToOneField(
+        settings.AUTH_USER_MODEL, on_delete=models.CASCADE, primary_key=True, related_name="notification_counter"
+    )
+    unread = models.IntegerField(default=0)
+
+
+class MatchCandidate(models.Model):
+    """Scored lost/found pair maintained by reports.matching."""
+    lost_report = models.ForeignKey(Report, on_delete=models.CASCADE, related_name="found_matches")
+    found_report = models.ForeignKey(Report, on_delete=models.CASCADE, related_name="lost_matches")
+    score = models.FloatField()
+    notified = models.BooleanField(default=False)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["lost_report", "found_report"], name="unique_match_pair"),
+        ]
+        indexes = [
+            models.Index(fields=["lost_report", "-score"], name="match_lost_score_idx"),
+            models.Index(fields=["found_report", "-score"], name="match_found_score_idx"),
+        ]
+
+
 class ReportResolutionLog(models.Model):
     report = models.ForeignKey(Report, on_delete=models.CASCADE, related_name="resolution_logs")
     resolved_by = models.ForeignKey(
@@ -85,20 +233,132 @@ class ReportResolutionLog(models.Model):
     report_title = models.CharField(max_length=255)
     date_resolved = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["-date_resolved", "-id"], name="resolutionlog_feed_idx"),
+        ]
+
     def __str__(self):
         return f"Resolution Log for Report #{self.report.id} - {self.report_title}"
-    
+
+
+class ReportRollup(models.Model):
+    """
+    Number of reports per UTC day created, type, item category ("" while the
+    report has no item) and current status, for the dashboard statistics.
+
+    Kept in step by statement-level triggers on reports_report and
+    reports_item (see migration 0020); reports.stats reads only this table
+    and ResolutionRollup.
+    """
+    day = models.DateField()
+    type = models.CharField(max_length=10, choices=Report.REPORT_TYPE_CHOICES)
+    category = models.CharField(max_length=100)
+    status = models.CharField(max_length=10, choices=Report.STATUS_CHOICES)
+    reports = models.IntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["day", "type", "category", "status"], name="report_rollup_key"),
+        ]
+
+
+class ResolutionRollup(models.Model):
+    """
+    Resolutions per UTC day resolved, report type and item category, with the
+    summed seconds from report to resolution. Appended to by a trigger on
+    ReportResolutionLog inserts; like the logs, it is history and is not
+    undone when a report is deleted later.
+    """
+    day = models.DateField()
+    type = models.CharField(max_length=10, choices=Report.REPORT_TYPE_CHOICES)
+    category = models.CharField(max_length=100)
+    resolutions = models.IntegerField(default=0)
+    resolve_seconds = models.FloatField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["day", "type", "category"], name="resolution_rollup_key"),
+        ]
+
+
+def _display_name(user):
+    if user is None:
+        return "—"
+    return f"{user.first_name} {user.last_name}".strip() or user.username
+
+
 class ActivityLog(models.Model):
+    EVENT_TYPE_CHOICES = [
+        ("report_approved", "Report approved"),
+        ("report_rejected", "Report rejected"),
+        ("report_deleted", "Report deleted"),
+        ("claim_requested", "Claim requested"),
+        ("item_found", "Item found"),
+        ("role_changed", "Role changed"),
+        ("report_resolved", "Report resolved"),
+    ]
+
     user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE)
     role = models.CharField(max_length=20, blank=True, null=True)  # student/admin
     report = models.ForeignKey(Report, on_delete=models.CASCADE, null=True, blank=True)
-    action = models.CharField(max_length=255)
-    created_at = models.DateTimeField(auto_now_add=True)
+    # db_default too: the log_report_resolution trigger inserts rows in SQL
+    event_type = models.CharField(max_length=30, choices=EVENT_TYPE_CHOICES, blank=True, default="", db_default="")
+    target_user = models.ForeignKey(
+        settings.AUTH_USER_MODEL, on_delete=models.SET_NULL, null=True, blank=True, related_name="+"
+    )
+    # Copy of report.reported_by so a student's feed needs no join to reports
+    report_owner = models.ForeignKey(
+        settings.AUTH_USER_MODEL, on_delete=models.SET_NULL, null=True, blank=True, related_name="+", db_index=False
+    )
+    item_name = models.CharField(max_length=255, blank=True, default="", db_default="")
+    # Preformatted text of rows written before event_type existed; wins over rendering
+    action = models.CharField(max_length=255, blank=True, default="")
+    # Set when the event happens, not when the batched writer flushes it
+    created_at = models.DateTimeField(default=timezone.now)
 
     class Meta:
         db_table = "activity_logs"
         ordering = ["-created_at"]
+        indexes = [
+            models.Index(fields=["-created_at", "-id"], name="activitylog_feed_idx"),
+            models.Index(fields=["event_type", "-created_at", "-id"], name="activitylog_type_feed_idx"),
+            models.Index(fields=["user", "-created_at", "-id"], name="activitylog_user_feed_idx"),
+            models.Index(fields=["report_owner", "-created_at", "-id"], name="activitylog_owner_feed_idx"),
+        ]
+
+    def render_action(self):
+        """Human-readable description, built from the structured fields at read time."""
+        if self.action:
+            return self.action
+        item = self.item_name or "—"
+        if self.event_type in ("report_approved", "report_rejected"):
+            verb = "approved" if self.event_type == "report_approved" else "rejected"
+            report_type = self.report.type if self.report else ""
+            return (
+                f"{_display_name(self.user)} (admin) {verb} {report_type} report for "
+                f"{_display_name(self.target_user)}'s item \"{item}\""
+            )
+        if self.event_type == "report_deleted":
+            return f"{_display_name(self.user)} (admin) deleted {_display_name(self.target_user)}'s report for \"{item}\""
+        if self.event_type == "claim_requested":
+            return (
+                f"{_display_name(self.user)} wants to claim {_display_name(self.target_user)}'s "
+                f"item \"{item}\" (report #{self.report_id})"
+            )
+        if self.event_type == "item_found":
+            return (
+                f"{_display_name(self.user)} has found {_display_name(self.target_user)}'s "
+                f"item \"{item}\" (report #{self.report_id})"
+            )
+        if self.event_type == "role_changed":
+            target = self.target_user.username if self.target_user else "—"
+            return f"{self.user.username} (admin) updated {target}'s role to {self.role}"
+        if self.event_type == "report_resolved":
+            # Written by the log_report_resolution trigger: user resolved, target_user claimed
+            return f"{_display_name(self.target_user)} gave \"{item}\" to {_display_name(self.user)}"
+        return ""
 
     def __str__(self):
-        return f"{self.user.username} - {self.action}"
+        return f"{self.user.username} - {self.render_action()}"
 
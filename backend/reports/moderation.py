@@ -0,0 +1,94 @@
+"""
+Bulk report moderation for admins.
+
+bulk_moderate() approves, rejects or deletes a batch of reports with one
+statement, writes the activity logs through the batched writer and notifies
+every affected owner with a single bulk insert, returning a per-id outcome.
+Match rescoring for the batch is handed to reports.matching's workers.
+"""
+from django.db import transaction
+
+from .activity import log_activity, report_item_name
+from .cache import invalidate_report_cache
+from .events import publish_notifications
+from .matching import enqueue_rematch
+from .models import Notification, Report
+
+# action -> (resulting status, activity event type)
+BULK_ACTIONS = {
+    "approve": ("approved", "report_approved"),
+    "reject": ("rejected", "report_rejected"),
+    "delete": ("deleted", "report_deleted"),
+}
+
+OWNER_MESSAGES = {
+    "approve": "Your {type} report \"{item}\" was approved.",
+    "reject": "Your {type} report \"{item}\" was rejected.",
+    "delete": "Your {type} report \"{item}\" was removed by an admin.",
+}
+
+
+def bulk_moderate(admin, action, ids):
+    """
+    Apply `action` to the reports in `ids`. Returns [{"id", "result"}] in the
+    order given, where result is the new status, "unchanged" or "not_found".
+    """
+    new_status, event_type = BULK_ACTIONS[action]
+
+    with transaction.atomic():
+        reports = {
+            report.id: report
+            for report in Report.objects.filter(id__in=ids)
+            .select_related("item")
+            .select_for_update(of=("self",))
+        }
+        changed = [
+            report for report in reports.values()
+            if action == "delete" or report.status != new_status
+        ]
+        changed_ids = [report.id for report in changed]
+
+        if action == "delete":
+            Report.objects.filter(id__in=changed_ids).delete()
+        else:
+            Report.objects.filter(id__in=changed_ids).update(status=new_status)
+            # Queryset updates skip the model signals that retire cached feeds
+            invalidate_report_cache()
+
+        for report in changed:
+            log_activity(
+                admin,
+                event_type,
+                report=None if action == "delete" else report,
+                target_user_id=report.reported_by_id,
+                report_owner_id=report.reported_by_id,
+                item_name=report_item_name(report),
+            )
+
+        notifications = Notification.objects.bulk_create([
+            Notification(
+                user_id=report.reported_by_id,
+                triggered_by=admin,
+                message=OWNER_MESSAGES[action].format(type=report.type, item=report_item_name(report) or "—"),
+                related_report_id=None if action == "delete" else report.id,
+            )
+            for report in changed
+            if report.reported_by_id != admin.pk
+        ])
+        publish_notifications(notifications)
+
+        if action != "delete":
+            enqueue_rematch(changed_ids)
+
+    changed_ids = set(changed_ids)
+    return [
+        {
+            "id": report_id,
+            "result": (
+                "not_found" if report_id not in reports
+                else new_status if report_id in changed_ids
+                else "unchanged"
+            ),
+        }
+        for report_id in ids
+    ]
@@ -0,0 +1,33 @@
+from rest_framework.pagination import CursorPagination, PageNumberPagination
+
+
+class FeedCursorPagination(CursorPagination):
+    """
+    Keyset pagination for newest-first feeds: no COUNT(*) and no OFFSET scan,
+    so deep pages cost the same as the first. Clients follow `next`/`previous`
+    and may pass ?page_size= up to `max_page_size`.
+    """
+    page_size_query_param = "page_size"
+    max_page_size = 50
+
+
+class ReportCursorPagination(FeedCursorPagination):
+    ordering = ("-date_time", "-id")
+
+
+class NotificationCursorPagination(FeedCursorPagination):
+    ordering = ("-created_at", "-id")
+
+
+class ActivityLogCursorPagination(FeedCursorPagination):
+    ordering = ("-created_at", "-id")
+
+
+class ResolutionLogCursorPagination(FeedCursorPagination):
+    ordering = ("-date_resolved", "-id")
+
+
+class SearchResultsPagination(PageNumberPagination):
+    """Ranked search results have no stable keyset, so they keep page numbers."""
+    page_size_query_param = "page_size"
+    max_page_size = 50
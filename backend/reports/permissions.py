@@ -34,7 +34,7 @@ class IsOwnerOrReadOnly(permissions.BasePermission):
         if hasattr(obj, "reported_by"):
             return obj.reported_by == request.user
 
-        # For LostItem or FoundItem, link through the report
+        # For an Item, link through the report
         if hasattr(obj, "report"):
             return obj.report.reported_by == request.user
 
@@ -96,7 +96,7 @@ class IsAdminOrOwnerOrReadOnly(permissions.BasePermission):
         if hasattr(obj, "reported_by") and obj.reported_by == user:
             return True
 
-        # Allow ownership via linked models (LostItem or FoundItem)
+        # Allow ownership via linked models (Item)
         if hasattr(obj, "report") and obj.report.reported_by == user:
             return True
 
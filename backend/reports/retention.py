@@ -0,0 +1,28 @@
+"""
+Retention windows of the monthly-partitioned tables.
+
+`manage.py archive_partitions` archives and drops every partition older than
+settings.PARTITION_RETENTION_MONTHS[table]; feeds bound their queries to the
+same window so the planner only visits the partitions still kept.
+"""
+from datetime import date, datetime, timezone as dt_timezone
+
+from django.conf import settings
+from django.utils import timezone
+
+
+def add_months(month, count):
+    index = month.year * 12 + month.month - 1 + count
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def retention_cutoff(table, today=None):
+    """First day of the oldest month of `table` that is kept."""
+    this_month = (today or timezone.now().date()).replace(day=1)
+    return add_months(this_month, -settings.PARTITION_RETENTION_MONTHS[table])
+
+
+def retained_since(table):
+    """Start (UTC) of `table`'s retention window, for a created_at lower bound."""
+    cutoff = retention_cutoff(table)
+    return datetime(cutoff.year, cutoff.month, cutoff.day, tzinfo=dt_timezone.utc)
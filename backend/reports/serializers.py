@@ -1,24 +1,72 @@
 from rest_framework import serializers
-from .models import Report, LostItem, FoundItem, Comment, Claim, Notification, ActivityLog, ReportResolutionLog
+from .models import Report, Item, Comment, Claim, Notification, ActivityLog, ReportResolutionLog
 from django.contrib.auth import get_user_model
+from django.db.models.functions import Left
+
+from .fastpath import FastListSerializer
 
 User = get_user_model()  # This will get the correct User model
 
+# Feed cards show at most this much of an item description (?expand=description for all of it)
+DESCRIPTION_EXCERPT_LENGTH = 200
+
+
+def description_excerpt(text):
+    if text is None or len(text) <= DESCRIPTION_EXCERPT_LENGTH:
+        return text
+    return text[:DESCRIPTION_EXCERPT_LENGTH].rstrip() + "…"
+
+
+class SparseFieldsMixin:
+    """
+    Drops fields not named in context["fields"] and exposes context["expand"]
+    (both set by reports.fieldsets.SparseFieldsetMixin). `expandable` lists
+    the names ?expand= accepts.
+    """
+    expandable = ()
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        requested = self.context.get("fields")
+        if requested:
+            for name in set(self.fields) - requested:
+                self.fields.pop(name)
+
+    @property
+    def expand(self):
+        return self.context.get("expand") or set()
+
 class UserSerializer(serializers.ModelSerializer):
     class Meta:
         model = User 
         fields =  ["id", "username", "email", "first_name", "last_name", "profile_avatar_url"]
 
 class LostItemSerializer(serializers.ModelSerializer):
+    location_last_seen = serializers.CharField(source="location", read_only=True)
+    date_lost = serializers.DateField(source="date", read_only=True)
+
     class Meta:
-        model = LostItem
-        exclude = ["report"] 
+        model = Item
+        fields = [
+            "id", "item_name", "description", "category", "location_last_seen",
+            "photo_url", "thumbnail_url", "photo_status", "date_lost",
+        ]
 
 
 class FoundItemSerializer(serializers.ModelSerializer):
+    location_found = serializers.CharField(source="location", read_only=True)
+    date_found = serializers.DateField(source="date", read_only=True)
+
     class Meta:
-        model = FoundItem
-        exclude = ["report"]  
+        model = Item
+        fields = [
+            "id", "item_name", "description", "category", "location_found",
+            "photo_url", "thumbnail_url", "photo_status", "supervised_by", "date_found",
+        ]
+
+
+# Report.type -> serializer for its item under the API's lost_item/found_item keys
+ITEM_SERIALIZERS = {"lost": LostItemSerializer, "found": FoundItemSerializer}
 
 
 class ReportSerializer(serializers.ModelSerializer):
@@ -31,14 +79,135 @@ class ReportSerializer(serializers.ModelSerializer):
         fields = "__all__"
 
     def get_lost_item(self, obj):
-        if obj.type == "lost" and hasattr(obj, 'lost_item'):
-            return LostItemSerializer(obj.lost_item).data
-        return None
+        return self.item_data(obj, "lost")
 
     def get_found_item(self, obj):
-        if obj.type == "found" and hasattr(obj, 'found_item'):
-            return FoundItemSerializer(obj.found_item).data
-        return None
+        return self.item_data(obj, "found")
+
+    def item_data(self, obj, report_type):
+        item = obj.get_item() if obj.type == report_type else None
+        return ITEM_SERIALIZERS[report_type](item).data if item else None
+
+
+class ReportOwnerSerializer(serializers.ModelSerializer):
+    """The owner as shown on a feed card (no contact details)."""
+
+    class Meta:
+        model = User
+        fields = ["id", "username", "first_name", "last_name", "profile_avatar_url"]
+
+
+class ItemCardSerializer(serializers.ModelSerializer):
+    """Item on a feed card; the description is an excerpt unless ?expand=description."""
+    description = serializers.SerializerMethodField()
+
+    def get_description(self, item):
+        if "description" in (self.context.get("expand") or ()):
+            return item.description
+        # ReportListSerializer.prepare_queryset() cuts the excerpt in SQL and
+        # select_related() caches the report on the item
+        report = item._meta.get_field("report").get_cached_value(item, default=None)
+        text = getattr(report, "description_excerpt", None)
+        return description_excerpt(item.description if text is None else text)
+
+
+class LostItemCardSerializer(ItemCardSerializer):
+    location_last_seen = serializers.CharField(source="location", read_only=True)
+    date_lost = serializers.DateField(source="date", read_only=True)
+
+    class Meta:
+        model = Item
+        fields = [
+            "id", "item_name", "description", "category", "location_last_seen", "date_lost",
+            "photo_url", "thumbnail_url", "photo_status",
+        ]
+
+
+class FoundItemCardSerializer(ItemCardSerializer):
+    location_found = serializers.CharField(source="location", read_only=True)
+    date_found = serializers.DateField(source="date", read_only=True)
+
+    class Meta:
+        model = Item
+        fields = [
+            "id", "item_name", "description", "category", "location_found", "date_found",
+            "photo_url", "thumbnail_url", "photo_status",
+        ]
+
+
+class ReportListSerializer(SparseFieldsMixin, serializers.ModelSerializer):
+    """
+    Compact report for feeds: the owner without contact details, only the
+    item matching the report type, and a description excerpt.
+    ?expand=reported_by and ?expand=description restore the full versions.
+    """
+    expandable = ("reported_by", "description")
+
+    reported_by = ReportOwnerSerializer(read_only=True)
+    # Both read Report.item; finish_representation() keeps the one matching the type
+    lost_item = LostItemCardSerializer(source="item", read_only=True)
+    found_item = FoundItemCardSerializer(source="item", read_only=True)
+
+    class Meta:
+        model = Report
+        fields = ["id", "type", "status", "date_time", "reported_by", "lost_item", "found_item"]
+        list_serializer_class = FastListSerializer
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        if "reported_by" in self.expand and "reported_by" in self.fields:
+            self.fields["reported_by"] = UserSerializer(read_only=True)
+
+    @classmethod
+    def prepare_queryset(cls, queryset, fields=None, expand=None):
+        """
+        Join and load (QuerySet.only()) just the columns the fieldset
+        renders; the description excerpt is cut in SQL so full texts
+        never leave the database.
+        """
+        fields = fields or set(cls.Meta.fields)
+        expand = expand or set()
+
+        # Cursor pagination reads date_time and id; the item is picked by type
+        columns = ["id", "type", "date_time"]
+        related = []
+        if "status" in fields:
+            columns.append("status")
+        if "reported_by" in fields:
+            owner_serializer = UserSerializer if "reported_by" in expand else ReportOwnerSerializer
+            related.append("reported_by")
+            columns += ["reported_by"] + [f"reported_by__{name}" for name in owner_serializer.Meta.fields]
+
+        item_fields = {name for name in ("lost_item", "found_item") if name in fields}
+        if item_fields:
+            related.append("item")
+            columns += sorted({
+                f"item__{field.source}"
+                for name in item_fields
+                for field in cls._declared_fields[name].fields.values()
+                if field.source != "*"  # the description method field; see below
+            })
+            if "description" in expand:
+                columns.append("item__description")
+
+        queryset = queryset.select_related(None).only(*columns)
+        if related:
+            # select_related() without arguments would follow every foreign key
+            queryset = queryset.select_related(*related)
+        if item_fields and "description" not in expand:
+            # One extra character tells description_excerpt() the text was longer
+            queryset = queryset.annotate(
+                description_excerpt=Left("item__description", DESCRIPTION_EXCERPT_LENGTH + 1)
+            )
+        return queryset
+
+    def to_representation(self, instance):
+        return self.finish_representation(instance, super().to_representation(instance))
+
+    def finish_representation(self, instance, data):
+        # The other item key would always be null
+        data.pop("found_item" if instance.type == "lost" else "lost_item", None)
+        return data
 
 
 class CommentSerializer(serializers.ModelSerializer):
@@ -64,9 +233,11 @@ class SimpleReportSerializer(serializers.ModelSerializer):
         fields = ["id", "type", "status", "date_time"]
 
 
-class NotificationSerializer(serializers.ModelSerializer):
+class NotificationSerializer(SparseFieldsMixin, serializers.ModelSerializer):
+    expandable = ("related_report",)
+
     user = UserSerializer(read_only=True)
-    related_report = ReportSerializer(read_only=True)
+    related_report = SimpleReportSerializer(read_only=True)
     claimed_by = serializers.SerializerMethodField()
     triggered_by = UserSerializer(read_only=True)
 
@@ -83,13 +254,29 @@ class NotificationSerializer(serializers.ModelSerializer):
             "is_read",
             "created_at",
         ]
+        list_serializer_class = FastListSerializer
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # The full report (owner, items) only when asked for with ?expand=related_report
+        if "related_report" in self.expand and "related_report" in self.fields:
+            self.fields["related_report"] = ReportSerializer(read_only=True)
 
     def get_claimed_by(self, obj):
         """Return the latest claimant for this report, if exists."""
+        # Annotated by NotificationQuerySet.with_latest_claimant() for list pages
+        if hasattr(obj, "latest_claimant"):
+            return obj.latest_claimant
+
         if not obj.related_report:
             return None
 
-        claim = Claim.objects.filter(report=obj.related_report).order_by("-date_claimed").first()
+        claim = (
+            Claim.objects.filter(report=obj.related_report)
+            .select_related("claimed_by")
+            .order_by("-date_claimed")
+            .first()
+        )
         if claim and claim.claimed_by:
             return {
                 "id": str(claim.claimed_by.id),
@@ -114,7 +301,7 @@ class UserMiniSerializer(serializers.ModelSerializer):
 
 
 class ReportResolutionLogSerializer(serializers.ModelSerializer):
-    report = ReportSerializer(read_only=True)
+    report = ReportListSerializer(read_only=True)
     resolved_by = UserMiniSerializer(read_only=True)
     claimed_by = UserMiniSerializer(read_only=True)
 
@@ -132,9 +319,18 @@ class ReportResolutionLogSerializer(serializers.ModelSerializer):
         ]
 
 
-class ActivityLogSerializer(serializers.ModelSerializer):
+class ActivityLogReportSerializer(serializers.ModelSerializer):
+    """Just enough of the report to label and link an activity entry."""
+
+    class Meta:
+        model = Report
+        fields = ["id", "type", "status", "date_time"]
+
+
+class ActivityLogSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     user = UserMiniSerializer(read_only=True)
-    report = ReportSerializer(read_only=True)
+    report = ActivityLogReportSerializer(read_only=True)
+    action = serializers.CharField(source="render_action", read_only=True)
 
     class Meta:
         model = ActivityLog
@@ -143,6 +339,9 @@ class ActivityLogSerializer(serializers.ModelSerializer):
             "user",
             "role",
             "report",
+            "event_type",
+            "item_name",
             "action",
             "created_at",
         ]
+        list_serializer_class = FastListSerializer
@@ -0,0 +1,28 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .cache import invalidate_report_cache
+from .events import publish_notifications, publish_unread_count
+from .models import Item, Notification, Report
+
+
+@receiver(post_save, sender=Notification)
+def push_notification(sender, instance, created, **kwargs):
+    if created:
+        publish_notifications([instance])
+    else:
+        transaction.on_commit(lambda: publish_unread_count(instance.user_id))
+
+
+@receiver(post_delete, sender=Notification)
+def push_unread_count_after_delete(sender, instance, **kwargs):
+    transaction.on_commit(lambda: publish_unread_count(instance.user_id))
+
+
+@receiver(post_save, sender=Report)
+@receiver(post_save, sender=Item)
+@receiver(post_delete, sender=Report)
+@receiver(post_delete, sender=Item)
+def invalidate_cached_reports(sender, **kwargs):
+    invalidate_report_cache()
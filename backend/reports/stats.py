@@ -0,0 +1,99 @@
+"""
+Admin dashboard statistics.
+
+Everything here reads the rollup tables the database triggers keep in step
+(ReportRollup, ResolutionRollup; see migration 0020), never reports_report
+itself, so the cost grows with the number of days and categories covered,
+not with the number of reports.
+
+Report counts are bucketed by the day a report was created and show its
+current status; resolutions and time-to-resolve by the day it was resolved.
+"""
+from django.db.models import DateField, Sum
+from django.db.models.functions import Trunc
+
+from .models import Report, ReportRollup, ResolutionRollup
+
+BUCKETS = ("day", "week", "month", "year")
+
+STATUSES = [status for status, _ in Report.STATUS_CHOICES]
+TYPES = [report_type for report_type, _ in Report.REPORT_TYPE_CHOICES]
+
+
+def _counts(**extra):
+    return {"reports": 0, **dict.fromkeys(TYPES, 0), **dict.fromkeys(STATUSES, 0), **extra}
+
+
+def _add(counts, report_type, status, n):
+    counts["reports"] += n
+    counts[report_type] += n
+    counts[status] += n
+
+
+def _rate(counts):
+    return round(counts["resolved"] / counts["reports"], 4) if counts["reports"] else None
+
+
+def _hours(seconds, resolutions):
+    return round(seconds / resolutions / 3600, 1) if resolutions else None
+
+
+def dashboard_stats(bucket, since=None, until=None):
+    """
+    Totals, per-category volumes and a per-`bucket` time series for reports
+    created (and resolutions made) between the dates `since` and `until`,
+    both inclusive and optional.
+    """
+    reports = ReportRollup.objects.all()
+    resolutions = ResolutionRollup.objects.all()
+    if since is not None:
+        reports, resolutions = reports.filter(day__gte=since), resolutions.filter(day__gte=since)
+    if until is not None:
+        reports, resolutions = reports.filter(day__lte=until), resolutions.filter(day__lte=until)
+    start = Trunc("day", bucket, output_field=DateField())
+
+    totals = _counts()
+    series = {}
+    for row in reports.annotate(start=start).values("start", "type", "status").annotate(n=Sum("reports")):
+        counts = series.setdefault(row["start"], _counts(resolutions=0, resolve_seconds=0))
+        _add(counts, row["type"], row["status"], row["n"])
+        _add(totals, row["type"], row["status"], row["n"])
+
+    categories = {}
+    for row in reports.values("category", "type", "status").annotate(n=Sum("reports")):
+        _add(categories.setdefault(row["category"], _counts()), row["type"], row["status"], row["n"])
+
+    resolved = {"resolutions": 0, "resolve_seconds": 0}
+    for row in resolutions.annotate(start=start).values("start").annotate(
+        n=Sum("resolutions"), seconds=Sum("resolve_seconds")
+    ):
+        counts = series.setdefault(row["start"], _counts(resolutions=0, resolve_seconds=0))
+        counts["resolutions"] += row["n"]
+        counts["resolve_seconds"] += row["seconds"]
+        resolved["resolutions"] += row["n"]
+        resolved["resolve_seconds"] += row["seconds"]
+
+    return {
+        "bucket": bucket,
+        "since": since,
+        "until": until,
+        "totals": totals,
+        "resolution_rate": _rate(totals),
+        "resolutions": resolved["resolutions"],
+        "avg_hours_to_resolve": _hours(resolved["resolve_seconds"], resolved["resolutions"]),
+        # Reports without an item count under category ""
+        "categories": [
+            {"category": category, **counts, "resolution_rate": _rate(counts)}
+            for category, counts in sorted(categories.items(), key=lambda entry: (-entry[1]["reports"], entry[0]))
+            if counts["reports"]
+        ],
+        "series": [
+            {
+                "start": day,
+                **{key: value for key, value in counts.items() if key != "resolve_seconds"},
+                "resolution_rate": _rate(counts),
+                "avg_hours_to_resolve": _hours(counts["resolve_seconds"], counts["resolutions"]),
+            }
+            for day, counts in sorted(series.items())
+        ],
+    }
@@ -1,3 +1,1234 @@
-from django.test import TestCase
+import asyncio
+import gzip
+import io
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import textwrap
+import threading
+import time
+from datetime import datetime, timedelta, timezone as dt_timezone
+from unittest import mock
+from urllib.parse import urlencode
 
-# Create your tests here.
+from asgiref.sync import sync_to_async
+from django.core import signing
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.db import connection
+from django.test import AsyncClient, TestCase, TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from PIL import Image
+from rest_framework import filters
+from rest_framework.authtoken.models import Token
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIClient
+
+from accounts.models import User
+from api.renderers import ORJSONRenderer
+from .activity import log_activity, writer as activity_writer
+from .events import InProcessBroker
+from .fastpath import compile_plan
+from .management.commands.bench_api import SCENARIOS as BENCH_SCENARIOS
+from .management.commands.bench_serializers import Command as BenchSerializersCommand
+from .management.commands.check_query_plans import sequential_scans
+from .matching import MAX_QUERY_TERMS, _query_terms
+from .models import (
+    ActivityLog, Report, Item, Claim, MatchCandidate, Notification, NotificationCounter,
+    ReportResolutionLog, ReportRollup, ResolutionRollup,
+)
+from .views import (
+    STREAM_TICKET_MAX_AGE, STREAM_TICKET_SALT, ActivityLogViewSet, NotificationViewSet,
+    ReportResolutionLogViewSet, ReportViewSet,
+)
+
+
+def make_report(user, type, item_name, description="", category="Others", status="approved"):
+    report = Report.objects.create(reported_by=user, type=type, status=status)
+    Item.objects.create(
+        report=report, item_name=item_name, description=description, category=category, location="Library",
+    )
+    return report
+
+
+class ReportSearchTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username="owner", password="pass")
+        cls.by_name = make_report(cls.user, "lost", "Black umbrella", "Left near the gym")
+        cls.by_description = make_report(cls.user, "found", "Tote bag", "Has a small umbrella inside")
+        cls.unrelated = make_report(cls.user, "found", "Calculator", "Casio fx-991")
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+
+    def search(self, term):
+        res = self.client.get("/api/reports/reports/", {"search": term})
+        self.assertEqual(res.status_code, 200)
+        return [r["id"] for r in res.data["results"]]
+
+    def test_name_matches_rank_above_description_matches(self):
+        self.assertEqual(self.search("umbrella"), [self.by_name.id, self.by_description.id])
+
+    def test_partial_words_match_as_prefixes(self):
+        self.assertEqual(self.search("umbr"), [self.by_name.id, self.by_description.id])
+        self.assertEqual(self.search("small umb"), [self.by_description.id])
+        self.assertEqual(self.search("calc"), [self.unrelated.id])
+        self.assertEqual(self.search("!!"), [])
+
+    def test_typo_falls_back_to_trigram_similarity(self):
+        self.assertEqual(self.search("calculater"), [self.unrelated.id])
+
+    def test_search_vector_follows_item_updates(self):
+        item = Item.objects.get(report=self.by_name)
+        item.item_name, item.description = "Blue jacket", ""
+        with self.captureOnCommitCallbacks(execute=True):
+            item.save()
+        self.assertEqual(self.search("umbrella"), [self.by_description.id])
+
+
+class ReportQueryCountTests(TestCase):
+    """ReportSerializer must not fan out into per-row owner/item queries."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username="owner", password="pass")
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+
+    def test_list_query_count_does_not_grow_with_page_size(self):
+        for i in range(10):
+            make_report(self.user, "lost" if i % 2 else "found", f"Item {i}")
+
+        # One joined SELECT per page; cursor pagination needs no COUNT
+        for page_size in (1, 4, 10):
+            with self.subTest(page_size=page_size):
+                with self.assertNumQueries(1):
+                    res = self.client.get("/api/reports/reports/", {"page_size": page_size})
+                self.assertEqual(len(res.data["results"]), page_size)
+
+    def test_detail_is_a_single_query(self):
+        report = make_report(self.user, "lost", "Wallet")
+        with self.assertNumQueries(1):
+            res = self.client.get(f"/api/reports/reports/{report.id}/")
+        self.assertEqual(res.data["lost_item"]["item_name"], "Wallet")
+
+
+class ItemTableTests(TestCase):
+    """Lost and found items share one table; the API keeps the per-type keys and names."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username="owner", password="pass")
+        cls.lost = make_report(cls.user, "lost", "Blue umbrella", category="Umbrellas")
+        cls.found = make_report(cls.user, "found", "Red umbrella", category="Umbrellas")
+        make_report(cls.user, "found", "Calculator", category="Electronics")
+        Item.objects.filter(report=cls.found).update(supervised_by=cls.user, date=datetime(2026, 10, 1).date())
+
+    def setUp(self):
+        cache.clear()
+
+    def test_detail_keeps_type_specific_item_keys(self):
+        lost = self.client.get(f"/api/reports/reports/{self.lost.id}/").data
+        self.assertIsNone(lost["found_item"])
+        self.assertEqual(lost["lost_item"]["location_last_seen"], "Library")
+        self.assertIn("date_lost", lost["lost_item"])
+        self.assertNotIn("location", lost["lost_item"])
+
+        found = self.client.get(f"/api/reports/reports/{self.found.id}/").data
+        self.assertIsNone(found["lost_item"])
+        self.assertEqual(found["found_item"]["location_found"], "Library")
+        self.assertEqual(found["found_item"]["date_found"], "2026-10-01")
+        self.assertEqual(found["found_item"]["supervised_by"], self.user.pk)
+
+    def test_category_filter_is_one_join_without_or(self):
+        with CaptureQueriesContext(connection) as queries:
+            res = self.client.get("/api/reports/reports/", {"category": "Umbrellas"})
+        self.assertEqual({r["id"] for r in res.data["results"]}, {self.lost.id, self.found.id})
+        sql = queries.captured_queries[0]["sql"]
+        self.assertEqual(sql.count('JOIN "reports_item"'), 1)
+        self.assertNotIn(" OR ", sql)
+
+
+class SparseFieldsetTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username="owner", password="pass", email="owner@example.com")
+        cls.long_text = "Scratched lid, sticker of a cat. " * 20
+        cls.report = make_report(cls.user, "lost", "Tumbler", description=cls.long_text)
+        Notification.objects.create(user=cls.user, message="Approved", related_report=cls.report)
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def test_list_sends_compact_cards(self):
+        card = self.client.get("/api/reports/reports/").data["results"][0]
+
+        self.assertNotIn("found_item", card)
+        self.assertNotIn("email", card["reported_by"])
+        self.assertEqual(card["lost_item"]["item_name"], "Tumbler")
+        self.assertEqual(len(card["lost_item"]["description"]), 201)
+        self.assertTrue(card["lost_item"]["description"].endswith("…"))
+
+    def test_expand_restores_full_owner_and_description(self):
+        res = self.client.get("/api/reports/reports/", {"expand": "reported_by,description"})
+        card = res.data["results"][0]
+        self.assertEqual(card["reported_by"]["email"], "owner@example.com")
+        self.assertEqual(card["lost_item"]["description"], self.long_text)
+
+    def test_fields_limit_keys_and_loaded_columns(self):
+        with CaptureQueriesContext(connection) as queries:
+            res = self.client.get("/api/reports/reports/", {"fields": "id,status"})
+        self.assertEqual(res.data["results"], [{"id": self.report.id, "status": "approved"}])
+        sql = queries.captured_queries[0]["sql"]
+        self.assertNotIn("reports_item", sql)
+        self.assertNotIn("accounts_user", sql)
+
+    def test_unknown_names_are_rejected(self):
+        res = self.client.get("/api/reports/reports/", {"fields": "id,secret"})
+        self.assertEqual(res.status_code, 400)
+        self.assertEqual(res.data, {"error": "Unknown fields: secret."})
+        self.assertEqual(self.client.get("/api/reports/reports/", {"expand": "status"}).status_code, 400)
+
+    def test_notifications_embed_a_report_summary_unless_expanded(self):
+        related = self.client.get("/api/reports/notifications/").data["results"][0]["related_report"]
+        self.assertEqual(set(related), {"id", "type", "status", "date_time"})
+
+        res = self.client.get("/api/reports/notifications/", {"expand": "related_report"})
+        self.assertEqual(res.data["results"][0]["related_report"]["lost_item"]["description"], self.long_text)
+
+
+@override_settings(ACTIVITY_LOG_FLUSH_INTERVAL=0)
+class FastSerializationTests(TestCase):
+    """The fast path must produce exactly the bytes DRF's serializers and renderer do."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = User.objects.create_user(username="admin", password="pass", is_staff=True, user_type="admin")
+        cls.owner = User.objects.create_user(username="owner", password="pass", first_name="Niño", last_name="Ávila")
+        cls.claimant = User.objects.create_user(username="claimant", password="pass")
+        lost = make_report(cls.owner, "lost", "Café mug", description="Line\u2028break " + "x" * 300)
+        found = make_report(cls.owner, "found", "Key \"ring\"", description="</script>")
+        bare = Report.objects.create(reported_by=cls.owner, type="lost", status="approved")  # no item row
+        Claim.objects.create(report=found, claimed_by=cls.claimant, message="mine")
+        for report in (lost, found, bare, None):
+            Notification.objects.create(
+                user=cls.owner, triggered_by=cls.claimant, message="Tap\u2028here", related_report=report
+            )
+        ActivityLog.objects.create(
+            user=cls.admin, role="admin", report=lost, report_owner=cls.owner, target_user=cls.owner,
+            event_type="report_approved", item_name="Café\u2028mug",
+        )
+        ActivityLog.objects.create(user=cls.admin, role="admin", target_user=cls.owner, event_type="role_changed")
+
+    def setUp(self):
+        cache.clear()
+
+    def render_both(self, viewset, path, user):
+        view = BenchSerializersCommand().list_view(viewset, path, user)
+        rows = list(view.filter_queryset(view.get_queryset()))
+        # Otherwise FastListSerializer quietly falls back to DRF and the comparison proves nothing
+        self.assertIsNotNone(compile_plan(view.get_serializer()))
+        with self.settings(FAST_SERIALIZATION=False):
+            expected = JSONRenderer().render(view.get_serializer(rows, many=True).data)
+        with self.settings(FAST_SERIALIZATION=True):
+            actual = ORJSONRenderer().render(view.get_serializer(rows, many=True).data)
+        return expected, actual
+
+    def test_list_serializers_match_drf_byte_for_byte(self):
+        cases = [
+            (ReportViewSet, "/api/reports/reports/", self.owner),
+            (ReportViewSet, "/api/reports/reports/?expand=reported_by,description", self.owner),
+            (ReportViewSet, "/api/reports/reports/?fields=id,lost_item", self.owner),
+            (NotificationViewSet, "/api/reports/notifications/", self.owner),
+            (NotificationViewSet, "/api/reports/notifications/?expand=related_report", self.owner),
+            (ActivityLogViewSet, "/api/reports/activity-logs/", self.admin),
+        ]
+        for viewset, path, user in cases:
+            with self.subTest(path=path):
+                expected, actual = self.render_both(viewset, path, user)
+                self.assertIn(b"\\u2028", expected)
+                self.assertEqual(actual, expected)
+
+    def test_api_responses_use_the_orjson_renderer_with_drf_bytes(self):
+        client = APIClient()
+        client.force_authenticate(self.owner)
+        res = client.get("/api/reports/notifications/", {"expand": "related_report"})
+        self.assertIsInstance(res.accepted_renderer, ORJSONRenderer)
+        self.assertEqual(res.content, JSONRenderer().render(res.data))
+
+
+class FeedPaginationTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username="owner", password="pass")
+        cls.reports = [make_report(cls.user, "lost", f"Item {i}") for i in range(7)]
+        # Same timestamp for several rows: the id tie-breaker must keep order stable
+        Report.objects.filter(id__in=[r.id for r in cls.reports[2:5]]).update(date_time=cls.reports[2].date_time)
+
+    def setUp(self):
+        cache.clear()
+
+    def test_following_next_walks_the_feed_once_in_order(self):
+        client = APIClient()
+        url, seen = "/api/reports/reports/?page_size=2", []
+        while url:
+            res = client.get(url)
+            self.assertNotIn("count", res.data)
+            seen += [r["id"] for r in res.data["results"]]
+            url = res.data["next"]
+
+        expected = list(Report.objects.order_by("-date_time", "-id").values_list("id", flat=True))
+        self.assertEqual(seen, expected)
+
+    def test_page_size_is_capped(self):
+        for i in range(55):
+            Notification.objects.create(user=self.user, message=f"n{i}")
+        client = APIClient()
+        client.force_authenticate(self.user)
+        res = client.get("/api/reports/notifications/", {"page_size": 500})
+        self.assertEqual(len(res.data["results"]), 50)
+
+    def test_ordering_param_does_not_reorder_the_feeds(self):
+        for i in range(3):
+            Notification.objects.create(user=self.user, message=f"n{i}")
+        client = APIClient()
+        client.force_authenticate(self.user)
+        expected = list(
+            Notification.objects.filter(user=self.user).order_by("-created_at", "-id").values_list("id", flat=True)
+        )
+        res = client.get("/api/reports/notifications/", {"ordering": "message"})
+        self.assertEqual([n["id"] for n in res.data["results"]], expected)
+
+        for viewset in (ReportViewSet, NotificationViewSet, ActivityLogViewSet, ReportResolutionLogViewSet):
+            self.assertNotIn(filters.OrderingFilter, viewset.filter_backends, viewset.__name__)
+
+
+class NotificationListTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.finder = User.objects.create_user(username="finder", password="pass")
+        cls.first = User.objects.create_user(username="first", password="pass", first_name="Ann")
+        cls.latest = User.objects.create_user(username="latest", password="pass", first_name="Ben", last_name="Cruz")
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.finder)
+
+    def test_latest_claimant_and_query_count(self):
+        for i in range(4):
+            report = make_report(self.finder, "found", f"Item {i}")
+            Claim.objects.create(report=report, claimed_by=self.first)
+            Claim.objects.create(report=report, claimed_by=self.latest)
+            Notification.objects.create(user=self.finder, triggered_by=self.latest, message="claim", related_report=report)
+
+        with self.assertNumQueries(1):
+            res = self.client.get("/api/reports/notifications/")
+
+        self.assertEqual(len(res.data["results"]), 4)
+        for notif in res.data["results"]:
+            self.assertEqual(
+                notif["claimed_by"],
+                {"id": str(self.latest.id), "first_name": "Ben", "last_name": "Cruz"},
+            )
+
+    def test_claimed_by_is_none_without_claims(self):
+        Notification.objects.create(user=self.finder, message="hello")
+        res = self.client.get("/api/reports/notifications/")
+        self.assertIsNone(res.data["results"][0]["claimed_by"])
+
+
+class UnreadCountTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username="reader", password="pass")
+        cls.other = User.objects.create_user(username="other", password="pass")
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def unread_count(self):
+        with self.assertNumQueries(1):
+            res = self.client.get("/api/reports/notifications/unread-count/")
+        return res.data["unread_count"]
+
+    def test_counter_follows_inserts_updates_and_deletes(self):
+        self.assertEqual(self.unread_count(), 0)
+
+        Notification.objects.bulk_create(
+            [Notification(user=self.user, message=f"n{i}") for i in range(5)]
+            + [Notification(user=self.other, message="x")]
+        )
+        self.assertEqual(self.unread_count(), 5)
+
+        first, second = Notification.objects.filter(user=self.user).order_by("id")[:2]
+        first.is_read = True
+        first.save(update_fields=["is_read"])
+        self.assertEqual(self.unread_count(), 4)
+
+        Notification.objects.filter(user=self.user).update(is_read=True)
+        self.assertEqual(self.unread_count(), 0)
+
+        second.is_read = False
+        second.save(update_fields=["is_read"])
+        self.assertEqual(self.unread_count(), 1)
+
+        Notification.objects.filter(user=self.user).delete()
+        self.assertEqual(self.unread_count(), 0)
+        self.assertEqual(NotificationCounter.objects.get(user=self.other).unread, 1)
+
+
+class RecordingBroker:
+    def __init__(self):
+        self.events = []
+
+    def publish(self, user_id, event):
+        self.events.append((user_id, event))
+
+
+@override_settings(ACTIVITY_LOG_FLUSH_INTERVAL=0)
+class NotificationStreamTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.finder = User.objects.create_user(username="finder", password="pass")
+        cls.claimer = User.objects.create_user(username="claimer", password="pass")
+        cls.report = make_report(cls.finder, "found", "Umbrella")
+
+    def test_claim_pushes_notification_and_unread_count_on_commit(self):
+        broker = RecordingBroker()
+        client = APIClient()
+        client.force_authenticate(self.claimer)
+
+        with mock.patch("reports.events._broker", broker), self.captureOnCommitCallbacks(execute=True):
+            client.post(f"/api/reports/reports/{self.report.id}/claim_item/", {"message": "mine"})
+
+        self.assertEqual([event["type"] for _, event in broker.events], ["notification", "unread_count"])
+        self.assertTrue(all(user_id == self.finder.id for user_id, _ in broker.events))
+        self.assertEqual(broker.events[0][1]["data"]["detailed_message"], "mine")
+        self.assertEqual(broker.events[1][1]["data"], {"unread_count": 1})
+
+    def test_in_process_broker_delivers_across_threads(self):
+        broker = InProcessBroker()
+
+        async def listen():
+            queue = broker.subscribe(self.finder.id)
+            threading.Thread(target=broker.publish, args=(self.finder.id, {"type": "ping"})).start()
+            event = await asyncio.wait_for(queue.get(), timeout=1)
+            broker.unsubscribe(self.finder.id, queue)
+            return event
+
+        self.assertEqual(asyncio.run(listen()), {"type": "ping"})
+        broker.publish(self.finder.id, {"type": "nobody listening"})
+
+
+class NotificationStreamConnectionTests(TransactionTestCase):
+    """Outside a test transaction: the stream closes its database connection."""
+
+    async def test_stream_requires_auth_and_starts_with_unread_count(self):
+        finder = await sync_to_async(User.objects.create_user)(username="finder", password="pass")
+        token = await Token.objects.acreate(user=finder)
+        client = AsyncClient()
+        res = await client.get("/api/reports/notifications/stream/")
+        self.assertEqual(res.status_code, 401)
+
+        res = await client.post(
+            "/api/reports/notifications/stream-ticket/", headers={"Authorization": f"Token {token.key}"}
+        )
+        res = await client.get("/api/reports/notifications/stream/", {"ticket": res.json()["ticket"]})
+        self.assertEqual(res["Content-Type"], "text/event-stream")
+        first = await anext(aiter(res.streaming_content))
+        self.assertEqual(first, b'event: unread_count\ndata: {"unread_count": 0}\n\n')
+
+        # Still streaming, and no connection is held for it
+        self.assertIsNone(await sync_to_async(lambda: connection.connection)())
+        await res.streaming_content.aclose()
+
+    async def test_stream_only_accepts_a_fresh_ticket(self):
+        finder = await sync_to_async(User.objects.create_user)(username="finder", password="pass")
+        token = await Token.objects.acreate(user=finder)
+        with mock.patch.object(
+            signing.TimestampSigner, "timestamp",
+            return_value=signing.b62_encode(int(time.time()) - STREAM_TICKET_MAX_AGE - 1),
+        ):
+            expired = signing.dumps(str(finder.pk), salt=STREAM_TICKET_SALT)
+        other_purpose = signing.dumps(str(finder.pk))
+
+        client = AsyncClient()
+        for params in ({"token": token.key}, {"ticket": expired}, {"ticket": other_purpose}):
+            res = await client.get("/api/reports/notifications/stream/", params)
+            self.assertEqual(res.status_code, 401, params)
+
+
+class FailingPhotoBackend:
+    def upload(self, data, filename):
+        raise ConnectionError("upload service down")
+
+
+@override_settings(PHOTO_UPLOAD_BACKEND="reports.uploads.LocalPhotoBackend", PHOTO_UPLOAD_WORKERS=0)
+class PhotoUploadTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username="owner", password="pass")
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        media = tempfile.TemporaryDirectory()
+        self.addCleanup(media.cleanup)
+        self.media_root = media.name
+
+    def create_report(self, photo=b"not-an-image"):
+        with self.settings(MEDIA_ROOT=self.media_root), self.captureOnCommitCallbacks() as callbacks:
+            res = self.client.post("/api/reports/reports/", {
+                "type": "lost",
+                "item_name": "Wallet",
+                "description": "Brown leather",
+                "category": "Accessories",
+                "location_last_seen": "Canteen",
+                "photo": SimpleUploadedFile("wallet.jpg", photo, content_type="image/jpeg"),
+            }, format="multipart")
+        self.assertEqual(res.status_code, 201)
+        return res, callbacks
+
+    def run_uploads(self, callbacks):
+        with self.settings(MEDIA_ROOT=self.media_root):
+            for callback in callbacks:
+                callback()
+
+    def open_stored(self, url):
+        return Image.open(os.path.join(self.media_root, url.removeprefix("/media/")))
+
+    def test_report_is_created_before_the_upload_runs(self):
+        res, callbacks = self.create_report()
+        item = Item.objects.get(report_id=res.data["id"])
+        self.assertEqual((item.photo_status, item.photo_url), ("pending", None))
+
+        self.run_uploads(callbacks)
+
+        item.refresh_from_db()
+        self.assertEqual(item.photo_status, "uploaded")
+        self.assertTrue(item.photo_url.startswith("/media/uploads/"))
+        # Not an image Pillow can read: stored untouched, no thumbnail
+        stored = os.path.join(self.media_root, item.photo_url.removeprefix("/media/"))
+        with open(stored, "rb") as f:
+            self.assertEqual(f.read(), b"not-an-image")
+        self.assertIsNone(item.thumbnail_url)
+
+    def test_photo_is_stripped_capped_reencoded_and_thumbnailed(self):
+        exif = Image.Exif()
+        exif[0x0112] = 6  # orientation: rotate 90° clockwise
+        exif[0x010F] = "PhoneMaker"
+        jpeg = io.BytesIO()
+        Image.new("RGB", (3000, 2000), "navy").save(jpeg, format="JPEG", exif=exif)
+
+        res, callbacks = self.create_report(jpeg.getvalue())
+        self.run_uploads(callbacks)
+        item = Item.objects.get(report_id=res.data["id"])
+
+        full = self.open_stored(item.photo_url)
+        self.assertEqual(full.format, "WEBP")
+        self.assertEqual(full.size, (1067, 1600))
+        self.assertEqual(len(full.getexif()), 0)
+
+        thumbnail = self.open_stored(item.thumbnail_url)
+        self.assertEqual(thumbnail.size, (267, 400))
+
+        card = self.client.get("/api/reports/reports/").data["results"][0]
+        self.assertEqual(card["lost_item"]["thumbnail_url"], item.thumbnail_url)
+
+    @override_settings(PHOTO_UPLOAD_BACKEND="reports.tests.FailingPhotoBackend")
+    def test_failed_upload_is_recorded(self):
+        res, callbacks = self.create_report()
+        with self.assertLogs("reports.uploads", "ERROR"):
+            for callback in callbacks:
+                callback()
+        self.assertEqual(Item.objects.get(report_id=res.data["id"]).photo_status, "failed")
+
+
+@override_settings(ACTIVITY_LOG_FLUSH_INTERVAL=0, MATCH_WORKERS=0)
+class MatchingTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = User.objects.create_user(username="admin", password="pass", is_staff=True, user_type="admin")
+        cls.loser = User.objects.create_user(username="loser", password="pass")
+        cls.finder = User.objects.create_user(username="finder", password="pass")
+        cls.found = make_report(cls.finder, "found", "Black umbrella", "Folding umbrella with wooden handle", category="Umbrellas")
+        Item.objects.filter(report=cls.found).update(location="Gym lobby")
+        cls.unrelated = make_report(cls.finder, "found", "Scientific calculator", "Casio", category="Electronics")
+
+    def create_lost_report(self):
+        client = APIClient()
+        client.force_authenticate(self.loser)
+        with self.captureOnCommitCallbacks(execute=True):
+            res = client.post("/api/reports/reports/", {
+                "type": "lost",
+                "item_name": "Black umbrela",
+                "description": "Umbrella with a wooden handle",
+                "category": "Umbrellas",
+                "location_last_seen": "Gym",
+            })
+        return Report.objects.get(id=res.data["id"])
+
+    def test_new_report_is_indexed_and_approval_notifies_owner(self):
+        lost = self.create_lost_report()
+
+        match = MatchCandidate.objects.get(lost_report=lost)
+        self.assertEqual(match.found_report, self.found)
+        self.assertGreaterEqual(match.score, 0.6)
+        # Still pending moderation: nobody is told yet
+        self.assertFalse(Notification.objects.filter(user=self.loser).exists())
+
+        admin = APIClient()
+        admin.force_authenticate(self.admin)
+        with self.captureOnCommitCallbacks(execute=True):
+            admin.patch(f"/api/reports/reports/{lost.id}/approve/")
+            admin.patch(f"/api/reports/reports/{lost.id}/approve/")
+
+        notification = Notification.objects.get(user=self.loser)
+        self.assertEqual(notification.related_report, self.found)
+
+        res = APIClient().get(f"/api/reports/reports/{lost.id}/matches/")
+        self.assertEqual([m["report"]["id"] for m in res.data], [self.found.id])
+
+    def test_query_terms_keep_the_item_name_words(self):
+        description = " ".join(f"aa{i}" for i in range(40)) + " strap strap"
+        terms = _query_terms(Item(item_name="Zebra wallet", description=description))
+        self.assertEqual(terms[:3], ["zebra", "wallet", "strap"])
+        self.assertEqual(len(terms), MAX_QUERY_TERMS)
+
+    def test_rejecting_drops_candidates(self):
+        lost = self.create_lost_report()
+        admin = APIClient()
+        admin.force_authenticate(self.admin)
+        with self.captureOnCommitCallbacks(execute=True):
+            admin.patch(f"/api/reports/reports/{lost.id}/reject/")
+        self.assertFalse(MatchCandidate.objects.exists())
+
+    def test_reindex_command_rebuilds_index(self):
+        lost = self.create_lost_report()
+        MatchCandidate.objects.all().delete()
+        call_command("reindex_matches", stdout=io.StringIO())
+        self.assertEqual(
+            list(MatchCandidate.objects.values_list("lost_report", "found_report")),
+            [(lost.id, self.found.id)],
+        )
+
+
+@override_settings(ACTIVITY_LOG_FLUSH_INTERVAL=0, MATCH_WORKERS=0)
+class ReportResponseCacheTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = User.objects.create_user(username="admin", password="pass", is_staff=True, user_type="admin")
+        cls.report = make_report(cls.admin, "lost", "Wallet", status="pending")
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+
+    def test_repeat_requests_are_served_from_cache_and_revalidate(self):
+        url = "/api/reports/reports/?status=pending"
+        first = self.client.get(url)
+        with self.assertNumQueries(0):
+            second = self.client.get(url)
+        self.assertEqual(second.data, first.data)
+
+        with self.assertNumQueries(0):
+            not_modified = self.client.get(url, HTTP_IF_NONE_MATCH=first["ETag"])
+        self.assertEqual(not_modified.status_code, 304)
+
+    def test_moderation_invalidates_cached_feed_and_detail(self):
+        detail = f"/api/reports/reports/{self.report.id}/"
+        etag = self.client.get(detail)["ETag"]
+        self.assertEqual(len(self.client.get("/api/reports/reports/?status=pending").data["results"]), 1)
+
+        admin = APIClient()
+        admin.force_authenticate(self.admin)
+        with self.captureOnCommitCallbacks(execute=True):
+            admin.patch(f"/api/reports/reports/{self.report.id}/approve/")
+
+        self.assertEqual(len(self.client.get("/api/reports/reports/?status=pending").data["results"]), 0)
+        res = self.client.get(detail, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(res.status_code, 200)
+        self.assertEqual(res.data["status"], "approved")
+
+
+@override_settings(ACTIVITY_LOG_FLUSH_INTERVAL=60, ACTIVITY_LOG_BATCH_SIZE=100, MATCH_WORKERS=0)
+class ActivityLogWriterTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = User.objects.create_user(
+            username="admin", password="pass", is_staff=True, user_type="admin", first_name="Ada", last_name="Min"
+        )
+        cls.owner = User.objects.create_user(username="owner", password="pass", first_name="Olga", last_name="Wner")
+        cls.reports = [make_report(cls.owner, "lost", f"Wallet {i}", status="pending") for i in range(3)]
+
+    def setUp(self):
+        cache.clear()
+        self.addCleanup(activity_writer.flush)
+        self.admin_client = APIClient()
+        self.admin_client.force_authenticate(self.admin)
+
+    def test_moderation_buffers_logs_and_flushes_them_in_one_insert(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            for report in self.reports:
+                self.admin_client.patch(f"/api/reports/reports/{report.id}/approve/")
+
+        self.assertFalse(ActivityLog.objects.exists())
+        self.assertEqual(activity_writer.pending, 3)
+
+        with self.assertNumQueries(1):
+            self.assertEqual(activity_writer.flush(), 3)
+
+        log = ActivityLog.objects.get(report=self.reports[0])
+        self.assertEqual((log.event_type, log.target_user, log.item_name), ("report_approved", self.owner, "Wallet 0"))
+
+    def test_rolled_back_requests_are_not_logged(self):
+        with self.captureOnCommitCallbacks(execute=False):
+            self.admin_client.patch(f"/api/reports/reports/{self.reports[0].id}/approve/")
+        self.assertEqual(activity_writer.pending, 0)
+
+    def test_feed_renders_messages_at_read_time(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.admin_client.patch(f"/api/reports/reports/{self.reports[0].id}/reject/")
+        activity_writer.flush()
+        ActivityLog.objects.create(user=self.admin, action="Legacy preformatted entry")
+
+        res = self.admin_client.get("/api/reports/activity-logs/")
+        self.assertEqual(
+            [log["action"] for log in res.data["results"]],
+            [
+                "Legacy preformatted entry",
+                "Ada Min (admin) rejected lost report for Olga Wner's item \"Wallet 0\"",
+            ],
+        )
+
+
+class ActivityLogFeedTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = User.objects.create_user(username="admin", password="pass", is_staff=True, user_type="admin")
+        cls.owner = User.objects.create_user(username="owner", password="pass")
+        cls.other = User.objects.create_user(username="other", password="pass")
+        cls.report = make_report(cls.owner, "found", "Keys")
+        now = timezone.now()
+
+        def log(user, event_type, days_ago, report=None):
+            return ActivityLog.objects.create(
+                user=user, event_type=event_type, report=report,
+                report_owner=report.reported_by if report else None,
+                item_name="Keys" if report else "", created_at=now - timedelta(days=days_ago),
+            )
+
+        cls.approved = log(cls.admin, "report_approved", 10, cls.report)
+        cls.claim = log(cls.other, "claim_requested", 2, cls.report)
+        cls.role_change = log(cls.admin, "role_changed", 1)
+
+    def feed(self, user, query=""):
+        client = APIClient()
+        client.force_authenticate(user)
+        return [log["id"] for log in client.get(f"/api/reports/activity-logs/{query}").data["results"]]
+
+    def test_filters_by_event_type_and_date_range(self):
+        self.assertEqual(
+            self.feed(self.admin, "?event_type=report_approved,claim_requested"),
+            [self.claim.id, self.approved.id],
+        )
+        since = (timezone.now() - timedelta(days=5)).isoformat()
+        self.assertEqual(
+            self.feed(self.admin, "?" + urlencode({"created_after": since})),
+            [self.role_change.id, self.claim.id],
+        )
+
+    def test_students_see_their_own_and_their_reports_activity(self):
+        self.assertEqual(self.feed(self.owner), [self.claim.id, self.approved.id])
+        self.assertEqual(self.feed(self.other), [self.claim.id])
+
+    def test_feed_page_is_one_query_with_light_report(self):
+        client = APIClient()
+        client.force_authenticate(self.admin)
+        with self.assertNumQueries(1):
+            res = client.get("/api/reports/activity-logs/")
+        entry = res.data["results"][-1]
+        self.assertEqual(set(entry["report"]), {"id", "type", "status", "date_time"})
+        self.assertEqual(entry["item_name"], "Keys")
+
+
+class PartitionRetentionTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username="user", password="pass")
+        cls.old = Notification.objects.create(user=cls.user, message="Ancient news")
+        cls.recent = Notification.objects.create(user=cls.user, message="Fresh news")
+
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT ensure_month_partition('reports_notification', '2024-01-01')")
+        # Moves the row into the January 2024 partition
+        Notification.objects.filter(pk=cls.old.pk).update(created_at=datetime(2024, 1, 15, tzinfo=dt_timezone.utc))
+
+    def test_old_partitions_are_archived_and_dropped(self):
+        with tempfile.TemporaryDirectory() as archive_dir, override_settings(PARTITION_ARCHIVE_DIR=archive_dir):
+            call_command("archive_partitions", table=["reports_notification"], stdout=io.StringIO())
+
+            with gzip.open(os.path.join(archive_dir, "reports_notification_p2024_01.csv.gz"), "rt") as archive:
+                self.assertIn("Ancient news", archive.read())
+
+        self.assertEqual(list(Notification.objects.values_list("id", flat=True)), [self.recent.id])
+        self.assertEqual(NotificationCounter.objects.get(user=self.user).unread, 1)
+
+        month = timezone.now().strftime("%Y_%m")
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT to_regclass(%s), to_regclass('reports_notification_p2024_01')", [f"reports_notification_p{month}"])
+            self.assertEqual(cursor.fetchone(), (f"reports_notification_p{month}", None))
+
+    def test_feed_only_reads_partitions_inside_the_retention_window(self):
+        client = APIClient()
+        client.force_authenticate(self.user)
+        with CaptureQueriesContext(connection) as queries:
+            res = client.get("/api/reports/notifications/")
+        self.assertEqual([n["id"] for n in res.data["results"]], [self.recent.id])
+
+        feed_sql = next(q["sql"] for q in queries.captured_queries if 'FROM "reports_notification"' in q["sql"])
+        with connection.cursor() as cursor:
+            cursor.execute("EXPLAIN " + feed_sql)
+            plan = "\n".join(row[0] for row in cursor.fetchall())
+        self.assertNotIn("reports_notification_p2024_01", plan)
+
+    def test_dry_run_keeps_partitions(self):
+        out = io.StringIO()
+        with tempfile.TemporaryDirectory() as parent:
+            archive_dir = os.path.join(parent, "archive")
+            with override_settings(PARTITION_ARCHIVE_DIR=archive_dir):
+                call_command("archive_partitions", table=["reports_notification"], dry_run=True, stdout=out)
+            self.assertFalse(os.path.exists(archive_dir))
+        self.assertIn("Would archive reports_notification_p2024_01", out.getvalue())
+        self.assertEqual(Notification.objects.count(), 2)
+
+
+@override_settings(ACTIVITY_LOG_FLUSH_INTERVAL=0, MATCH_WORKERS=0)
+class BulkModerationTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = User.objects.create_user(username="admin", password="pass", is_staff=True, user_type="admin")
+        cls.owner = User.objects.create_user(username="owner", password="pass")
+        cls.pending = [make_report(cls.owner, "lost", f"Bag {i}", status="pending") for i in range(3)]
+        cls.approved = make_report(cls.owner, "found", "Cap")
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.client.force_authenticate(self.admin)
+
+    def moderate(self, payload):
+        with self.captureOnCommitCallbacks(execute=True):
+            return self.client.post("/api/reports/reports/bulk-moderate/", payload, format="json")
+
+    def test_approve_by_ids_reports_per_id_results(self):
+        ids = [r.id for r in self.pending] + [self.approved.id, 999999]
+        res = self.moderate({"action": "approve", "ids": ids})
+
+        self.assertEqual(
+            [r["result"] for r in res.data["results"]],
+            ["approved", "approved", "approved", "unchanged", "not_found"],
+        )
+        self.assertEqual(res.data["changed"], 3)
+        self.assertEqual(Report.objects.filter(status="approved").count(), 4)
+        self.assertEqual(
+            ActivityLog.objects.filter(event_type="report_approved", report_owner=self.owner).count(), 3
+        )
+        self.assertEqual(NotificationCounter.objects.get(user=self.owner).unread, 3)
+
+    @override_settings(ACTIVITY_LOG_FLUSH_INTERVAL=60, MATCH_WORKERS=2)
+    def test_status_change_and_notifications_are_single_statements(self):
+        self.addCleanup(activity_writer.flush)
+
+        def reject(reports):
+            payload = {"action": "reject", "ids": [r.id for r in reports]}
+            with mock.patch("reports.matching._get_executor") as executor, \
+                    CaptureQueriesContext(connection) as queries, self.captureOnCommitCallbacks(execute=True):
+                self.client.post("/api/reports/reports/bulk-moderate/", payload, format="json")
+            (_, report_ids), _ = executor.return_value.submit.call_args
+            self.assertEqual(sorted(report_ids), sorted(r.id for r in reports))
+            return [q["sql"] for q in queries.captured_queries]
+
+        statements = reject(self.pending[1:])
+        self.assertEqual(sum(s.startswith('UPDATE "reports_report"') for s in statements), 1)
+        self.assertEqual(sum(s.startswith('INSERT INTO "reports_notification"') for s in statements), 1)
+        # Rescoring is handed to the match workers, so the batch size doesn't matter
+        self.assertFalse([s for s in statements if "reports_matchcandidate" in s])
+        self.assertEqual(len(reject(self.pending[:1])), len(statements))
+
+    def test_filter_selects_reports_and_delete_logs_without_report(self):
+        res = self.moderate({"action": "delete", "filter": {"status": "pending", "type": "lost"}})
+
+        self.assertEqual(sorted(r["id"] for r in res.data["results"]), sorted(r.id for r in self.pending))
+        self.assertEqual(list(Report.objects.all()), [self.approved])
+        log = ActivityLog.objects.filter(event_type="report_deleted").order_by("item_name").first()
+        self.assertEqual(log.render_action(), "admin (admin) deleted owner's report for \"Bag 0\"")
+
+    def test_requires_admin_and_valid_payload(self):
+        self.assertEqual(self.moderate({"action": "archive", "ids": [1]}).status_code, 400)
+        self.assertEqual(self.moderate({"action": "approve"}).status_code, 400)
+
+        student = APIClient()
+        student.force_authenticate(self.owner)
+        res = student.post("/api/reports/reports/bulk-moderate/", {"action": "approve", "ids": [1]}, format="json")
+        self.assertEqual(res.status_code, 403)
+
+
+class BulkNotificationTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username="user", password="pass")
+        cls.other = User.objects.create_user(username="other", password="pass")
+        Notification.objects.bulk_create(
+            [Notification(user=cls.user, message=f"Note {i}") for i in range(5)]
+            + [Notification(user=cls.other, message="Someone else's")]
+        )
+        cls.notes = list(Notification.objects.filter(user=cls.user).order_by("id"))
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def unread(self, user):
+        return NotificationCounter.objects.get(user=user).unread
+
+    def test_mark_all_read_is_one_update(self):
+        with CaptureQueriesContext(connection) as queries:
+            res = self.client.post("/api/reports/notifications/mark-read/", format="json")
+        self.assertEqual(res.data, {"updated": 5, "unread_count": 0})
+        self.assertEqual(sum(q["sql"].startswith("UPDATE") for q in queries.captured_queries), 1)
+        self.assertEqual((self.unread(self.user), self.unread(self.other)), (0, 1))
+
+    def test_mark_read_up_to_timestamp(self):
+        cutoff = timezone.now() - timedelta(hours=1)
+        Notification.objects.filter(pk__in=[n.pk for n in self.notes[:2]]).update(created_at=cutoff - timedelta(minutes=1))
+
+        res = self.client.post("/api/reports/notifications/mark-read/", {"before": cutoff.isoformat()}, format="json")
+        self.assertEqual(res.data["updated"], 2)
+        self.assertEqual(self.unread(self.user), 3)
+
+    def test_clear_selected_and_all_in_one_delete(self):
+        res = self.client.post("/api/reports/notifications/clear/", {"ids": [self.notes[0].id]}, format="json")
+        self.assertEqual(res.data, {"deleted": 1, "unread_count": 4})
+
+        with CaptureQueriesContext(connection) as queries:
+            res = self.client.post("/api/reports/notifications/clear/", format="json")
+        self.assertEqual(res.data["deleted"], 4)
+        self.assertEqual(sum(q["sql"].startswith("DELETE") for q in queries.captured_queries), 1)
+        self.assertEqual(Notification.objects.filter(user=self.other).count(), 1)
+
+    def test_clear_up_to_timestamp(self):
+        cutoff = timezone.now() - timedelta(hours=1)
+        Notification.objects.filter(pk__in=[n.pk for n in self.notes[:2]]).update(created_at=cutoff - timedelta(minutes=1))
+
+        res = self.client.post(
+            "/api/reports/notifications/clear/", {"before": cutoff.isoformat(), "ids": [self.notes[1].id]}, format="json"
+        )
+        self.assertEqual(res.data, {"deleted": 1, "unread_count": 4})
+        self.assertFalse(Notification.objects.filter(pk=self.notes[1].pk).exists())
+
+    def test_partial_update_marks_single_notification(self):
+        res = self.client.patch(f"/api/reports/notifications/{self.notes[0].id}/", {"is_read": True}, format="json")
+        self.assertEqual(res.status_code, 200)
+        self.assertEqual(self.unread(self.user), 4)
+
+    def test_rejects_bad_selection(self):
+        res = self.client.post("/api/reports/notifications/mark-read/", {"before": "yesterday"}, format="json")
+        self.assertEqual(res.status_code, 400)
+
+
+class BenchmarkHarnessTests(TransactionTestCase):
+    def test_seed_and_benchmark_write_a_comparable_baseline(self):
+        call_command(
+            "seed_benchmark", users=6, reports=30, claims=10, notifications=40, logs=40, months=2, stdout=io.StringIO()
+        )
+        self.assertEqual(Report.objects.count(), 30)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            baseline = os.path.join(tmp, "baseline.json")
+            call_command(
+                "bench_api", requests=4, concurrency=2, warmup=0, endpoint=BENCH_SCENARIOS, output=baseline,
+                stdout=io.StringIO(),
+            )
+            with open(baseline) as f:
+                endpoints = json.load(f)["endpoints"]
+
+            self.assertEqual(endpoints["unread_count"]["queries_per_request"], 1)
+            self.assertTrue(all(result["errors"] == 0 for result in endpoints.values()), endpoints)
+            # Benchmark writes are rolled back
+            self.assertEqual(Claim.objects.count(), 10)
+            self.assertFalse(ReportResolutionLog.objects.exists())
+
+            out = io.StringIO()
+            call_command(
+                "bench_api", requests=4, concurrency=2, warmup=0, endpoint=["unread_count"],
+                baseline=baseline, tolerance=100, stdout=out,
+            )
+            self.assertIn("No regressions", out.getvalue())
+
+
+class QueryPlanTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        call_command(
+            "seed_benchmark", users=6, reports=40, claims=15, notifications=60, logs=60, months=2, stdout=io.StringIO()
+        )
+
+    def test_hot_endpoints_never_scan_whole_tables(self):
+        out = io.StringIO()
+        call_command("check_query_plans", samples=4, stdout=out)
+        self.assertIn("No full table scans", out.getvalue())
+
+    def sql(self, queryset):
+        return queryset.query.sql_with_params()
+
+    def test_detects_queries_no_index_can_serve(self):
+        self.assertEqual(sequential_scans(*self.sql(Claim.objects.filter(message="mine"))), ["reports_claim"])
+        # Walking the primary key instead is still a full scan
+        self.assertEqual(sequential_scans(*self.sql(Claim.objects.filter(message="mine").order_by("id"))), ["reports_claim"])
+
+    def test_indexed_lookups_and_limited_feeds_pass(self):
+        user = User.objects.filter(username__startswith="bench_").first()
+        self.assertEqual(sequential_scans(*self.sql(Claim.objects.filter(claimed_by=user).order_by("-date_claimed"))), [])
+        self.assertEqual(sequential_scans(*self.sql(Report.objects.order_by("-date_time", "-id")[:5])), [])
+        self.assertEqual(sequential_scans(*self.sql(Report.objects.filter(type="lost", status="approved").order_by("-date_time", "-id"))), [])
+
+
+@override_settings(ACTIVITY_LOG_FLUSH_INTERVAL=0)
+class ResolveReportTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.owner = User.objects.create_user(username="owner", password="pass", first_name="Ana", last_name="Cruz")
+        cls.claimant = User.objects.create_user(username="claimant", password="pass", first_name="Ben", last_name="Lim")
+        cls.report = make_report(cls.owner, "lost", "Blue umbrella")
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.client.force_authenticate(self.owner)
+
+    def resolve(self, report_id, claimant_id):
+        return self.client.post(
+            f"/api/reports/reports/{report_id}/resolve/", {"claimant_id": str(claimant_id)}, format="json"
+        )
+
+    def test_resolution_is_logged_as_a_structured_event_by_the_migrated_trigger(self):
+        res = self.resolve(self.report.id, self.claimant.id)
+        self.assertEqual(res.status_code, 200, res.data)
+
+        self.report.refresh_from_db()
+        self.assertEqual(self.report.status, "resolved")
+        resolution = ReportResolutionLog.objects.get(report=self.report)
+        self.assertEqual((resolution.report_title, resolution.claimed_by_id), ("Blue umbrella", self.claimant.id))
+
+        log = ActivityLog.objects.get(event_type="report_resolved")
+        self.assertEqual(
+            (log.user_id, log.target_user_id, log.report_owner_id, log.item_name, log.action),
+            (self.owner.id, self.claimant.id, self.owner.id, "Blue umbrella", ""),
+        )
+        self.assertEqual(log.render_action(), 'Ben Lim gave "Blue umbrella" to Ana Cruz')
+
+    def test_procedure_errors_map_to_api_errors(self):
+        self.assertEqual(self.resolve(999999, self.claimant.id).status_code, 404)
+        self.assertEqual(self.resolve(self.report.id, "00000000-0000-0000-0000-000000000000").status_code, 400)
+        self.assertFalse(ReportResolutionLog.objects.exists())
+
+
+@override_settings(ACTIVITY_LOG_FLUSH_INTERVAL=0, MATCH_WORKERS=0)
+class DashboardStatsTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = User.objects.create_user(username="admin", password="pass", is_staff=True, user_type="admin")
+        cls.owner = User.objects.create_user(username="owner", password="pass")
+        cls.claimant = User.objects.create_user(username="claimant", password="pass")
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.client.force_authenticate(self.admin)
+
+    def rollup(self):
+        return {
+            (r.day, r.type, r.category, r.status): r.reports
+            for r in ReportRollup.objects.exclude(reports=0)
+        }
+
+    def recount(self):
+        counts = {}
+        for report in Report.objects.select_related("item"):
+            item = report.get_item()
+            key = (report.date_time.date(), report.type, item.category if item else "", report.status)
+            counts[key] = counts.get(key, 0) + 1
+        return counts
+
+    def at(self, report, when):
+        Report.objects.filter(pk=report.pk).update(date_time=when)
+
+    def test_rollup_follows_creates_moderation_edits_resolution_and_deletes(self):
+        bag = make_report(self.owner, "lost", "Bag", category="Bags", status="pending")
+        phone = make_report(self.owner, "found", "Phone", category="Electronics", status="pending")
+        bare = Report.objects.create(reported_by=self.owner, type="lost")
+        self.assertEqual(self.rollup(), self.recount())
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post(
+                "/api/reports/reports/bulk-moderate/", {"action": "approve", "ids": [bag.id, phone.id]}, format="json"
+            )
+        Item.objects.filter(report=phone).update(category="Phones")
+        self.at(bare, datetime(2026, 1, 5, 23, 30, tzinfo=dt_timezone.utc))
+        self.assertEqual(self.rollup(), self.recount())
+
+        owner = APIClient()
+        owner.force_authenticate(self.owner)
+        res = owner.post(f"/api/reports/reports/{bag.id}/resolve/", {"claimant_id": str(self.claimant.id)}, format="json")
+        self.assertEqual(res.status_code, 200, res.data)
+        self.assertEqual(self.rollup(), self.recount())
+        resolution = ResolutionRollup.objects.get()
+        self.assertEqual((resolution.type, resolution.category, resolution.resolutions), ("lost", "Bags", 1))
+
+        Item.objects.filter(report=phone).delete()
+        self.assertEqual(self.rollup(), self.recount())
+        bag.delete()
+        bare.delete()
+        self.assertEqual(self.rollup(), self.recount())
+        # Resolutions are history: deleting the report keeps them
+        self.assertEqual(ResolutionRollup.objects.get().resolutions, 1)
+
+    def test_totals_categories_and_buckets(self):
+        jan_5 = make_report(self.owner, "lost", "Bag", category="Bags", status="pending")
+        jan_20 = make_report(self.owner, "lost", "Wallet", category="Bags")
+        feb_3 = make_report(self.owner, "found", "Phone", category="Electronics")
+        self.at(jan_5, datetime(2026, 1, 5, 10, tzinfo=dt_timezone.utc))
+        self.at(jan_20, datetime(2026, 1, 20, 10, tzinfo=dt_timezone.utc))
+        self.at(feb_3, datetime(2026, 2, 3, 10, tzinfo=dt_timezone.utc))
+        Report.objects.filter(pk=feb_3.pk).update(status="resolved")
+
+        res = self.client.get("/api/reports/stats/", {"bucket": "month", "until": "2026-06-30"})
+        self.assertEqual(res.status_code, 200, res.data)
+        self.assertEqual(
+            res.data["totals"],
+            {"reports": 3, "lost": 2, "found": 1, "pending": 1, "approved": 1, "rejected": 0, "resolved": 1},
+        )
+        self.assertEqual(res.data["resolution_rate"], 0.3333)
+        self.assertEqual(
+            [(c["category"], c["reports"], c["lost"], c["found"]) for c in res.data["categories"]],
+            [("Bags", 2, 2, 0), ("Electronics", 1, 0, 1)],
+        )
+        self.assertEqual(
+            [(s["start"].isoformat(), s["reports"]) for s in res.data["series"]],
+            [("2026-01-01", 2), ("2026-02-01", 1)],
+        )
+
+        res = self.client.get("/api/reports/stats/", {"bucket": "week", "since": "2026-01-06", "until": "2026-06-30"})
+        self.assertEqual(
+            [(s["start"].isoformat(), s["reports"]) for s in res.data["series"]],
+            [("2026-01-19", 1), ("2026-02-02", 1)],
+        )
+
+    def test_time_to_resolve_is_bucketed_by_resolution_day(self):
+        report = make_report(self.owner, "lost", "Umbrella")
+        self.at(report, timezone.now() - timedelta(days=2))
+        owner = APIClient()
+        owner.force_authenticate(self.owner)
+        owner.post(f"/api/reports/reports/{report.id}/resolve/", {"claimant_id": str(self.claimant.id)}, format="json")
+
+        res = self.client.get("/api/reports/stats/", {"bucket": "day"})
+        self.assertEqual(res.data["resolutions"], 1)
+        self.assertAlmostEqual(res.data["avg_hours_to_resolve"], 48, delta=0.2)
+        resolved_on = ResolutionRollup.objects.get().day
+        self.assertEqual(
+            [(s["start"], s["resolutions"]) for s in res.data["series"]],
+            [(report.date_time.date() - timedelta(days=2), 0), (resolved_on, 1)],
+        )
+
+    def test_reads_only_the_rollup_tables(self):
+        for i in range(5):
+            make_report(self.owner, "lost", f"Bag {i}", category="Bags")
+        with CaptureQueriesContext(connection) as queries:
+            res = self.client.get("/api/reports/stats/")
+        self.assertEqual(res.status_code, 200)
+        self.assertEqual(res.data["bucket"], "week")
+        statements = [q["sql"] for q in queries.captured_queries]
+        self.assertEqual(len(statements), 3)
+        for sql in statements:
+            self.assertNotIn('"reports_report"', sql)
+            self.assertNotIn('"reports_item"', sql)
+
+    def test_requires_admin_and_valid_params(self):
+        self.assertEqual(self.client.get("/api/reports/stats/", {"bucket": "hour"}).status_code, 400)
+        self.assertEqual(self.client.get("/api/reports/stats/", {"since": "last week"}).status_code, 400)
+        self.assertEqual(self.client.get("/api/reports/stats/", {"since": "2026-02-30"}).status_code, 400)
+        res = self.client.get("/api/reports/stats/", {"since": "2026-03-01", "until": "2026-02-01"})
+        self.assertEqual(res.status_code, 400)
+        self.assertIn("error", res.data)
+
+        student = APIClient()
+        student.force_authenticate(self.owner)
+        self.assertEqual(student.get("/api/reports/stats/").status_code, 403)
+
+
+@override_settings(ACTIVITY_LOG_FLUSH_INTERVAL=60, ACTIVITY_LOG_BATCH_SIZE=100)
+class ActivityLogFlushFailureTests(TransactionTestCase):
+    """Foreign keys are only checked at commit, so this needs real commits."""
+
+    def test_report_deleted_before_flush_keeps_the_batch(self):
+        self.addCleanup(activity_writer.flush)
+        admin = User.objects.create_user(username="admin", password="pass", is_staff=True, user_type="admin")
+        owner = User.objects.create_user(username="owner", password="pass")
+        kept, deleted = make_report(owner, "lost", "Wallet"), make_report(owner, "lost", "Keys")
+
+        log_activity(admin, "report_approved", report=kept, target_user_id=owner.id, item_name="Wallet")
+        log_activity(admin, "report_approved", report=deleted, target_user_id=owner.id, item_name="Keys")
+        Report.objects.filter(pk=deleted.pk).delete()
+
+        self.assertEqual(activity_writer.flush(), 2)
+        self.assertEqual(
+            sorted(ActivityLog.objects.values_list("item_name", "report")),
+            [("Keys", None), ("Wallet", kept.id)],
+        )
+
+
+# Fails the boot as soon as anything opens a database connection
+STARTUP_AUDIT = textwrap.dedent("""
+    import os, sys, traceback
+    from django.db.backends.base import base
+
+    def refuse(self, *args, **kwargs):
+        sys.stderr.write("database connection opened during startup:\\n" + "".join(traceback.format_stack()))
+        os._exit(3)
+
+    base.BaseDatabaseWrapper.connect = refuse
+
+    from backend.asgi import application
+    from django.urls import get_resolver
+    get_resolver().url_patterns  # imports every view module
+
+    import runpy
+    runpy.run_path("gunicorn.conf.py")
+""")
+
+
+class StartupAuditTests(TestCase):
+    def test_worker_boot_makes_no_database_round_trips(self):
+        backend_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        result = subprocess.run(
+            [sys.executable, "-c", STARTUP_AUDIT],
+            cwd=backend_dir,
+            env={**os.environ, "DJANGO_SETTINGS_MODULE": "backend.settings"},
+            capture_output=True,
+            text=True,
+            timeout=60,
+        )
+        self.assertEqual(result.returncode, 0, result.stderr)
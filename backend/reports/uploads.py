@@ -0,0 +1,114 @@
+"""
+Report photo uploads, run off the request path.
+
+perform_create saves the item with photo_status="pending" and hands the file
+to a worker pool; the worker re-encodes it (reports.images), uploads the full
+image and a card thumbnail through the configured backend and fills in
+photo_url/thumbnail_url. settings.PHOTO_UPLOAD_BACKEND picks the backend and
+settings.PHOTO_UPLOAD_WORKERS the pool size (0 uploads inline once the
+transaction commits, which tests rely on).
+"""
+import atexit
+import logging
+import os
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+import cloudinary.uploader
+from django.apps import apps
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.core.files.storage import FileSystemStorage
+from django.db import close_old_connections, transaction
+from django.utils.module_loading import import_string
+
+from .cache import invalidate_report_cache
+from .images import process_photo
+
+logger = logging.getLogger(__name__)
+
+
+class CloudinaryPhotoBackend:
+    folder = "lost_and_found/uploads"
+
+    def upload(self, data, filename):
+        result = cloudinary.uploader.upload(data, folder=self.folder, filename=filename, resource_type="auto")
+        return result["secure_url"]
+
+
+class LocalPhotoBackend:
+    """Filesystem stand-in for Cloudinary (MEDIA_ROOT/uploads), for tests and local dev."""
+
+    def upload(self, data, filename):
+        storage = FileSystemStorage(location=settings.MEDIA_ROOT, base_url=settings.MEDIA_URL)
+        name = storage.save(f"uploads/{uuid.uuid4().hex}-{filename}", ContentFile(data))
+        return storage.url(name)
+
+
+def get_photo_backend():
+    return import_string(settings.PHOTO_UPLOAD_BACKEND)()
+
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor():
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=settings.PHOTO_UPLOAD_WORKERS, thread_name_prefix="photo-upload"
+                )
+                # Let queued uploads finish when the worker process exits
+                atexit.register(_executor.shutdown, wait=True)
+    return _executor
+
+
+def upload_item_photo(model_label, item_id, data, filename):
+    """Upload one photo and record the outcome on the Item row."""
+    model = apps.get_model(model_label)
+    try:
+        backend = get_photo_backend()
+        processed = process_photo(data)
+        if processed:
+            full, thumbnail, extension = processed
+            stem = os.path.splitext(filename)[0]
+            url = backend.upload(full, f"{stem}.{extension}")
+            thumbnail_url = backend.upload(thumbnail, f"{stem}-thumb.{extension}")
+        else:
+            url, thumbnail_url = backend.upload(data, filename), None
+    except Exception:
+        logger.exception("Photo upload failed for %s #%s", model_label, item_id)
+        model.objects.filter(pk=item_id).update(photo_status="failed")
+    else:
+        model.objects.filter(pk=item_id).update(
+            photo_url=url, thumbnail_url=thumbnail_url, photo_status="uploaded"
+        )
+    # Queryset updates skip the model signals, so retire cached feeds here
+    invalidate_report_cache()
+
+
+def _run_in_worker(*args):
+    try:
+        upload_item_photo(*args)
+    finally:
+        # Worker threads are long-lived; apply the same connection aging as requests
+        close_old_connections()
+
+
+def enqueue_photo_upload(item, file):
+    """Schedule `file` for upload to `item` once the creating transaction commits."""
+    # The request's upload handle is gone after the response, so keep the bytes
+    data = file.read()
+    args = (item._meta.label, item.pk, data, getattr(file, "name", None) or "photo")
+
+    def submit():
+        if settings.PHOTO_UPLOAD_WORKERS > 0:
+            _get_executor().submit(_run_in_worker, *args)
+        else:
+            upload_item_photo(*args)
+
+    transaction.on_commit(submit)
@@ -1,6 +1,6 @@
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
-from .views import ReportViewSet, CommentViewSet, ClaimViewSet, NotificationViewSet, resolve_report_view, ReportResolutionLogViewSet, ActivityLogViewSet
+from .views import ReportViewSet, CommentViewSet, ClaimViewSet, NotificationViewSet, resolve_report_view, ReportResolutionLogViewSet, ActivityLogViewSet, notification_stream, report_stats_view
 
 router = DefaultRouter()
 router.register("reports", ReportViewSet)
@@ -12,6 +12,9 @@ router.register(r"activity-logs", ActivityLogViewSet, basename="activity-log")
 
 
 urlpatterns = [
+    # Must precede the router, or "stream" is taken as a notification pk
+    path("notifications/stream/", notification_stream),
+    path("stats/", report_stats_view),
     path("", include(router.urls)),
     path('reports/<int:report_id>/resolve/', resolve_report_view),
 ]
@@ -1,9 +1,8 @@
 from rest_framework import viewsets, permissions, status, filters
 from rest_framework.decorators import action, api_view
 from rest_framework.response import Response
-import cloudinary.uploader
 
-from .models import Report, LostItem, FoundItem, Comment, Claim, Notification
+from .models import Report, Item, Comment, Claim, Notification, MatchCandidate, ActivityLog
 from .serializers import *
 from .permissions import IsOwnerOrReadOnly, IsCommentOwnerOrReportOwnerOrReadOnly, IsAdminOrOwnerOrReadOnly
 from rest_framework.permissions import IsAuthenticated
@@ -17,22 +16,77 @@ from django.db import connection
 from rest_framework.decorators import api_view, permission_classes
 from django.db import connection
 from rest_framework import status as http_status
-import psycopg2
 from django.conf import settings
-from psycopg2.extensions import ISOLATION_LEVEL_AUTOCOMMIT
-from reports.models import ActivityLog
-
-
-class ReportViewSet(viewsets.ModelViewSet):
-    queryset = Report.objects.all().order_by("-date_time")
+from django.core import signing
+from django.db import DatabaseError, OperationalError, transaction
+import logging
+import uuid
+import asyncio
+import json
+from asgiref.sync import sync_to_async
+from django.core.serializers.json import DjangoJSONEncoder
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+from django.http import JsonResponse, StreamingHttpResponse
+from .activity import log_activity, report_item_name
+from .fieldsets import SparseFieldsetMixin
+from .filters import ActivityLogFilter
+from .events import get_broker, publish_unread_count, unread_count_for
+from .cache import cached_response, invalidate_report_cache
+from .matching import enqueue_rematch, match_report
+from .moderation import BULK_ACTIONS, bulk_moderate
+from .stats import BUCKETS, dashboard_stats
+from .uploads import enqueue_photo_upload
+from .retention import retained_since
+from .pagination import (
+    ActivityLogCursorPagination,
+    NotificationCursorPagination,
+    ReportCursorPagination,
+    ResolutionLogCursorPagination,
+    SearchResultsPagination,
+)
+
+logger = logging.getLogger(__name__)
+
+BULK_MODERATION_LIMIT = 500
+
+
+class ReportViewSet(SparseFieldsetMixin, viewsets.ModelViewSet):
+    queryset = Report.objects.select_related("reported_by", "item").order_by("-date_time")
     serializer_class = ReportSerializer
     permission_classes = [permissions.IsAuthenticatedOrReadOnly, IsAdminOrOwnerOrReadOnly]
 
     filter_backends = [DjangoFilterBackend]
     filterset_fields = ["type", "status"]
 
+    def list(self, request, *args, **kwargs):
+        return cached_response(request, lambda: super(ReportViewSet, self).list(request, *args, **kwargs))
+
+    def retrieve(self, request, *args, **kwargs):
+        return cached_response(request, lambda: super(ReportViewSet, self).retrieve(request, *args, **kwargs))
+
+    @property
+    def paginator(self):
+        # Feed pages use the (date_time, id) keyset; ranked search results can't
+        if not hasattr(self, "_paginator"):
+            if self.request.query_params.get("search"):
+                self._paginator = SearchResultsPagination()
+            else:
+                self._paginator = ReportCursorPagination()
+        return self._paginator
+
+    def get_serializer_class(self):
+        # Feeds get compact cards (?fields=/?expand= adjust them); details stay full
+        if self.action == "list":
+            return ReportListSerializer
+        return ReportSerializer
+
     def get_queryset(self):
-        queryset = Report.objects.all().order_by("-date_time")
+        # Owner and item are joined in so ReportSerializer
+        # never has to go back to the database per row.
+        queryset = self.queryset
+        if self.action == "list":
+            queryset = ReportListSerializer.prepare_queryset(queryset, *self.get_fieldset())
 
         report_type = self.request.query_params.get("type")
         category = self.request.query_params.get("category")
@@ -42,64 +96,43 @@ class ReportViewSet(viewsets.ModelViewSet):
             queryset = queryset.filter(type=report_type)
 
         if category:
-            if report_type == "lost":
-                queryset = queryset.filter(lost_item__category=category)
-            elif report_type == "found":
-                queryset = queryset.filter(found_item__category=category)
-            else:
-                # if type not specified, filter either nested relation matching category
-                queryset = queryset.filter(
-                    Q(lost_item__category=category) | Q(found_item__category=category)
-                )
+            queryset = queryset.filter(item__category=category)
 
         if search:
-            queryset = queryset.filter(
-                Q(lost_item__item_name__icontains=search) |
-                Q(found_item__item_name__icontains=search) |
-                Q(lost_item__description__icontains=search) |
-                Q(found_item__description__icontains=search)
-            ).distinct()
+            queryset = queryset.search(search)
 
         return queryset
 
     def perform_create(self, serializer):
         """
-        Handles uploading optional photo, creating the Report,
-        and the related LostItem/FoundItem based on report.type.
+        Creates the Report and its Item; the type-specific location and date
+        come from location_last_seen/date_lost or location_found/date_found.
+        An optional photo is uploaded in the background; the item starts as
+        photo_status="pending" until photo_url is filled in.
         """
         file = self.request.data.get("photo")
-        photo_url = None
-
-        if file:
-            upload_result = cloudinary.uploader.upload(
-                file,
-                folder="lost_and_found/uploads",
-                resource_type="auto"
-            )
-            photo_url = upload_result.get("secure_url")
 
         report = serializer.save(reported_by=self.request.user)
 
-        common_fields = {
-            "report": report,
-            "item_name": self.request.data.get("item_name"),
-            "description": self.request.data.get("description"),
-            "category": self.request.data.get("category"),
-            "photo_url": photo_url,
-        }
-
         if report.type == "lost":
-            LostItem.objects.create(
-                **common_fields,
-                location_last_seen=self.request.data.get("location_last_seen"),
-                date_lost=self.request.data.get("date_lost"),
-            )
+            location_field, date_field = "location_last_seen", "date_lost"
         else:
-            FoundItem.objects.create(
-                **common_fields,
-                location_found=self.request.data.get("location_found"),
-                date_found=self.request.data.get("date_found"),
-            )
+            location_field, date_field = "location_found", "date_found"
+
+        item = Item.objects.create(
+            report=report,
+            item_name=self.request.data.get("item_name"),
+            description=self.request.data.get("description"),
+            category=self.request.data.get("category"),
+            location=self.request.data.get(location_field),
+            date=self.request.data.get(date_field),
+            photo_status="pending" if file else "none",
+        )
+
+        if file:
+            enqueue_photo_upload(item, file)
+
+        transaction.on_commit(lambda: match_report(report))
 
     @action(detail=True, methods=["patch"], permission_classes=[permissions.IsAdminUser])
     def approve(self, request, pk=None):
@@ -107,25 +140,15 @@ class ReportViewSet(viewsets.ModelViewSet):
         report.status = "approved"
         report.save(update_fields=["status"])
 
-        # Build activity log message
-        admin_name = f"{request.user.first_name} {request.user.last_name}".strip() or request.user.username
-        owner = report.reported_by
-        owner_name = f"{owner.first_name} {owner.last_name}".strip() or owner.username
-
-        # Get item name safely
-        item_name = None
-        if report.type == "lost" and hasattr(report, "lost_item"):
-            item_name = report.lost_item.item_name
-        elif report.type == "found" and hasattr(report, "found_item"):
-            item_name = report.found_item.item_name
-
-        action_text = f"{admin_name} (admin) approved {report.type} report for {owner_name}'s item \"{item_name or '—'}\""
+        # Now visible: notify owners of strong matches it completes
+        enqueue_rematch([report.pk])
 
-        ActivityLog.objects.create(
-            user=request.user,
-            role=getattr(request.user, "user_type", None),
+        log_activity(
+            request.user,
+            "report_approved",
             report=report,
-            action=action_text
+            target_user_id=report.reported_by_id,
+            item_name=report_item_name(report),
         )
 
         return Response({"status": "approved"}, status=status.HTTP_200_OK)
@@ -135,28 +158,82 @@ class ReportViewSet(viewsets.ModelViewSet):
         report = self.get_object()
         report.status = "rejected"
         report.save(update_fields=["status"])
+        enqueue_rematch([report.pk])
 
-        admin_name = f"{request.user.first_name} {request.user.last_name}".strip() or request.user.username
-        owner = report.reported_by
-        owner_name = f"{owner.first_name} {owner.last_name}".strip() or owner.username
-
-        item_name = None
-        if report.type == "lost" and hasattr(report, "lost_item"):
-            item_name = report.lost_item.item_name
-        elif report.type == "found" and hasattr(report, "found_item"):
-            item_name = report.found_item.item_name
-
-        action_text = f"{admin_name} (admin) rejected {report.type} report for {owner_name}'s item \"{item_name or '—'}\""
-
-        ActivityLog.objects.create(
-            user=request.user,
-            role=getattr(request.user, "user_type", None),
+        log_activity(
+            request.user,
+            "report_rejected",
             report=report,
-            action=action_text
+            target_user_id=report.reported_by_id,
+            item_name=report_item_name(report),
         )
 
         return Response({"status": "rejected"}, status=status.HTTP_200_OK)
 
+    @action(detail=False, methods=["post"], url_path="bulk-moderate", permission_classes=[permissions.IsAdminUser])
+    def bulk_moderate(self, request):
+        """
+        {"action": "approve" | "reject" | "delete", "ids": [...]} or, instead of
+        ids, "filter": {"type", "status", "category"} selecting up to
+        BULK_MODERATION_LIMIT reports, oldest first.
+        """
+        action_name = request.data.get("action")
+        if action_name not in BULK_ACTIONS:
+            return Response(
+                {"error": f"action must be one of: {', '.join(BULK_ACTIONS)}."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        ids = request.data.get("ids")
+        filters = request.data.get("filter")
+        if ids is not None:
+            if not isinstance(ids, list) or not all(isinstance(i, int) and not isinstance(i, bool) for i in ids):
+                return Response({"error": "ids must be a list of report ids."}, status=status.HTTP_400_BAD_REQUEST)
+            if len(ids) > BULK_MODERATION_LIMIT:
+                return Response(
+                    {"error": f"At most {BULK_MODERATION_LIMIT} reports per request."},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+        elif isinstance(filters, dict) and filters:
+            unknown = set(filters) - {"type", "status", "category"}
+            if unknown:
+                return Response(
+                    {"error": f"Unsupported filter: {', '.join(sorted(unknown))}."},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+            queryset = Report.objects.filter(
+                **{"item__category" if k == "category" else k: v for k, v in filters.items()}
+            )
+            ids = list(queryset.order_by("date_time", "id").values_list("id", flat=True)[:BULK_MODERATION_LIMIT])
+        else:
+            return Response({"error": "Provide ids or a filter."}, status=status.HTTP_400_BAD_REQUEST)
+
+        results = bulk_moderate(request.user, action_name, ids)
+        return Response({
+            "results": results,
+            "changed": sum(r["result"] not in ("unchanged", "not_found") for r in results),
+        })
+
+    @action(detail=True, methods=["get"])
+    def matches(self, request, pk=None):
+        """Approved opposite-type reports that likely match this one, best first."""
+        report = self.get_object()
+        if report.type == "lost":
+            candidates = MatchCandidate.objects.filter(lost_report=report, found_report__status="approved")
+            counterpart = "found_report"
+        else:
+            candidates = MatchCandidate.objects.filter(found_report=report, lost_report__status="approved")
+            counterpart = "lost_report"
+
+        candidates = candidates.select_related(
+            f"{counterpart}__reported_by", f"{counterpart}__item"
+        ).order_by("-score")[:10]
+
+        return Response([
+            {"score": match.score, "report": ReportSerializer(getattr(match, counterpart)).data}
+            for match in candidates
+        ])
+
     @action(detail=True, methods=["post"], permission_classes=[permissions.IsAuthenticated])
     def claim_item(self, request, pk=None):
         report = self.get_object()
@@ -179,20 +256,12 @@ class ReportViewSet(viewsets.ModelViewSet):
             related_report=report
         )
 
-        # Activity log: "<claimer> wants to claim <owner>'s item "<item_name>" on report #id"
-        claimer_name = f"{request.user.first_name} {request.user.last_name}".strip() or request.user.username
-        owner = report.reported_by
-        owner_name = f"{owner.first_name} {owner.last_name}".strip() or owner.username
-
-        item_name = None
-        if hasattr(report, "found_item"):
-            item_name = report.found_item.item_name
-
-        ActivityLog.objects.create(
-            user=request.user,
-            role=getattr(request.user, "user_type", None),
+        log_activity(
+            request.user,
+            "claim_requested",
             report=report,
-            action=f"{claimer_name} wants to claim {owner_name}'s item \"{item_name or '—'}\" (report #{report.id})"
+            target_user_id=report.reported_by_id,
+            item_name=report_item_name(report),
         )
 
         return Response(
@@ -216,26 +285,25 @@ class ReportViewSet(viewsets.ModelViewSet):
             related_report=report
         )
 
-        # Activity log: "<finder> has found <owner>'s item "<item_name>" on report #id"
-        finder_name = f"{request.user.first_name} {request.user.last_name}".strip() or request.user.username
-        owner = report.reported_by
-        owner_name = f"{owner.first_name} {owner.last_name}".strip() or owner.username
-
-        item_name = None
-        if hasattr(report, "lost_item"):
-            item_name = report.lost_item.item_name
-
-        ActivityLog.objects.create(
-            user=request.user,
-            role=getattr(request.user, "user_type", None),
+        log_activity(
+            request.user,
+            "item_found",
             report=report,
-            action=f"{finder_name} has found {owner_name}'s item \"{item_name or '—'}\" (report #{report.id})"
+            target_user_id=report.reported_by_id,
+            item_name=report_item_name(report),
         )
 
         return Response({"status": "item found notification sent"}, status=status.HTTP_200_OK)
     
 
 
+# SQLSTATEs raised by resolve_report_and_log, mapped to API errors
+RESOLVE_ERRORS = {
+    "P0002": ("Report not found.", http_status.HTTP_404_NOT_FOUND),  # no_data_found
+    "23503": ("Claimant does not exist.", http_status.HTTP_400_BAD_REQUEST),  # foreign_key_violation
+}
+
+
 @api_view(["POST"])
 @permission_classes([IsAuthenticated])
 def resolve_report_view(request, report_id):
@@ -247,53 +315,82 @@ def resolve_report_view(request, report_id):
             {"error": "Claimant ID is required."}, 
             status=http_status.HTTP_400_BAD_REQUEST
         )
-    
-    conn = None
-    cursor = None
-    
+
     try:
+        claimant_id = uuid.UUID(str(claimant_id))
+    except ValueError:
+        return Response(
+            {"error": "Claimant ID must be a valid UUID."},
+            status=http_status.HTTP_400_BAD_REQUEST
+        )
 
-        db_config = settings.DATABASES['default']
-        
+    try:
+        # Runs on Django's (persistent/pooled) connection; the procedure's
+        # status update and log insert commit or roll back together.
+        with transaction.atomic(), connection.cursor() as cursor:
+            cursor.execute(
+                "CALL resolve_report_and_log(%s, %s, %s);",
+                [report_id, owner_id, claimant_id]
+            )
+            invalidate_report_cache()
 
-        conn = psycopg2.connect(
-            dbname=db_config['NAME'],
-            user=db_config['USER'],
-            password=db_config['PASSWORD'],
-            host=db_config['HOST'],
-            port=db_config['PORT']
+    except OperationalError:
+        logger.exception("Database unavailable while resolving report %s", report_id)
+        return Response(
+            {"error": "Database temporarily unavailable, please retry."},
+            status=http_status.HTTP_503_SERVICE_UNAVAILABLE
         )
-        
-
-        conn.set_isolation_level(ISOLATION_LEVEL_AUTOCOMMIT)
-        
-        cursor = conn.cursor()
-        cursor.execute(
-            "CALL resolve_report_and_log(%s, %s, %s);",
-            [report_id, str(owner_id), str(claimant_id)]
+
+    except DatabaseError as e:
+        # psycopg3 exposes the SQLSTATE as `sqlstate`, psycopg2 as `pgcode`
+        pgcode = getattr(e.__cause__, "sqlstate", None) or getattr(e.__cause__, "pgcode", None)
+        if pgcode in RESOLVE_ERRORS:
+            message, code = RESOLVE_ERRORS[pgcode]
+            return Response({"error": message}, status=code)
+
+        logger.exception("Error resolving report %s", report_id)
+        return Response(
+            {"error": "Could not resolve report."},
+            status=http_status.HTTP_500_INTERNAL_SERVER_ERROR
         )
-        
+
+    return Response(
+        {"message": "Report successfully resolved and logged."},
+        status=http_status.HTTP_200_OK
+    )
+
+
+@api_view(["GET"])
+@permission_classes([permissions.IsAdminUser])
+def report_stats_view(request):
+    """Dashboard statistics: ?bucket=day|week|month|year, optional ?since=&until= (YYYY-MM-DD)."""
+    bucket = request.query_params.get("bucket") or settings.REPORT_STATS_BUCKET
+    if bucket not in BUCKETS:
         return Response(
-            {"message": "Report successfully resolved and logged."},
-            status=http_status.HTTP_200_OK
+            {"error": f"bucket must be one of: {', '.join(BUCKETS)}."},
+            status=http_status.HTTP_400_BAD_REQUEST
         )
-        
-    except Exception as e:
-        import logging
-        logger = logging.getLogger(__name__)
-        logger.error(f"Error resolving report {report_id}: {str(e)}")
-        
+
+    dates = {}
+    for name in ("since", "until"):
+        value = request.query_params.get(name)
+        try:
+            dates[name] = parse_date(value) if value else None
+        except ValueError:
+            dates[name] = None
+        if value and dates[name] is None:
+            return Response(
+                {"error": f"{name} must be a date (YYYY-MM-DD)."},
+                status=http_status.HTTP_400_BAD_REQUEST
+            )
+
+    if dates["since"] and dates["until"] and dates["since"] > dates["until"]:
         return Response(
-            {"error": str(e)}, 
-            status=http_status.HTTP_500_INTERNAL_SERVER_ERROR
+            {"error": "since must not be after until."},
+            status=http_status.HTTP_400_BAD_REQUEST
         )
-        
-    finally:
 
-        if cursor:
-            cursor.close()
-        if conn:
-            conn.close()
+    return Response(dashboard_stats(bucket, **dates))
 
 
 class CommentViewSet(viewsets.ModelViewSet):
@@ -333,16 +430,34 @@ class ClaimViewSet(viewsets.ModelViewSet):
 
 
 
-class NotificationViewSet(viewsets.ModelViewSet):
+class NotificationViewSet(SparseFieldsetMixin, viewsets.ModelViewSet):
     queryset = Notification.objects.all().order_by("-created_at")
     serializer_class = NotificationSerializer
     permission_classes = [permissions.IsAuthenticated]
+    pagination_class = NotificationCursorPagination
+    # Not the global OrderingFilter: ?ordering= would replace the cursor's
+    # indexed (-created_at, -id) keyset with any column
+    filter_backends = []
 
     def get_queryset(self):
-        return Notification.objects.filter(user=self.request.user).order_by("-created_at")
+        fields, expand = self.get_fieldset()
+        queryset = Notification.objects.filter(user=self.request.user).order_by("-created_at")
+        if self.action == "list":
+            # Older partitions are being archived; the bound lets the planner skip them
+            queryset = queryset.filter(created_at__gte=retained_since("reports_notification"))
+
+        if "related_report" in expand:
+            related = ["related_report__reported_by", "related_report__item"]
+        else:
+            related = ["related_report"]
+        queryset = queryset.select_related("user", "triggered_by", *related)
+
+        if not fields or "claimed_by" in fields:
+            queryset = queryset.with_latest_claimant()
+        return queryset
 
     def partial_update(self, request, *args, **kwargs):
-        notification = self.get_object
+        notification = self.get_object()
         is_read = request.data.get("is_read")
 
         if is_read is not None:
@@ -360,16 +475,151 @@ class NotificationViewSet(viewsets.ModelViewSet):
 
     @action(detail=False, methods=["get"], url_path="unread-count")
     def unread_count(self, request):
-        with connection.cursor() as cursor:
-            cursor.execute("SELECT get_unread_notification_count(%s);", [request.user.id])
-            unread_count = cursor.fetchone()[0]
+        # Single primary-key lookup on the trigger-maintained counter row
+        return Response({"unread_count": unread_count_for(request.user.pk)})
+
+    @action(detail=False, methods=["post"], url_path="stream-ticket")
+    def stream_ticket(self, request):
+        # EventSource can't send headers, so the stream takes this in its URL
+        # instead of the API token
+        return Response({"ticket": signing.dumps(str(request.user.pk), salt=STREAM_TICKET_SALT)})
+
+    def _bulk_selection(self, request):
+        """
+        Lookups selecting the user's notifications, narrowed by optional `ids`
+        and `before` (ISO timestamp, inclusive). Returns (filters, error_response).
+        """
+        filters = {"user_id": request.user.pk}
+
+        ids = request.data.get("ids")
+        if ids is not None:
+            if not isinstance(ids, list) or not all(isinstance(i, int) and not isinstance(i, bool) for i in ids):
+                return None, Response({"error": "ids must be a list of notification ids."}, status=status.HTTP_400_BAD_REQUEST)
+            filters["id__in"] = ids
+
+        before = request.data.get("before")
+        if before is not None:
+            before = parse_datetime(str(before))
+            if before is None:
+                return None, Response({"error": "before must be an ISO 8601 timestamp."}, status=status.HTTP_400_BAD_REQUEST)
+            if timezone.is_naive(before):
+                before = timezone.make_aware(before)
+            filters["created_at__lte"] = before
+
+        return filters, None
+
+    @action(detail=False, methods=["post"], url_path="mark-read")
+    def mark_read(self, request):
+        """Mark all (or `ids` / up to `before`) of the user's notifications read in one UPDATE."""
+        filters, error = self._bulk_selection(request)
+        if error:
+            return error
+
+        # The statement-level trigger adjusts the unread counter
+        updated = Notification.objects.filter(**filters, is_read=False).update(is_read=True)
+        transaction.on_commit(lambda: publish_unread_count(request.user.pk))
+        return Response({"updated": updated, "unread_count": unread_count_for(request.user.pk)})
+
+    @action(detail=False, methods=["post"])
+    def clear(self, request):
+        """Delete all (or `ids` / up to `before`) of the user's notifications in one DELETE."""
+        filters, error = self._bulk_selection(request)
+        if error:
+            return error
+
+        # QuerySet.delete() would fetch every row to send post_delete; nothing
+        # cascades from notifications and no signal handler listens for them,
+        # so issue the single DELETE directly (_raw_delete, which delete()
+        # itself uses for fast deletes) and publish the new count once.
+        queryset = Notification.objects.filter(**filters)
+        deleted = queryset._raw_delete(queryset.db)
+        transaction.on_commit(lambda: publish_unread_count(request.user.pk))
+        return Response({"deleted": deleted, "unread_count": unread_count_for(request.user.pk)})
+
+
+STREAM_KEEPALIVE_SECONDS = 15
+
+# Stream tickets are only good for opening a stream, and only briefly; the
+# URL they travel in ends up in access logs and browser history
+STREAM_TICKET_SALT = "reports.notification-stream"
+STREAM_TICKET_MAX_AGE = 60
+
+
+def _sse(event, data):
+    return f"event: {event}\ndata: {json.dumps(data, cls=DjangoJSONEncoder)}\n\n"
+
+
+def _stream_user(request):
+    """Session user, or the owner of a valid `?ticket=` from the stream-ticket action."""
+    if request.user.is_authenticated:
+        return request.user
+
+    ticket = request.GET.get("ticket")
+    if not ticket:
+        return None
+    try:
+        user_id = signing.loads(ticket, salt=STREAM_TICKET_SALT, max_age=STREAM_TICKET_MAX_AGE)
+    except signing.BadSignature:
+        return None
+    return get_user_model().objects.filter(pk=user_id, is_active=True).first()
+
+
+def _open_stream(request):
+    """
+    (user, unread count) for a stream request. The stream holds no database
+    connection while it waits: Django would only release it when the
+    response ends, so each open EventSource would pin one for its lifetime.
+    """
+    try:
+        user = _stream_user(request)
+        return user, unread_count_for(user.pk) if user is not None else 0
+    finally:
+        connection.close()
+
+
+async def notification_stream(request):
+    """
+    Server-sent events for the current user: `notification` for each new
+    notification and `unread_count` whenever the count changes. Needs the
+    ASGI app; the first event is the current unread count.
+    """
+    user, unread_count = await sync_to_async(_open_stream)(request)
+    if user is None:
+        return JsonResponse(
+            {"detail": "Authentication credentials were not provided."},
+            status=http_status.HTTP_401_UNAUTHORIZED,
+        )
+
+    broker = get_broker()
+    queue = broker.subscribe(user.pk)
+
+    async def events():
+        try:
+            yield _sse("unread_count", {"unread_count": unread_count})
+            while True:
+                try:
+                    event = await asyncio.wait_for(queue.get(), timeout=STREAM_KEEPALIVE_SECONDS)
+                except asyncio.TimeoutError:
+                    yield ": keep-alive\n\n"
+                    continue
+                yield _sse(event["type"], event["data"])
+        finally:
+            broker.unsubscribe(user.pk, queue)
+
+    response = StreamingHttpResponse(events(), content_type="text/event-stream")
+    response["Cache-Control"] = "no-cache"
+    response["X-Accel-Buffering"] = "no"
+    return response
+
 
-        return Response({"unread_count": unread_count})
-    
 class ReportResolutionLogViewSet(viewsets.ReadOnlyModelViewSet):
-    queryset = ReportResolutionLog.objects.select_related("report", "resolved_by", "claimed_by").order_by("-date_resolved")
+    queryset = ReportResolutionLog.objects.select_related(
+        "report__reported_by", "report__item", "resolved_by", "claimed_by"
+    ).order_by("-date_resolved")
     serializer_class = ReportResolutionLogSerializer
     permission_classes = [permissions.IsAuthenticated]
+    pagination_class = ResolutionLogCursorPagination
+    filter_backends = []
 
     def get_queryset(self):
         user = self.request.user
@@ -378,17 +628,23 @@ class ReportResolutionLogViewSet(viewsets.ReadOnlyModelViewSet):
         return self.queryset.filter(report__reported_by=user)
 
 
-class ActivityLogViewSet(viewsets.ReadOnlyModelViewSet):
-    queryset = ActivityLog.objects.select_related("user", "report").order_by("-created_at")
+class ActivityLogViewSet(SparseFieldsetMixin, viewsets.ReadOnlyModelViewSet):
+    queryset = ActivityLog.objects.select_related("user", "target_user", "report").order_by("-created_at")
     serializer_class = ActivityLogSerializer
     permission_classes = [permissions.IsAuthenticated]
+    pagination_class = ActivityLogCursorPagination
+    filter_backends = [DjangoFilterBackend]
+    filterset_class = ActivityLogFilter
 
     def get_queryset(self):
         user = self.request.user
+        # Older partitions are being archived; the bound lets the planner skip them
+        queryset = self.queryset.filter(created_at__gte=retained_since("activity_logs"))
 
         if user.is_staff or getattr(user, "user_type", "") == "admin":
-            return self.queryset
+            return queryset
 
-        return self.queryset.filter(
-            Q(report__reported_by=user) | Q(user=user)
+        # Both arms are served by (user|report_owner, -created_at, -id) indexes
+        return queryset.filter(
+            Q(report_owner=user) | Q(user=user)
         )
@@ -72,7 +72,7 @@ export default function FoundItemCard({ report }: { report: FoundReport }) {
         <CardContent className="space-y-3">
           {found_item.photo_url ? (
             <img
-              src={found_item.photo_url}
+              src={found_item.thumbnail_url ?? found_item.photo_url}
               alt={found_item.item_name}
               className="w-full rounded-lg object-cover h-64 cursor-pointer transition hover:opacity-90"
               onClick={() => setImageOpen(true)}
@@ -72,7 +72,7 @@ export default function LostItemCard({ report }: { report: LostReport }) {
         <CardContent className="space-y-3">
           {lost_item.photo_url ? (
             <img
-              src={lost_item.photo_url}
+              src={lost_item.thumbnail_url ?? lost_item.photo_url}
               alt={lost_item.item_name}
               className="w-full rounded-lg object-cover h-64 cursor-pointer transition hover:opacity-90"
               onClick={() => setImageOpen(true)}
@@ -67,7 +67,7 @@ export default function ManagePostCard({
       <div className="relative w-full aspect-video sm:aspect-4/3">
         {item?.photo_url ? (
           <img
-            src={item.photo_url}
+            src={item.thumbnail_url ?? item.photo_url}
             alt={item.item_name}
             className="absolute inset-0 w-full h-full object-cover"
           />
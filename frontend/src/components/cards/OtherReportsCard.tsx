@@ -25,7 +25,7 @@ export function OtherReportsCard({ report }: OtherReportsCardProps) {
       <div className="relative w-full aspect-video bg-muted flex items-center justify-center text-muted-foreground text-sm">
         {item?.photo_url ? (
           <img
-            src={item.photo_url}
+            src={item.thumbnail_url ?? item.photo_url}
             alt={item.item_name}
             className="absolute inset-0 w-full h-full object-cover"
           />
@@ -57,9 +57,6 @@ export function OtherReportsCard({ report }: OtherReportsCardProps) {
             <p className="font-medium">
               {`${report.reported_by.first_name} ${report.reported_by.last_name}`}
             </p>
-            <p className="text-xs text-muted-foreground truncate max-w-[150px]">
-              {report.reported_by.email}
-            </p>
           </div>
         </div>
       </CardHeader>
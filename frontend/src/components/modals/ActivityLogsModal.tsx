@@ -91,10 +91,7 @@ export function ActivityLogsModal({ open, onClose }: ActivityLogsModalProps) {
             <ul className="space-y-4">
               {logs.map((log) => {
                 const report = log.report;
-                const reportTitle =
-                  report?.lost_item?.item_name ||
-                  report?.found_item?.item_name ||
-                  "N/A";
+                const reportTitle = log.item_name || "N/A";
 
                 return (
                   <Card
@@ -71,15 +71,20 @@ export function NotificationModal({ open, onClose }: NotificationModalProps) {
     }
   };
 
+  const markAllAsRead = async () => {
+    try {
+      await api.post(`/reports/notifications/mark-read/`);
+      setNotifications((prev) => prev.map((n) => ({ ...n, is_read: true })));
+    } catch {
+      toast.error("Failed to mark notifications as read");
+    }
+  };
+
   const clearAllNotifications = async () => {
     if (notifications.length === 0) return;
     setClearing(true);
     try {
-      await Promise.all(
-        notifications.map((notif) =>
-          api.delete(`/reports/notifications/${notif.id}/`)
-        )
-      );
+      await api.post(`/reports/notifications/clear/`);
       setNotifications([]);
       toast.success("All notifications cleared");
     } catch {
@@ -120,20 +125,33 @@ export function NotificationModal({ open, onClose }: NotificationModalProps) {
             </DialogTitle>
 
             {notifications.length > 0 && (
-              <Button
-                variant="destructive"
-                size="sm"
-                disabled={clearing}
-                onClick={clearAllNotifications}
-                className="self-end sm:self-auto w-full sm:w-auto"
-              >
-                {clearing ? (
-                  <Loader2 className="h-4 w-4 animate-spin mr-2" />
-                ) : (
-                  <Trash2 className="h-4 w-4 mr-1" />
+              <div className="flex gap-2 self-end sm:self-auto w-full sm:w-auto">
+                {notifications.some((n) => !n.is_read) && (
+                  <Button
+                    variant="outline"
+                    size="sm"
+                    onClick={markAllAsRead}
+                    className="flex-1 sm:flex-none"
+                  >
+                    <CheckCircle2 className="h-4 w-4 mr-1" />
+                    Mark All Read
+                  </Button>
                 )}
-                Clear All
-              </Button>
+                <Button
+                  variant="destructive"
+                  size="sm"
+                  disabled={clearing}
+                  onClick={clearAllNotifications}
+                  className="flex-1 sm:flex-none"
+                >
+                  {clearing ? (
+                    <Loader2 className="h-4 w-4 animate-spin mr-2" />
+                  ) : (
+                    <Trash2 className="h-4 w-4 mr-1" />
+                  )}
+                  Clear All
+                </Button>
+              </div>
             )}
           </div>
         </DialogHeader>
@@ -9,6 +9,7 @@ import { Bell, ClipboardClock, ClipboardList, FileUser, } from "lucide-react";
 import { NotificationModal } from "@/components/modals/NotificationModal";
 import { LogsModal } from "@/components/modals/LogsModal";
 import { api } from "@/api/axiosInstance";
+import { API_BASE_URL } from "@/api/apiConfig";
 import { toast } from "sonner";
 import { useAuth } from "@/hooks/useAuth";
 import { ActivityLogsModal } from "../modals/ActivityLogsModal";
@@ -40,6 +41,40 @@ export default function HomePage() {
     };
 
     fetchUnreadCount();
+
+    // Live updates pushed by the server instead of re-polling. EventSource
+    // can't send the auth header, so the stream URL carries a short-lived
+    // ticket rather than the API token.
+    let stream: EventSource | undefined;
+    let cancelled = false;
+    let reconnect: ReturnType<typeof setTimeout> | undefined;
+    const openStream = async () => {
+      try {
+        const res = await api.post(`/reports/notifications/stream-ticket/`);
+        if (cancelled) return;
+        stream = new EventSource(
+          `${API_BASE_URL}/reports/notifications/stream/?ticket=${encodeURIComponent(res.data.ticket)}`
+        );
+        stream.addEventListener("unread_count", (event) => {
+          setUnreadCount(JSON.parse((event as MessageEvent).data).unread_count || 0);
+        });
+        stream.addEventListener("notification", () => setIsNotifOpened(false));
+        // A reconnect would reuse the ticket after it has expired
+        stream.onerror = () => {
+          stream?.close();
+          if (!cancelled) reconnect = setTimeout(openStream, 5000);
+        };
+      } catch {
+        // No live updates; the count fetched above still shows
+      }
+    };
+
+    openStream();
+    return () => {
+      cancelled = true;
+      clearTimeout(reconnect);
+      stream?.close();
+    };
   }, []);
 
   return (
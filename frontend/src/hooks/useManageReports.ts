@@ -43,6 +43,8 @@ export function useManageReports({
               category,
               ordering,
               status,
+              // Moderators need the owner's email and the full description
+              expand: "reported_by,description",
             },
           }
         );
@@ -17,35 +17,47 @@ export type LoginResponse = {
 };
 
 
+// Feed lists omit the email unless requested with ?expand=reported_by
+export type ReportOwner = Pick<
+  User,
+  "id" | "username" | "first_name" | "last_name" | "profile_avatar_url"
+> &
+  Partial<Pick<User, "email">>;
+
 export interface BaseReport {
   id: number;
-  reported_by: User;
+  reported_by: ReportOwner;
   type: "lost" | "found";
   date_time: string;
   status: "pending" | "approved" | "rejected" | "resolved";
 }
 
 
+// Feed lists omit `report` and shorten `description` (?expand=description for all of it)
 export interface LostItem {
   id: number;
-  report: number; //report id
+  report?: number; //report id
   item_name: string;
   description: string;
   category: string;
   location_last_seen: string;
   photo_url?: string | null;
+  thumbnail_url?: string | null;
+  photo_status?: "none" | "pending" | "uploaded" | "failed";
   date_lost?: string | null;
 }
 
 
 export interface FoundItem {
   id: number;
-  report: number;
+  report?: number;
   item_name: string;
   description: string;
   category: string;
   location_found: string;
   photo_url?: string | null;
+  thumbnail_url?: string | null;
+  photo_status?: "none" | "pending" | "uploaded" | "failed";
   supervised_by?: User | null;
   date_found?: string | null;
 }
@@ -92,13 +104,14 @@ export interface Notification {
   triggered_by?: User | null; 
   message: string;
   detailed_message?: string | null;
-  related_report?: Report | null;
+  related_report?: ReportSummary | null;
   is_read: boolean;
   created_at: string;
 }
 
 export type PaginatedResponse<T> = {
-  count: number;
+  // Omitted by cursor-paginated feeds (reports, notifications, logs)
+  count?: number;
   next: string | null;
   previous: string | null;
   results: T[];
@@ -119,11 +132,22 @@ export interface ActivityLog {
   id: number;
   user: UserMini;
   role?: string | null;
-  report?: Report | null;
+  report?: ActivityLogReport | null;
+  event_type?: string;
+  item_name?: string;
   action: string;
   created_at: string;
 }
 
+export interface ReportSummary {
+  id: number;
+  type: "lost" | "found";
+  status: string;
+  date_time: string;
+}
+
+export type ActivityLogReport = ReportSummary;
+
 export interface UserMini {
   id: string;
   first_name: string;